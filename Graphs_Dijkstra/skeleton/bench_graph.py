@@ -0,0 +1,40 @@
+"""Build and lookup timings of Graph on random graphs (every vertex adds `degree` edges to random vertices).
+
+Usage: python bench_graph.py [number_of_vertices ...] (default: 1000 10000 100000)
+"""
+import random
+import sys
+import time
+
+from graph import Graph
+
+
+def run(n, degree=3, queries=10000):
+    rng = random.Random(42)
+    names = ["v%d" % i for i in range(n)]
+    pairs = [(names[i], names[rng.randrange(n)]) for i in range(n) for _ in range(degree)]
+    start = time.perf_counter()
+    graph = Graph()
+    for name in names:
+        graph.add_vertex(name)
+    vertex_seconds = time.perf_counter() - start
+    for first, second in pairs:
+        graph.add_edge(first, second, rng.randrange(1, 100))
+    build_seconds = time.perf_counter() - start
+    sample = [rng.choice(names) for _ in range(queries)]
+    edge_sample = [rng.choice(pairs) for _ in range(queries)]
+    timings = []
+    for lookup, arguments in ((graph.find_vertex, [(name,) for name in sample]),
+                              (graph.find_edge, edge_sample),
+                              (graph.neighbors, [(name,) for name in sample])):
+        start = time.perf_counter()
+        for argument in arguments:
+            lookup(*argument)
+        timings.append((time.perf_counter() - start) / queries * 1e6)
+    print("V={:<8}E={:<8}add_vertex={:.2f}s  build={:.2f}s  find_vertex={:.2f}us  find_edge={:.2f}us  "
+          "neighbors={:.2f}us".format(n, len(graph.edges), vertex_seconds, build_seconds, *timings))
+
+
+if __name__ == '__main__':
+    for size in [int(argument) for argument in sys.argv[1:]] or [1000, 10000, 100000]:
+        run(size)
@@ -5,6 +5,10 @@ class Graph():
     def __init__(self):
         self.vertices = []  # list of vertices in the graph
         self.edges = []  # list of edges in the graph
+        # indexes kept up to date by add_vertex/add_edge (do not append to vertices/edges directly)
+        self.vertex_index = {}  # vertex name -> vertex
+        self.adjacency = {}  # vertex name -> list of (adjacent vertex, weight) in insertion order
+        self.edge_index = {}  # frozenset of the two vertex names -> edge
 
     def add_vertex(self, vertex_name):
         """
@@ -18,6 +22,8 @@ class Graph():
             return None
         new_vertex = Vertex(vertex_name)
         self.vertices.append(new_vertex)
+        self.vertex_index[vertex_name] = new_vertex
+        self.adjacency[vertex_name] = []
         return new_vertex
 
     def add_edge(self, v1_name, v2_name, weight: int):
@@ -38,6 +44,10 @@ class Graph():
 
         new_edge = Edge(v1, v2, weight)
         self.edges.append(new_edge)
+        self.edge_index[frozenset((v1_name, v2_name))] = new_edge
+        self.adjacency[v1_name].append((v2, weight))
+        if v1_name != v2_name:
+            self.adjacency[v2_name].append((v1, weight))
         return new_edge
 
     def find_vertex(self, vertex_name):
@@ -46,10 +56,7 @@ class Graph():
         :param vertex_name: the name of the vertex to find
         :return: the found vertex, or None if no matching vertex has been found.
         """
-        for vertex in self.vertices:
-            if vertex.name == vertex_name:
-                return vertex
-        return None
+        return self.vertex_index.get(vertex_name)
 
     def find_edge(self, v1_name, v2_name):
         """
@@ -58,12 +65,7 @@ class Graph():
         :param v2_name: name (string) of vertex 2
         :return: Returns the found edge or None if there is no edge.
         """
-        for edge in self.edges:
-            if (edge.first.name == v1_name and edge.second.name == v2_name) or \
-                    (edge.first.name == v2_name and edge.second.name == v1_name):
-                return edge
-
-        return None
+        return self.edge_index.get(frozenset((v1_name, v2_name)))
 
     def neighbors(self, vertex_name):
         """
@@ -71,11 +73,18 @@ class Graph():
         :param vertex_name: The name of the vertex to which adjacent vertices are searched.
         :return: list of vertices that are adjacent to the vertex with name vertex_name.
         """
-        vertex = self.find_vertex(vertex_name)
-        if vertex is None:
+        adjacent = self.weighted_neighbors(vertex_name)
+        if adjacent is None:
+            return None
+        return [vertex for vertex, _ in adjacent]
+
+    def weighted_neighbors(self, vertex_name):
+        """
+        Returns the adjacency list of the vertex with name vertex_name.
+        :param vertex_name: The name of the vertex to which adjacent vertices are searched.
+        :return: list of (adjacent vertex, edge weight) pairs, or None if no matching vertex is found.
+        """
+        adjacent = self.adjacency.get(vertex_name)
+        if adjacent is None:
             return None
-        neighbors = []
-        for edge in self.edges:
-            if edge.first == vertex or edge.second == vertex:
-                neighbors.append(edge.second if edge.first == vertex else edge.first)
-        return neighbors
+        return list(adjacent)
@@ -0,0 +1,44 @@
+import unittest
+
+from graph import Graph
+
+
+class TestGraphIndex(unittest.TestCase):
+    def test_lookups_use_indexes(self):
+        graph = Graph()
+        for name in ("A", "B", "C", "D"):
+            self.assertIsNotNone(graph.add_vertex(name))
+        self.assertIsNone(graph.add_vertex("A"))
+        self.assertIsNotNone(graph.add_edge("A", "B", 3))
+        self.assertIsNotNone(graph.add_edge("C", "A", 5))
+        self.assertIsNone(graph.add_edge("B", "A", 7), "the edge index must ignore the direction")
+        self.assertIsNone(graph.add_edge("A", "X", 1))
+        self.assertEqual(4, len(graph.vertices))
+        self.assertEqual(2, len(graph.edges))
+        self.assertIs(graph.vertices[2], graph.find_vertex("C"))
+        self.assertIsNone(graph.find_vertex("X"))
+        self.assertIs(graph.edges[1], graph.find_edge("A", "C"))
+        self.assertEqual(3, graph.find_edge("B", "A").weight)
+        self.assertIsNone(graph.find_edge("B", "C"))
+        self.assertEqual(["B", "C"], [vertex.name for vertex in graph.neighbors("A")])
+        self.assertEqual([("A", 5)], [(vertex.name, weight) for vertex, weight in graph.weighted_neighbors("C")])
+        self.assertEqual([], graph.neighbors("D"))
+        self.assertIsNone(graph.neighbors("X"))
+
+    def test_matches_edge_list(self):
+        graph = Graph()
+        for i in range(50):
+            graph.add_vertex(str(i))
+        for i in range(50):
+            for j in (i * 7 % 50, i * 11 % 50, (i + 1) % 50):
+                graph.add_edge(str(i), str(j), i + j)
+        for vertex in graph.vertices:
+            expected = [edge.second if edge.first is vertex else edge.first for edge in graph.edges
+                        if vertex in (edge.first, edge.second)]
+            self.assertEqual(expected, graph.neighbors(vertex.name))
+        for edge in graph.edges:
+            self.assertIs(edge, graph.find_edge(edge.second.name, edge.first.name))
+
+
+if __name__ == '__main__':
+    unittest.main()
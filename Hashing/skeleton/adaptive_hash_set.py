@@ -0,0 +1,115 @@
+from chaining_hash_set import ChainingHashSet
+from hash_functions import GenericHash
+from roaring_bitmap import RoaringBitmap
+
+NODE_BYTES = 100  # node object with its attribute values and the int key object (64-bit CPython, tracemalloc)
+SLOT_BYTES = 8  # one table reference per bucket
+
+
+def estimate_chaining_bytes(size, capacity):
+    """returns the approximate memory use of a ChainingHashSet with the given size and capacity."""
+    return size * NODE_BYTES + capacity * SLOT_BYTES
+
+
+class AdaptiveHashSet():
+    """Integer key set that stores its keys either in a ChainingHashSet or in a RoaringBitmap, whichever is
+    estimated to be smaller.
+
+    The decision is re-evaluated whenever the size has doubled or halved since the last check, so the migration
+    cost (O(n)) is amortized over the operations in between. Dense key sets (ranges, ids handed out in order)
+    end up in the bitmap, sparse ones stay in the hash table. A key that is not an int switches back to hashing
+    until the next clear(). The hash table therefore uses GenericHash() unless a hash_function is given, since
+    the default key % capacity only works for int keys.
+    """
+    CHAINING = "chaining"
+    BITMAP = "bitmap"
+    MIN_CHECK_SIZE = 1024
+
+    def __init__(self, capacity=8, max_load_factor=0.75, hash_function=None):
+        self.max_load_factor = max_load_factor
+        self.hash_function = GenericHash() if hash_function is None else hash_function
+        self.backend = ChainingHashSet(capacity, max_load_factor, self.hash_function)
+        self.mode = self.CHAINING
+        self.ints_only = True
+        self.checked_size = 0
+        self.switch_count = 0
+
+    def get_mode(self):
+        """returns CHAINING or BITMAP."""
+        return self.mode
+
+    def get_table_size(self):
+        return self.backend.get_table_size()
+
+    def insert(self, key):
+        if key is None:
+            raise ValueError()
+        if self.ints_only and not isinstance(key, int):
+            self.ints_only = False
+            if self.mode == self.BITMAP:
+                self.switch_to_chaining()
+        inserted = self.backend.insert(key)
+        if inserted:
+            self.adapt_if_needed()
+        return inserted
+
+    def contains(self, key):
+        if key is None:
+            raise ValueError()
+        if self.mode == self.BITMAP and not isinstance(key, int):
+            return False
+        return self.backend.contains(key)
+
+    def remove(self, key):
+        if key is None:
+            raise ValueError()
+        if self.mode == self.BITMAP and not isinstance(key, int):
+            return False
+        removed = self.backend.remove(key)
+        if removed:
+            self.adapt_if_needed()
+        return removed
+
+    def clear(self):
+        self.backend.clear()
+        self.ints_only = True
+        self.checked_size = 0
+
+    def iter_keys(self):
+        return self.backend.iter_keys()
+
+    def __iter__(self):
+        return self.iter_keys()
+
+    def get_size_in_bytes(self):
+        """returns the estimated memory use of the current backend."""
+        if self.mode == self.BITMAP:
+            return self.backend.get_size_in_bytes()
+        return estimate_chaining_bytes(self.backend.get_table_size(), self.backend.capacity)
+
+    def adapt_if_needed(self):
+        """Re-evaluates the backend once the size has doubled or halved since the last check."""
+        size = self.backend.get_table_size()
+        if size < self.MIN_CHECK_SIZE or self.checked_size // 2 < size < 2 * self.checked_size:
+            return
+        self.checked_size = size
+        if not self.ints_only:
+            return
+        if self.mode == self.CHAINING:
+            bitmap = RoaringBitmap.from_keys(self.backend.iter_keys())
+            if bitmap.get_size_in_bytes() < self.get_size_in_bytes():
+                self.backend = bitmap
+                self.mode = self.BITMAP
+                self.switch_count += 1
+        else:
+            self.backend.run_optimize()
+            capacity = int(size / self.max_load_factor) + 1 if self.max_load_factor else size
+            if estimate_chaining_bytes(size, capacity) < self.backend.get_size_in_bytes():
+                self.switch_to_chaining()
+
+    def switch_to_chaining(self):
+        hash_set = ChainingHashSet(8, self.max_load_factor, self.hash_function)
+        hash_set.bulk_insert(list(self.backend.iter_keys()), unique=True)
+        self.backend = hash_set
+        self.mode = self.CHAINING
+        self.switch_count += 1
@@ -0,0 +1,213 @@
+from chaining_hash_node import ChainingHashNode
+
+
+class AVLBucketNode():
+    def __init__(self, key):
+        self.key = key
+        self.hash = hash(key)
+        self.left = None
+        self.right = None
+        self.height = 0
+
+
+class AVLBucket():
+    """Balanced (AVL) search tree holding the keys of one hash bucket.
+
+    The tree is ordered by (hash(key), key): keys with different hashes are never compared with each other, so
+    keys of different types (e.g. ints and strings) can share a bucket, and keys with equal hashes (e.g. ints that
+    differ by a multiple of 2^61 - 1) are ordered by the keys themselves, so every operation stays O(log n).
+
+    Limit: keys with equal hashes that cannot be compared (a TypeError from <) cannot be ordered. Such a key is kept
+    in a separate unordered list, and a lookup that runs into such a comparison scans the whole bucket, so buckets
+    of mutually incomparable colliding keys degrade to O(n) like a chain.
+    """
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+        self.unordered = []  # keys that could not be placed in the tree
+
+    @staticmethod
+    def from_chain(node):
+        """Builds a tree from a ChainingHashNode chain."""
+        bucket = AVLBucket()
+        while node is not None:
+            bucket.insert(node.key)
+            node = node.next
+        return bucket
+
+    def to_chain(self):
+        """Returns the keys as a ChainingHashNode chain in the order of keys()."""
+        head = None
+        for key in reversed(self.keys()):
+            node = ChainingHashNode(key)
+            node.next = head
+            head = node
+        return head
+
+    def keys(self):
+        """Returns the stored keys in tree order (ascending order for small non-negative ints), followed by the
+        unordered keys."""
+        keys = []
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            keys.append(node.key)
+            node = node.right
+        return keys + self.unordered
+
+    @staticmethod
+    def goes_left(key, key_hash, node):
+        """returns True if the key is ordered before the key of node, raises a TypeError if that is undecidable."""
+        if key_hash != node.hash:
+            return key_hash < node.hash
+        return key < node.key
+
+    def find(self, key):
+        """returns the tree node holding the key, or None. Raises a TypeError if the key cannot be ordered."""
+        key_hash = hash(key)
+        node = self.root
+        while node is not None:
+            if key_hash == node.hash and key == node.key:
+                return node
+            node = node.left if self.goes_left(key, key_hash, node) else node.right
+        return None
+
+    def count_probes(self, key):
+        """returns the number of keys compared by a lookup of the key."""
+        key_hash = hash(key)
+        probes = 0
+        node = self.root
+        try:
+            while node is not None:
+                probes += 1
+                if key_hash == node.hash and key == node.key:
+                    return probes
+                node = node.left if self.goes_left(key, key_hash, node) else node.right
+        except TypeError:
+            return self.size
+        return probes + len(self.unordered)
+
+    def contains(self, key):
+        try:
+            if self.find(key) is not None:
+                return True
+        except TypeError:
+            return key in self.keys()
+        return bool(self.unordered) and key in self.unordered
+
+    def insert(self, key):
+        """Inserts a key, returns False if it was already stored."""
+        if self.unordered and key in self.unordered:
+            return False
+        size = self.size
+        try:
+            self.root = self._insert(self.root, key, hash(key))
+        except TypeError:
+            # _insert fails before it links a node, so the tree is unchanged
+            if key in self.keys():
+                return False
+            self.unordered.append(key)
+            self.size += 1
+        return self.size != size
+
+    def remove(self, key):
+        """Removes a key, returns False if it was not stored."""
+        if key in self.unordered:
+            self.unordered.remove(key)
+            self.size -= 1
+            return True
+        try:
+            if self.find(key) is None:
+                return False
+            self.root = self._remove(self.root, key, hash(key))
+        except TypeError:
+            # the key is not reachable by comparisons: rebuild the bucket from all other keys
+            keys = self.keys()
+            if key not in keys:
+                return False
+            keys.remove(key)
+            self.root = None
+            self.size = 0
+            self.unordered = []
+            for other in keys:
+                self.insert(other)
+            return True
+        self.size -= 1
+        return True
+
+    def _insert(self, node, key, key_hash):
+        if node is None:
+            self.size += 1
+            return AVLBucketNode(key)
+        if key_hash == node.hash and key == node.key:
+            return node
+        if self.goes_left(key, key_hash, node):
+            node.left = self._insert(node.left, key, key_hash)
+        else:
+            node.right = self._insert(node.right, key, key_hash)
+        return self._restructure(node)
+
+    def _remove(self, node, key, key_hash):
+        if key_hash == node.hash and key == node.key:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.key = successor.key
+            node.hash = successor.hash
+            node.right = self._remove_min(node.right)
+        elif self.goes_left(key, key_hash, node):
+            node.left = self._remove(node.left, key, key_hash)
+        else:
+            node.right = self._remove(node.right, key, key_hash)
+        return self._restructure(node)
+
+    def _remove_min(self, node):
+        if node.left is None:
+            return node.right
+        node.left = self._remove_min(node.left)
+        return self._restructure(node)
+
+    @staticmethod
+    def _height(node):
+        return -1 if node is None else node.height
+
+    def _update_height(self, node):
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+
+    def _restructure(self, node):
+        self._update_height(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._left_rotate(node.left)
+            return self._right_rotate(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._right_rotate(node.right)
+            return self._left_rotate(node)
+        return node
+
+    def _left_rotate(self, node):
+        new_root = node.right
+        node.right = new_root.left
+        new_root.left = node
+        self._update_height(node)
+        self._update_height(new_root)
+        return new_root
+
+    def _right_rotate(self, node):
+        new_root = node.left
+        node.left = new_root.right
+        new_root.right = node
+        self._update_height(node)
+        self._update_height(new_root)
+        return new_root
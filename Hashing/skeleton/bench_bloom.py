@@ -0,0 +1,42 @@
+"""contains throughput with 90% misses: ChainingHashSet vs. BloomHashSet (counting and rebuilding variants),
+and the observed vs. estimated false-positive rate.
+
+Usage: python bench_bloom.py [number_of_keys] [load_factor]
+"""
+import random
+import sys
+
+from benchmark_utils import time_total
+from bloom_hash_set import BloomHashSet
+from chaining_hash_set import ChainingHashSet
+
+
+def run(n, load_factor):
+    rng = random.Random(42)
+    keys = rng.sample(range(n * 10), n)
+    absent = [key + n * 10 for key in keys]
+    queries = [rng.choice(keys) if rng.random() < 0.1 else rng.choice(absent) for _ in range(n)]
+    capacity = max(1, int(n / load_factor))
+    results = {}
+    for name, hash_set in (("chaining", ChainingHashSet(capacity)),
+                           ("bloom counting", BloomHashSet(capacity, expected_keys=n)),
+                           ("bloom rebuild", BloomHashSet(capacity, expected_keys=n, counting=False))):
+        for key in keys:
+            hash_set.insert(key)
+        seconds = time_total(hash_set.contains, queries)
+        if isinstance(hash_set, BloomHashSet):
+            rates = (hash_set.get_false_positive_rate(), hash_set.get_estimated_false_positive_rate())
+        else:
+            rates = (None, None)
+        results[name] = (len(queries) / seconds, rates)
+    return results
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    load_factor = float(sys.argv[2]) if len(sys.argv) > 2 else 4.0
+    for name, (throughput, (observed, estimated)) in run(n, load_factor).items():
+        line = "{:<16}contains/s={:.0f}".format(name, throughput)
+        if observed is not None:
+            line += "  observed_fpr={:.4f}  estimated_fpr={:.4f}".format(observed, estimated)
+        print(line)
@@ -0,0 +1,45 @@
+"""Memory per key and lookup speed of the bucket layouts: linked ChainingHashNode chains, __slots__ nodes,
+list buckets and typed array buckets.
+
+Usage: python bench_bucket_layout.py [number_of_keys] [load_factor]
+"""
+import random
+import sys
+
+from benchmark_utils import measure_memory, time_total
+from chaining_hash_set import ChainingHashSet
+from compact_hash_set import CompactHashSet, SlottedHashSet
+
+
+def build(factory, keys):
+    hash_set = factory()
+    for key in keys:
+        hash_set.insert(key)
+    return hash_set
+
+
+def run(n, load_factor):
+    rng = random.Random(42)
+    keys = rng.sample(range(n * 10), n)
+    misses = [key + n * 10 for key in keys]
+    capacity = max(1, int(n / load_factor))
+    layouts = (("linked nodes", lambda: ChainingHashSet(capacity)),
+               ("slotted nodes", lambda: SlottedHashSet(capacity)),
+               ("list buckets", lambda: CompactHashSet(capacity, bucket_type=CompactHashSet.LIST)),
+               ("array buckets", lambda: CompactHashSet(capacity, bucket_type=CompactHashSet.ARRAY)))
+    results = {}
+    for name, factory in layouts:
+        hash_set, memory = measure_memory(lambda: build(factory, keys))
+        results[name] = {
+            "bytes_per_key": memory / n,
+            "contains_hit_s": time_total(hash_set.contains, keys),
+            "contains_miss_s": time_total(hash_set.contains, misses),
+        }
+    return results
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    load_factor = float(sys.argv[2]) if len(sys.argv) > 2 else 4.0
+    for name, result in run(n, load_factor).items():
+        print("{:<15}".format(name) + "  ".join("{}={:.3f}".format(k, v) for k, v in result.items()))
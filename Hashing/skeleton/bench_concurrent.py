@@ -0,0 +1,70 @@
+"""Throughput of a shared hash set for 1..N threads: ChainingHashSet behind one global lock vs. the lock-striped
+ConcurrentHashSet. With the GIL enabled neither scales with threads; on a free-threaded interpreter the striped
+set can.
+
+Usage: python bench_concurrent.py [operations_per_thread] [max_threads]
+"""
+import random
+import sys
+import threading
+import time
+
+from chaining_hash_set import ChainingHashSet
+from concurrent_hash_set import ConcurrentHashSet
+
+
+class GlobalLockHashSet():
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hash_set = ChainingHashSet(16, max_load_factor=0.75)
+
+    def insert(self, key):
+        with self.lock:
+            return self.hash_set.insert(key)
+
+    def contains(self, key):
+        with self.lock:
+            return self.hash_set.contains(key)
+
+
+def worker(hash_set, keys, barrier):
+    insert = hash_set.insert
+    contains = hash_set.contains
+    barrier.wait()
+    for i, key in enumerate(keys):
+        if i % 5 == 0:
+            insert(key)
+        else:
+            contains(key)
+
+
+def run(operations, max_threads):
+    results = []
+    threads = 1
+    while threads <= max_threads:
+        for name, factory in (("global lock", GlobalLockHashSet),
+                              ("striped", lambda: ConcurrentHashSet(16, stripes=64))):
+            hash_set = factory()
+            rng = random.Random(threads)
+            key_lists = [[rng.randrange(operations * threads) for _ in range(operations)] for _ in range(threads)]
+            barrier = threading.Barrier(threads + 1)
+            pool = [threading.Thread(target=worker, args=(hash_set, keys, barrier)) for keys in key_lists]
+            for thread in pool:
+                thread.start()
+            barrier.wait()
+            start = time.perf_counter()
+            for thread in pool:
+                thread.join()
+            seconds = time.perf_counter() - start
+            results.append((name, threads, operations * threads / seconds))
+        threads *= 2
+    return results
+
+
+if __name__ == '__main__':
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    max_threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("GIL enabled: " + str(gil))
+    for name, threads, throughput in run(operations, max_threads):
+        print("{:<12}threads={:<3} ops/s={:.0f}".format(name, threads, throughput))
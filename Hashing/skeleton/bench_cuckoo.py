@@ -0,0 +1,36 @@
+"""Lookup latency tails: CuckooHashSet vs. ChainingHashSet, for hits and misses on random and on patterned
+(multiples of the capacity) keys.
+
+Usage: python bench_cuckoo.py [number_of_keys]
+"""
+import random
+import sys
+
+from benchmark_utils import format_summary, latency_summary, time_each
+from chaining_hash_set import ChainingHashSet
+from cuckoo_hash_set import CuckooHashSet
+
+
+def run(n):
+    rng = random.Random(42)
+    capacity = n
+    streams = {
+        "random": rng.sample(range(n * 10), n),
+        "patterned": [i * (capacity // 8) for i in range(n)],
+    }
+    results = []
+    for stream, keys in streams.items():
+        misses = [key + 1 for key in keys] if stream == "patterned" else [key + n * 10 for key in keys]
+        for name, hash_set in (("chaining", ChainingHashSet(capacity, max_load_factor=1.0)),
+                               ("cuckoo", CuckooHashSet(capacity, seed=1))):
+            for key in keys:
+                hash_set.insert(key)
+            results.append((stream + " " + name + " hit", latency_summary(time_each(hash_set.contains, keys))))
+            results.append((stream + " " + name + " miss", latency_summary(time_each(hash_set.contains, misses))))
+    return results
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for name, summary in run(n):
+        print(format_summary(name, summary))
@@ -0,0 +1,62 @@
+"""Textual dump and reload of a ChainingHashSet: the original repeated string concatenation vs. to_string /
+write_string, and dump/load vs. inserting key by key.
+
+Usage: python bench_dump.py [number_of_keys]
+"""
+import io
+import random
+import sys
+import time
+
+from chaining_hash_set import ChainingHashSet
+
+
+def concatenated_to_string(hash_set):
+    """The original to_string implementation."""
+    string_repr = ""
+    for i in range(len(hash_set.get_hash_table())):
+        string_repr += str(i) + " {"
+        node = hash_set.hash_table[i]
+        while node is not None:
+            string_repr += str(node.key) + ", "
+            node = node.next
+        string_repr = string_repr[:-2] + "}, "
+    return string_repr[:-2]
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def run(n):
+    keys = random.Random(42).sample(range(n * 10), n)
+    hash_set = ChainingHashSet(n, max_load_factor=1.0)
+    hash_set.bulk_insert(keys, unique=True)
+
+    old, old_s = timed(lambda: concatenated_to_string(hash_set))
+    new, new_s = timed(hash_set.to_string)
+    assert old == new
+    buffer = io.StringIO()
+    _, write_s = timed(lambda: hash_set.write_string(buffer))
+
+    dump = io.StringIO()
+    _, dump_s = timed(lambda: hash_set.dump(dump))
+    dump.seek(0)
+    loaded, load_s = timed(lambda: ChainingHashSet.load(dump, max_load_factor=1.0))
+    assert loaded.get_table_size() == n
+
+    def insert_one_by_one():
+        one_by_one = ChainingHashSet(8, max_load_factor=1.0)
+        for key in keys:
+            one_by_one.insert(key)
+    _, insert_s = timed(insert_one_by_one)
+    return {"concatenation": old_s, "to_string": new_s, "write_string": write_s, "dump": dump_s,
+            "load": load_s, "insert loop": insert_s}
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    for name, seconds in run(n).items():
+        print("{:<14}{:.3f}s".format(name, seconds))
@@ -0,0 +1,39 @@
+"""Read-only lookups: ChainingHashSet vs. the perfect-hash FrozenHashSet from freeze(). Reports build/freeze time,
+memory per key and latency of hits and misses.
+
+Usage: python bench_frozen.py [keys]
+"""
+import random
+import sys
+import time
+
+from benchmark_utils import format_summary, latency_summary, measure_memory, time_each
+from chaining_hash_set import ChainingHashSet
+
+
+def build(keys):
+    hash_set = ChainingHashSet(8, max_load_factor=0.75)
+    for key in keys:
+        hash_set.insert(key)
+    return hash_set
+
+
+def run(n):
+    rng = random.Random(42)
+    keys = rng.sample(range(n * 100), n)
+    hits = rng.sample(keys, min(n, 100000))
+    misses = [key + n * 100 for key in hits]
+    hash_set, chaining_memory = measure_memory(lambda: build(keys))
+    start = time.perf_counter()
+    hash_set.freeze()
+    freeze_seconds = time.perf_counter() - start
+    frozen, frozen_memory = measure_memory(hash_set.freeze)  # tracemalloc slows the build down, so it runs twice
+    print("freeze: {:.3f}s".format(freeze_seconds))
+    for name, lookup_set, memory in (("chaining", hash_set, chaining_memory), ("frozen", frozen, frozen_memory)):
+        print("{:<10}bytes/key={:.1f}".format(name, memory / n))
+        print(format_summary(name + " hit", latency_summary(time_each(lookup_set.contains, hits))))
+        print(format_summary(name + " miss", latency_summary(time_each(lookup_set.contains, misses))))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,39 @@
+"""Clear-heavy reuse of one large set (fill a few keys, query, clear, repeat): ChainingHashSet.clear, which
+allocates a new table, vs. GenerationHashSet.clear, which only starts a new generation.
+
+Usage: python bench_generation_clear.py [capacity] [rounds] [keys_per_round]
+"""
+import random
+import sys
+import time
+
+from chaining_hash_set import ChainingHashSet
+from generation_hash_set import GenerationHashSet
+
+
+def run(capacity, rounds, keys_per_round):
+    rng = random.Random(42)
+    batches = [[rng.randrange(capacity * 10) for _ in range(keys_per_round)] for _ in range(rounds)]
+    results = {}
+    for name, hash_set in (("reallocate", ChainingHashSet(capacity)), ("generation", GenerationHashSet(capacity))):
+        clear_seconds = 0.0
+        start = time.perf_counter()
+        for keys in batches:
+            for key in keys:
+                hash_set.insert(key)
+            for key in keys:
+                hash_set.contains(key + 1)
+            clear_start = time.perf_counter()
+            hash_set.clear()
+            clear_seconds += time.perf_counter() - clear_start
+        total = time.perf_counter() - start
+        results[name] = (total, clear_seconds / rounds)
+    return results
+
+
+if __name__ == '__main__':
+    capacity = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    keys_per_round = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    for name, (total, per_clear) in run(capacity, rounds, keys_per_round).items():
+        print("{:<12}total={:.3f}s  per_clear={:.1f}us".format(name, total, per_clear * 1e6))
@@ -0,0 +1,48 @@
+"""Chain-length distribution and throughput of the hash functions in hash_functions.py on patterned and random
+keys, using a ChainingHashSet with a fixed capacity.
+
+Usage: python bench_hash_functions.py [number_of_keys]
+"""
+import random
+import sys
+
+from benchmark_utils import time_total
+from chaining_hash_set import ChainingHashSet
+from hash_functions import FibonacciHash, GenericHash, UniversalHash
+
+
+def run(n):
+    capacity = n  # load factor 1.0
+    rng = random.Random(42)
+    key_streams = {
+        "multiples of 10": [i * 10 for i in range(n)],
+        "multiples of capacity/4": [i * (capacity // 4) for i in range(n)],
+        "random": rng.sample(range(n * 100), n),
+        "random strings": ["id-" + str(rng.getrandbits(48)) for _ in range(n)],
+    }
+    hash_functions = {
+        "modulo": None,
+        "fibonacci": FibonacciHash(),
+        "universal": UniversalHash(seed=1),
+        "generic": GenericHash(),
+    }
+    results = []
+    for stream_name, keys in key_streams.items():
+        for function_name, hash_function in hash_functions.items():
+            if isinstance(keys[0], str) and function_name != "generic":
+                continue
+            hash_set = ChainingHashSet(capacity, hash_function=hash_function)
+            insert_s = time_total(hash_set.insert, keys)
+            contains_s = time_total(hash_set.contains, keys)
+            stats = hash_set.get_stats()
+            results.append((stream_name, function_name, stats["max_chain"], stats["empty_buckets"] / capacity,
+                            n / insert_s, n / contains_s, stats["chain_histogram"]))
+    return results
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    for stream, function, longest, empty, inserts, lookups, histogram in run(n):
+        top = ", ".join(str(length) + ":" + str(count) for length, count in sorted(histogram.items())[:6])
+        print("{:<24}{:<10} max_chain={:<6} empty={:.2f}  insert/s={:.0f}  contains/s={:.0f}  hist[{}]".format(
+            stream, function, longest, empty, inserts, lookups, top))
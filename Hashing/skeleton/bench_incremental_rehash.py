@@ -0,0 +1,28 @@
+"""Per-insert latency while the table grows: stop-the-world rehash vs. incremental rehash.
+
+Usage: python bench_incremental_rehash.py [number_of_keys]
+"""
+import random
+import sys
+
+from benchmark_utils import format_summary, latency_summary, time_each
+from chaining_hash_set import ChainingHashSet
+from incremental_hash_set import IncrementalHashSet
+
+
+def run(n):
+    keys = random.Random(42).sample(range(n * 10), n)
+    results = {}
+    for name, hash_set in (("stop-the-world", ChainingHashSet(8, max_load_factor=0.75)),
+                           ("incremental", IncrementalHashSet(8, max_load_factor=0.75))):
+        inserts = time_each(hash_set.insert, keys)
+        lookups = time_each(hash_set.contains, keys)
+        results[name] = (latency_summary(inserts), latency_summary(lookups), hash_set.resize_count)
+    return results
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    for name, (inserts, lookups, resizes) in run(n).items():
+        print(format_summary(name + " insert", inserts), " resizes=" + str(resizes))
+        print(format_summary(name + " contains", lookups))
@@ -0,0 +1,31 @@
+"""Per-insert latency distribution while the table grows: doubling (stop-the-world), incremental rehashing and
+linear hashing.
+
+Usage: python bench_linear_hashing.py [number_of_keys]
+"""
+import random
+import sys
+
+from benchmark_utils import format_summary, latency_summary, time_each
+from chaining_hash_set import ChainingHashSet
+from incremental_hash_set import IncrementalHashSet
+from linear_hash_set import LinearHashSet
+
+
+def run(n):
+    keys = random.Random(42).sample(range(n * 10), n)
+    results = {}
+    for name, hash_set in (("doubling", ChainingHashSet(8, max_load_factor=0.75)),
+                           ("incremental", IncrementalHashSet(8, max_load_factor=0.75)),
+                           ("linear hashing", LinearHashSet(8, max_load_factor=0.75))):
+        inserts = time_each(hash_set.insert, keys)
+        lookups = time_each(hash_set.contains, keys)
+        results[name] = (latency_summary(inserts), latency_summary(lookups))
+    return results
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    for name, (inserts, lookups) in run(n).items():
+        print(format_summary(name + " insert", inserts))
+        print(format_summary(name + " contains", lookups))
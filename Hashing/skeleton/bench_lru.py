@@ -0,0 +1,45 @@
+"""Dedupe filter over a stream of ids with repeats: unbounded ChainingHashSet vs. LRUHashSet with a maximum size.
+Reports throughput, memory after the stream and the hit (duplicate) rate.
+
+Usage: python bench_lru.py [stream_length] [max_size]
+"""
+import random
+import sys
+import time
+
+from benchmark_utils import measure_memory
+from chaining_hash_set import ChainingHashSet
+from lru_hash_set import LRUHashSet
+
+
+def id_stream(length, seed=42):
+    """Mostly new ids, 30% repeats of one of the last 10000 ids."""
+    rng = random.Random(seed)
+    ids = []
+    for i in range(length):
+        ids.append(ids[-rng.randrange(1, min(i, 10000) + 1)] if i and rng.random() < 0.3 else i)
+    return ids
+
+
+def run(length, max_size):
+    ids = id_stream(length)
+    factories = (("unbounded", lambda: ChainingHashSet(8, max_load_factor=0.75)),
+                 ("lru", lambda: LRUHashSet(max_size)))
+    for name, factory in factories:
+        def dedupe():
+            hash_set = factory()
+            for key in ids:
+                hash_set.insert(key)
+            return hash_set
+
+        start = time.perf_counter()
+        hash_set = dedupe()
+        seconds = time.perf_counter() - start
+        _, memory = measure_memory(dedupe)
+        duplicates = length - hash_set.get_table_size() - getattr(hash_set, "eviction_count", 0)
+        print("{:<10}ops/s={:>9.0f}  memory={:>7.1f}MB  size={:>8}  duplicates={:.1%}".format(
+            name, length / seconds, memory / 1e6, hash_set.get_table_size(), duplicates / length))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000, int(sys.argv[2]) if len(sys.argv) > 2 else 20000)
@@ -0,0 +1,45 @@
+"""Batch insert/contains of int64 keys: NumpyIntHashSet vs. a Python loop over ChainingHashSet.
+
+Usage: python bench_numpy_int_hash_set.py [number_of_keys]
+"""
+import sys
+import time
+
+import numpy as np
+
+from benchmark_utils import time_total
+from chaining_hash_set import ChainingHashSet
+from numpy_int_hash_set import NumpyIntHashSet
+
+
+def run(n):
+    rng = np.random.default_rng(42)
+    keys = rng.integers(0, 2 ** 62, size=n, dtype=np.int64)
+    queries = np.concatenate((keys[: n // 2], rng.integers(0, 2 ** 62, size=n - n // 2, dtype=np.int64)))
+
+    chaining = ChainingHashSet(8, max_load_factor=0.75)
+    key_list = keys.tolist()
+    query_list = queries.tolist()
+    chaining_insert = time_total(chaining.insert, key_list)
+    chaining_contains = time_total(chaining.contains, query_list)
+
+    numpy_set = NumpyIntHashSet()
+    start = time.perf_counter()
+    numpy_set.insert_many(keys)
+    numpy_insert = time.perf_counter() - start
+    start = time.perf_counter()
+    found = numpy_set.contains_many(queries)
+    numpy_contains = time.perf_counter() - start
+
+    assert found.sum() == sum(1 for key in query_list if chaining.contains(key))
+    return {
+        "chaining loop": (chaining_insert, chaining_contains),
+        "numpy batch": (numpy_insert, numpy_contains),
+    }
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    for name, (insert_s, contains_s) in run(n).items():
+        print("{:<14}insert={:.3f}s  contains={:.3f}s  ({:.2f} Mkeys/s)".format(
+            name, insert_s, contains_s, n / (insert_s + contains_s) / 1e6))
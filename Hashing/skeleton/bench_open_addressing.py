@@ -0,0 +1,41 @@
+"""Memory per key and lookup speed: ChainingHashSet vs. RobinHoodHashSet.
+
+Usage: python bench_open_addressing.py [number_of_keys]
+"""
+import random
+import sys
+
+from benchmark_utils import measure_memory, time_total
+from chaining_hash_set import ChainingHashSet
+from robin_hood_hash_set import RobinHoodHashSet
+
+
+def build(factory, keys):
+    hash_set = factory()
+    for key in keys:
+        hash_set.insert(key)
+    return hash_set
+
+
+def run(n):
+    rng = random.Random(42)
+    keys = rng.sample(range(n * 10), n)
+    misses = [key + n * 10 for key in keys]
+    backends = (("chaining", lambda: ChainingHashSet(8, max_load_factor=0.75)),
+                ("robin hood", lambda: RobinHoodHashSet(8, max_load_factor=0.85)))
+    results = {}
+    for name, factory in backends:
+        hash_set, memory = measure_memory(lambda: build(factory, keys))
+        results[name] = {
+            "bytes_per_key": memory / n,
+            "insert_s": time_total(build(factory, []).insert, keys),
+            "contains_hit_s": time_total(hash_set.contains, keys),
+            "contains_miss_s": time_total(hash_set.contains, misses),
+        }
+    return results
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    for name, result in run(n).items():
+        print("{:<12}".format(name) + "  ".join("{}={:.3f}".format(k, v) for k, v in result.items()))
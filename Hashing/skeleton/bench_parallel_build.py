@@ -0,0 +1,54 @@
+"""Build time of a ChainingHashSet from int64 keys: insert loop, bulk_insert and parallel_build with an increasing
+number of worker processes.
+
+Usage: python bench_parallel_build.py [number_of_keys] [max_workers]
+"""
+import os
+import random
+import sys
+import time
+
+from chaining_hash_set import ChainingHashSet
+from parallel_build import parallel_build
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def run(n, max_workers):
+    rng = random.Random(42)
+    keys = [rng.randrange(-2 ** 62, 2 ** 62) for _ in range(n)]
+    results = []
+
+    def insert_loop():
+        hash_set = ChainingHashSet(8, max_load_factor=0.75)
+        for key in keys:
+            hash_set.insert(key)
+        return hash_set
+    _, seconds = timed(insert_loop)
+    results.append(("insert loop", seconds))
+
+    def bulk():
+        hash_set = ChainingHashSet(8, max_load_factor=0.75)
+        hash_set.bulk_insert(keys)
+        return hash_set
+    _, seconds = timed(bulk)
+    results.append(("bulk_insert", seconds))
+
+    workers = 1
+    while workers <= max_workers:
+        hash_set, seconds = timed(lambda: parallel_build(keys, workers=workers))
+        assert hash_set.get_table_size() == len(set(keys))
+        results.append(("parallel_build x" + str(workers), seconds))
+        workers *= 2
+    return results
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    for name, seconds in run(n, max_workers):
+        print("{:<20}{:.3f}s".format(name, seconds))
@@ -0,0 +1,54 @@
+"""Memory, lookup time and set algebra of ChainingHashSet vs. RoaringBitmap for dense and sparse integer keys,
+and the backend AdaptiveHashSet picks for each of them.
+
+Usage: python bench_roaring.py [keys]
+"""
+import random
+import sys
+import time
+
+from adaptive_hash_set import AdaptiveHashSet
+from benchmark_utils import measure_memory, time_total
+from chaining_hash_set import ChainingHashSet
+from roaring_bitmap import RoaringBitmap
+
+
+def build_chaining(keys):
+    hash_set = ChainingHashSet(8, max_load_factor=0.75)
+    hash_set.bulk_insert(keys, unique=True)
+    return hash_set
+
+
+def build_adaptive(keys):
+    hash_set = AdaptiveHashSet()
+    for key in keys:
+        hash_set.insert(key)
+    return hash_set
+
+
+def run(n):
+    rng = random.Random(42)
+    streams = {
+        "dense range": list(range(n)),
+        "dense 50%": rng.sample(range(2 * n), n),
+        "sparse": rng.sample(range(n * 10 ** 6), n),
+    }
+    for stream_name, keys in streams.items():
+        other = [key + n // 2 for key in keys]
+        queries = rng.sample(keys, min(n, 100000))
+        for name, build in (("chaining", build_chaining), ("roaring", RoaringBitmap.from_keys)):
+            hash_set, memory = measure_memory(lambda: build(keys))
+            other_set = build(other)
+            lookup = time_total(hash_set.contains, queries)
+            start = time.perf_counter()
+            hash_set.intersection(other_set)
+            intersection = time.perf_counter() - start
+            print("{:<12}{:<10}bytes/key={:>7.2f}  contains={:.3f}s  intersection={:.3f}s".format(
+                stream_name, name, memory / n, lookup, intersection))
+        adaptive, memory = measure_memory(lambda: build_adaptive(keys))
+        print("{:<12}{:<10}bytes/key={:>7.2f}  mode={}".format(stream_name, "adaptive", memory / n,
+                                                               adaptive.get_mode()))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
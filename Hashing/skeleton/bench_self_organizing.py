@@ -0,0 +1,42 @@
+"""Average probe length of contains under zipfian (skewed) lookups for the chain policies of
+SelfOrganizingHashSet.
+
+Usage: python bench_self_organizing.py [number_of_keys] [number_of_lookups] [zipf_exponent]
+"""
+import itertools
+import random
+import sys
+
+from benchmark_utils import time_total
+from self_organizing_hash_set import SelfOrganizingHashSet
+
+
+def zipf_keys(keys, count, exponent, rng):
+    """Draws count keys, the i-th most popular key with probability proportional to 1 / i^exponent."""
+    cumulative = list(itertools.accumulate(1.0 / (rank ** exponent) for rank in range(1, len(keys) + 1)))
+    return rng.choices(keys, cum_weights=cumulative, k=count)
+
+
+def run(n, lookups, exponent, load_factor=8):
+    rng = random.Random(42)
+    keys = rng.sample(range(n * 10), n)
+    # popularity is independent of insertion order, so hot keys are spread over the chains
+    popular = keys[:]
+    rng.shuffle(popular)
+    queries = zipf_keys(popular, lookups, exponent, rng)
+    results = {}
+    for policy in (None, SelfOrganizingHashSet.TRANSPOSE, SelfOrganizingHashSet.MOVE_TO_FRONT):
+        hash_set = SelfOrganizingHashSet(max(1, n // load_factor), policy=policy)
+        for key in keys:
+            hash_set.insert(key)
+        seconds = time_total(hash_set.contains, queries)
+        results[str(policy)] = (hash_set.get_average_probe_length(), lookups / seconds)
+    return results
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    exponent = float(sys.argv[3]) if len(sys.argv) > 3 else 1.1
+    for policy, (probes, throughput) in run(n, lookups, exponent).items():
+        print("{:<14}avg_probes={:.3f}  contains/s={:.0f}".format(policy, probes, throughput))
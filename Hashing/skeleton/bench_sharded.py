@@ -0,0 +1,50 @@
+"""Aggregate throughput of ShardedHashSet (batched insert_many/contains_many over worker processes) with an
+increasing number of shards, compared to one ChainingHashSet in this process. Also reports how many keys move
+when a shard is added.
+
+Usage: python bench_sharded.py [number_of_keys] [max_shards] [batch_size]
+"""
+import os
+import random
+import sys
+import time
+
+from chaining_hash_set import ChainingHashSet
+from sharded_hash_set import ShardedHashSet
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def batches(keys, batch_size):
+    return [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+
+
+def run(n, max_shards, batch_size):
+    rng = random.Random(42)
+    keys = [rng.randrange(2 ** 62) for _ in range(n)]
+    queries = keys[: n // 2] + [key + 1 for key in keys[: n // 2]]
+    print("cpus={}  keys={}  batch_size={}".format(os.cpu_count(), n, batch_size))
+    hash_set = ChainingHashSet(8, max_load_factor=0.75)
+    insert = timed(lambda: [hash_set.insert(key) for key in keys])
+    lookup = timed(lambda: [hash_set.contains(key) for key in queries])
+    print("{:<14}insert={:>10.0f} ops/s  contains={:>10.0f} ops/s".format("in-process", n / insert, n / lookup))
+    shards = 1
+    while shards <= max_shards:
+        with ShardedHashSet(shards) as sharded:
+            insert = timed(lambda: [sharded.insert_many(batch) for batch in batches(keys, batch_size)])
+            lookup = timed(lambda: [sharded.contains_many(batch) for batch in batches(queries, batch_size)])
+            start = time.perf_counter()
+            moved = sharded.add_shard()
+            rebalance = time.perf_counter() - start
+            print("{:<14}insert={:>10.0f} ops/s  contains={:>10.0f} ops/s  add_shard: moved {:.1%} in {:.2f}s".format(
+                "%d shards" % shards, n / insert, n / lookup, moved / n, rebalance))
+        shards *= 2
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500000, int(sys.argv[2]) if len(sys.argv) > 2 else 8,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 10000)
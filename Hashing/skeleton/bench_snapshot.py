@@ -0,0 +1,45 @@
+"""Cost of a consistent view for a reporting reader: ChainingHashSet.copy() vs. SnapshotHashSet.snapshot(), and
+the extra work the writer pays afterwards (table list copy and copied nodes).
+
+Usage: python bench_snapshot.py [number_of_keys] [writes_after_snapshot]
+"""
+import random
+import sys
+import time
+
+from chaining_hash_set import ChainingHashSet
+from snapshot_hash_set import SnapshotHashSet
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def writes(hash_set, keys, rng, count):
+    for _ in range(count):
+        hash_set.remove(rng.choice(keys))
+        hash_set.insert(rng.randrange(len(keys) * 10))
+
+
+def run(n, write_count):
+    rng = random.Random(42)
+    keys = rng.sample(range(n * 10), n)
+    plain = ChainingHashSet(8, max_load_factor=0.75)
+    plain.bulk_insert(keys, unique=True)
+    cow = SnapshotHashSet(8, max_load_factor=0.75)
+    cow.bulk_insert(keys, unique=True)
+    _, copy_seconds = timed(plain.copy)
+    snapshot, snapshot_seconds = timed(cow.snapshot)
+    print("copy()      {:>9.3f} ms".format(copy_seconds * 1e3))
+    print("snapshot()  {:>9.3f} ms".format(snapshot_seconds * 1e3))
+    _, plain_writes = timed(lambda: writes(plain, keys, random.Random(1), write_count))
+    _, cow_writes = timed(lambda: writes(cow, keys, random.Random(1), write_count))
+    print("{} writes: plain {:.3f}s, after snapshot {:.3f}s (table copies={}, copied nodes={})".format(
+        write_count, plain_writes, cow_writes, cow.table_copy_count, cow.node_copy_count))
+    print("snapshot still has {} keys, set has {}".format(snapshot.get_table_size(), cow.get_table_size()))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500000, int(sys.argv[2]) if len(sys.argv) > 2 else 100000)
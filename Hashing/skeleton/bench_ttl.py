@@ -0,0 +1,70 @@
+"""Time-based dedupe window: a ChainingHashSet with an expiry dict that is swept completely once per second (the
+current approach) vs. TTLHashSet with a timer wheel. The clock is simulated, so both see the same stream.
+
+Usage: python bench_ttl.py [operations] [ops_per_second] [ttl]
+"""
+import random
+import sys
+
+from benchmark_utils import format_summary, latency_summary, time_each
+from chaining_hash_set import ChainingHashSet
+from ttl_hash_set import TTLHashSet
+
+
+class SimulatedClock():
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SweepingHashSet():
+    """Baseline: expiry times in a dict, expired keys removed by a full sweep once per sweep_interval."""
+
+    def __init__(self, ttl, clock, sweep_interval=1.0):
+        self.hash_set = ChainingHashSet(8, max_load_factor=0.75)
+        self.expiry = {}
+        self.ttl = ttl
+        self.clock = clock
+        self.sweep_interval = sweep_interval
+        self.last_sweep = clock()
+
+    def sweep(self):
+        now = self.clock()
+        if now - self.last_sweep < self.sweep_interval:
+            return now
+        for key in list(self.hash_set.iter_keys()):
+            if self.expiry[key] <= now:
+                self.hash_set.remove(key)
+                del self.expiry[key]
+        self.last_sweep = now
+        return now
+
+    def insert(self, key):
+        now = self.sweep()
+        if self.hash_set.contains(key) and self.expiry[key] > now:
+            return False
+        self.hash_set.insert(key)
+        self.expiry[key] = now + self.ttl
+        return True
+
+
+def run(operations, rate, ttl):
+    rng = random.Random(42)
+    keys = [rng.randrange(operations) for _ in range(operations)]
+    for name, factory in (("full sweep", lambda clock: SweepingHashSet(ttl, clock)),
+                          ("timer wheel", lambda clock: TTLHashSet(8, 0.75, ttl=ttl, resolution=0.1, clock=clock))):
+        clock = SimulatedClock()
+        hash_set = factory(clock)
+
+        def insert(key):
+            clock.now += 1.0 / rate
+            hash_set.insert(key)
+
+        print(format_summary(name, latency_summary(time_each(insert, keys))))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 300000, float(sys.argv[2]) if len(sys.argv) > 2 else 10000.0,
+        float(sys.argv[3]) if len(sys.argv) > 3 else 5.0)
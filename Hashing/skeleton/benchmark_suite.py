@@ -0,0 +1,222 @@
+"""Comparative benchmark of all hash set implementations and Python's built-in set.
+
+Every backend runs every key stream (uniform, sequential, patterned-modulo, adversarial) under every workload
+(mix of insert/contains/remove). Reported per run: throughput, latency percentiles and memory per key. The results
+are written as JSON for regression tracking.
+
+Usage: python benchmark_suite.py [--keys N] [--operations N] [--backends a,b,...] [--output results.json]
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from adaptive_hash_set import AdaptiveHashSet
+from benchmark_utils import latency_summary, measure_memory, time_each
+from bloom_hash_set import BloomHashSet
+from chaining_hash_set import ChainingHashSet
+from compact_hash_set import CompactHashSet, SlottedHashSet
+from concurrent_hash_set import ConcurrentHashSet
+from cuckoo_hash_set import CuckooHashSet
+from frozen_hash_set import FrozenHashSet
+from generation_hash_set import GenerationHashSet
+from hash_functions import FibonacciHash
+from incremental_hash_set import IncrementalHashSet
+from linear_hash_set import LinearHashSet
+from lru_hash_set import LRUHashSet
+from roaring_bitmap import RoaringBitmap
+from robin_hood_hash_set import RobinHoodHashSet
+from self_organizing_hash_set import SelfOrganizingHashSet
+from sharded_hash_set import ShardedHashSet
+from snapshot_hash_set import SnapshotHashSet
+from treeifying_hash_set import TreeifyingHashSet
+from ttl_hash_set import TTLHashSet
+
+
+class BuiltinSet():
+    """Python's set behind the hash set API, as the baseline."""
+
+    def __init__(self):
+        self.keys = set()
+
+    def insert(self, key):
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        return True
+
+    def contains(self, key):
+        return key in self.keys
+
+    def remove(self, key):
+        if key in self.keys:
+            self.keys.remove(key)
+            return True
+        return False
+
+    def get_table_size(self):
+        return len(self.keys)
+
+
+BACKENDS = {
+    "builtin set": BuiltinSet,
+    "chaining": lambda: ChainingHashSet(8, max_load_factor=0.75),
+    "chaining fibonacci": lambda: ChainingHashSet(8, max_load_factor=0.75, hash_function=FibonacciHash()),
+    "incremental": lambda: IncrementalHashSet(8, max_load_factor=0.75),
+    "linear hashing": lambda: LinearHashSet(8, max_load_factor=0.75),
+    "treeifying": lambda: TreeifyingHashSet(8, max_load_factor=0.75),
+    "move-to-front": lambda: SelfOrganizingHashSet(8, max_load_factor=0.75),
+    "compact list": lambda: CompactHashSet(8, max_load_factor=0.75),
+    "compact array": lambda: CompactHashSet(8, max_load_factor=0.75, bucket_type=CompactHashSet.ARRAY),
+    "slotted nodes": lambda: SlottedHashSet(8, max_load_factor=0.75),
+    "bloom": lambda: BloomHashSet(8, max_load_factor=0.75),
+    "concurrent": lambda: ConcurrentHashSet(8, max_load_factor=0.75),
+    "robin hood": lambda: RobinHoodHashSet(8),
+    "cuckoo": lambda: CuckooHashSet(8, seed=1),
+    "generation": lambda: GenerationHashSet(8, max_load_factor=0.75),
+    "snapshot": lambda: SnapshotHashSet(8, max_load_factor=0.75),
+    "adaptive": lambda: AdaptiveHashSet(8, max_load_factor=0.75),
+    "roaring bitmap": RoaringBitmap,
+    # sized up front for max_size keys, so larger streams start evicting
+    "lru": lambda: LRUHashSet(1 << 16),
+    "ttl": lambda: TTLHashSet(8, max_load_factor=0.75, ttl=3600.0),
+    # every single-key call is a round trip to a worker process; bytes_per_key only counts the client side
+    "sharded": lambda: ShardedHashSet(shards=2),
+}
+
+# immutable backends: built from the keys in one go, they only run the contains calls of a workload
+STATIC_BACKENDS = {
+    "frozen chd": FrozenHashSet,
+}
+
+try:
+    from numpy_int_hash_set import NumpyIntHashSet
+    BACKENDS["numpy int"] = NumpyIntHashSet
+except ImportError:
+    pass
+
+# (insert, contains, remove) shares of the operations
+WORKLOADS = {
+    "read heavy": (0.10, 0.85, 0.05),
+    "balanced": (0.40, 0.40, 0.20),
+    "write heavy": (0.60, 0.10, 0.30),
+}
+
+# all keys of the adversarial stream collide in the modulo hash of every power-of-two capacity, so it is kept
+# small enough for chaining to finish in reasonable time
+ADVERSARIAL_KEYS = 2000
+
+
+def key_streams(n, seed=42):
+    rng = random.Random(seed)
+    return {
+        "uniform": rng.sample(range(n * 100), n),
+        "sequential": list(range(n)),
+        "patterned modulo": [i * 10 for i in range(n)],
+        "adversarial": [i << 32 for i in range(min(n, ADVERSARIAL_KEYS))],
+    }
+
+
+def make_operations(keys, count, ratios, rng):
+    """Draws a list of (operation name, key) pairs. Half of the contains/remove keys are absent."""
+    insert_share, contains_share, _ = ratios
+    absent_offset = max(keys) + 1
+    operations = []
+    for _ in range(count):
+        key = rng.choice(keys)
+        choice = rng.random()
+        if choice < insert_share:
+            operations.append(("insert", key))
+        else:
+            if rng.random() < 0.5:
+                key += absent_offset
+            operations.append(("contains" if choice < insert_share + contains_share else "remove", key))
+    return operations
+
+
+def build(factory, keys):
+    hash_set = factory()
+    for key in keys:
+        hash_set.insert(key)
+    return hash_set
+
+
+def close(hash_set):
+    """Releases backends that hold resources (worker processes, files)."""
+    if hasattr(hash_set, "close"):
+        hash_set.close()
+
+
+def run_one(factory, keys, operations, static=False):
+    if static:
+        full, memory = measure_memory(lambda: factory(keys))
+        hash_set = factory(keys[: len(keys) // 2])
+        operations = [(name, key) for name, key in operations if name == "contains"]
+    else:
+        full, memory = measure_memory(lambda: build(factory, keys))
+        hash_set = build(factory, keys[: len(keys) // 2])
+    close(full)
+    calls = [(getattr(hash_set, name), key) for name, key in operations]
+    start = time.perf_counter()
+    samples = time_each(lambda call: call[0](call[1]), calls)
+    seconds = time.perf_counter() - start
+    close(hash_set)
+    result = {"ops_per_s": len(calls) / seconds, "bytes_per_key": memory / len(keys)}
+    result.update(latency_summary(samples))
+    return result
+
+
+def run(n, operation_count, backend_names=None, seed=42):
+    rng = random.Random(seed)
+    results = []
+    for stream_name, keys in key_streams(n, seed).items():
+        for workload_name, ratios in WORKLOADS.items():
+            operations = make_operations(keys, min(operation_count, 10 * len(keys)), ratios, rng)
+            for backend_name in backend_names or list(BACKENDS) + list(STATIC_BACKENDS):
+                result = {"backend": backend_name, "stream": stream_name, "workload": workload_name}
+                if backend_name in STATIC_BACKENDS:
+                    result.update(run_one(STATIC_BACKENDS[backend_name], keys, operations, static=True))
+                else:
+                    result.update(run_one(BACKENDS[backend_name], keys, operations))
+                results.append(result)
+                print("{:<20}{:<18}{:<12}ops/s={:>10.0f}  p99_us={:>7.2f}  bytes/key={:>6.1f}".format(
+                    backend_name, stream_name, workload_name, result["ops_per_s"], result["p99_us"],
+                    result["bytes_per_key"]), file=sys.stderr)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=20000, help="keys per stream")
+    parser.add_argument("--operations", type=int, default=50000, help="operations per workload")
+    parser.add_argument("--backends", default=None, help="comma separated subset of: " + ", ".join(list(BACKENDS) + list(STATIC_BACKENDS)))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="JSON file (default: stdout)")
+    args = parser.parse_args(argv)
+    backend_names = args.backends.split(",") if args.backends else None
+    for name in backend_names or []:
+        if name not in BACKENDS and name not in STATIC_BACKENDS:
+            parser.error("unknown backend: " + name)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "keys": args.keys,
+            "operations": args.operations,
+            "seed": args.seed,
+        },
+        "results": run(args.keys, args.operations, backend_names, args.seed),
+    }
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == '__main__':
+    main()
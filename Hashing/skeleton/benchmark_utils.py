@@ -0,0 +1,75 @@
+import gc
+import time
+
+
+def time_each(operation, keys):
+    """Calls operation(key) for every key and measures each call separately. The garbage collector is disabled
+    while measuring, otherwise its pauses dominate the latency tail.
+    :param operation: Function that is called with a single key.
+    :param keys: Keys to pass to the operation.
+    :return: List of per-call latencies in nanoseconds.
+    """
+    clock = time.perf_counter_ns
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for key in keys:
+            start = clock()
+            operation(key)
+            samples.append(clock() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples
+
+
+def percentile(samples, p):
+    """Returns the p-th percentile (0 <= p <= 100) of the given samples using the nearest-rank method."""
+    if not samples:
+        return 0
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+
+def latency_summary(samples):
+    """Returns a dict with mean, p50, p99, p99.9 and max of the given latencies (in microseconds)."""
+    ordered = sorted(samples)
+    n = len(ordered)
+    if n == 0:
+        return {"mean_us": 0.0, "p50_us": 0.0, "p99_us": 0.0, "p999_us": 0.0, "max_us": 0.0}
+    return {
+        "mean_us": sum(ordered) / n / 1000,
+        "p50_us": percentile(ordered, 50) / 1000,
+        "p99_us": percentile(ordered, 99) / 1000,
+        "p999_us": percentile(ordered, 99.9) / 1000,
+        "max_us": ordered[-1] / 1000,
+    }
+
+
+def format_summary(name, summary):
+    """Formats a latency summary as a single line."""
+    return "{:<28}".format(name) + "  ".join(
+        "{}={:.2f}".format(label, value) for label, value in summary.items())
+
+
+def measure_memory(build):
+    """Returns (result, allocated_bytes) for calling build(), measured with tracemalloc."""
+    import tracemalloc
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+def time_total(operation, keys):
+    """Calls operation(key) for every key and returns the elapsed wall time in seconds."""
+    start = time.perf_counter()
+    for key in keys:
+        operation(key)
+    return time.perf_counter() - start
@@ -0,0 +1,86 @@
+import math
+
+MASK_64 = (1 << 64) - 1
+
+
+class BloomFilter():
+    """Bit-array Bloom filter with `hashes` probe positions per key, derived by double hashing from Python's
+    hash(key). might_contain never returns False for an added key."""
+    MULTIPLIER_1 = 0x9E3779B97F4A7C15
+    MULTIPLIER_2 = 0xC2B2AE3D27D4EB4F
+
+    def __init__(self, size, hashes):
+        self.size = max(8, size)    # number of bits (or counters)
+        self.hashes = hashes
+        self.cells = bytearray((self.size + 7) // 8)
+
+    @staticmethod
+    def for_keys(expected_keys, bits_per_key=10, counting=False):
+        """Creates a filter sized for the expected number of keys with the optimal number of hash functions."""
+        hashes = max(1, round(bits_per_key * math.log(2)))
+        size = max(1, expected_keys) * bits_per_key
+        return CountingBloomFilter(size, hashes) if counting else BloomFilter(size, hashes)
+
+    def positions(self, key):
+        h = hash(key) & MASK_64
+        h1 = (h * self.MULTIPLIER_1) & MASK_64
+        h2 = ((h * self.MULTIPLIER_2) & MASK_64) | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def add(self, key):
+        for position in self.positions(key):
+            self.cells[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, key):
+        """returns False if the key has definitely not been added. Stops at the first unset position, so most
+        misses are decided after one or two probes."""
+        h = hash(key) & MASK_64
+        position = (h * self.MULTIPLIER_1) & MASK_64
+        step = ((h * self.MULTIPLIER_2) & MASK_64) | 1
+        cells = self.cells
+        size = self.size
+        for _ in range(self.hashes):
+            index = position % size
+            if not cells[index >> 3] & (1 << (index & 7)):
+                return False
+            position += step
+        return True
+
+    def estimated_false_positive_rate(self, keys):
+        """Theoretical false-positive rate (1 - e^(-k n / m))^k for n stored keys."""
+        return (1 - math.exp(-self.hashes * keys / self.size)) ** self.hashes
+
+
+class CountingBloomFilter(BloomFilter):
+    """Bloom filter with one 8-bit counter per position, so keys can be removed again. Counters saturate at 255
+    and are never decremented afterwards (which keeps the filter free of false negatives)."""
+
+    def __init__(self, size, hashes):
+        super().__init__(size, hashes)
+        self.cells = bytearray(self.size)
+
+    def add(self, key):
+        cells = self.cells
+        for position in self.positions(key):
+            if cells[position] < 255:
+                cells[position] += 1
+
+    def remove(self, key):
+        """Removes a key that has been added before."""
+        cells = self.cells
+        for position in self.positions(key):
+            if 0 < cells[position] < 255:
+                cells[position] -= 1
+
+    def might_contain(self, key):
+        h = hash(key) & MASK_64
+        position = (h * self.MULTIPLIER_1) & MASK_64
+        step = ((h * self.MULTIPLIER_2) & MASK_64) | 1
+        cells = self.cells
+        size = self.size
+        for _ in range(self.hashes):
+            if not cells[position % size]:
+                return False
+            position += step
+        return True
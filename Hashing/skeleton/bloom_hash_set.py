@@ -0,0 +1,85 @@
+from bloom_filter import BloomFilter
+from chaining_hash_set import ChainingHashSet
+
+
+class BloomHashSet(ChainingHashSet):
+    """ChainingHashSet with a Bloom filter in front of contains: if the filter rules a key out, the table is not
+    touched at all.
+
+    With counting=True a CountingBloomFilter is kept exact under removals. With counting=False a plain bit filter
+    is used and rebuilt from the table once more than rebuild_ratio * size keys have been removed since the last
+    rebuild (removed keys only cause false positives until then). The filter is also rebuilt, twice as large,
+    when the set outgrows the number of keys it was sized for.
+    """
+
+    def __init__(self, capacity=0, max_load_factor=None, hash_function=None, expected_keys=1024, bits_per_key=10,
+                 counting=True, rebuild_ratio=0.25):
+        super().__init__(capacity, max_load_factor, hash_function)
+        self.bits_per_key = bits_per_key
+        self.counting = counting
+        self.rebuild_ratio = rebuild_ratio
+        self.filter_keys = max(1, expected_keys)
+        self.bloom_filter = BloomFilter.for_keys(self.filter_keys, bits_per_key, counting)
+        self.removed_since_rebuild = 0
+        self.filtered_count = 0        # contains calls answered by the filter alone
+        self.false_positive_count = 0  # filter said "maybe", table said no
+
+    def rebuild_filter(self):
+        """Builds a new filter from the stored keys."""
+        while self.table_size > self.filter_keys:
+            self.filter_keys *= 2
+        self.bloom_filter = BloomFilter.for_keys(self.filter_keys, self.bits_per_key, self.counting)
+        for key in self.iter_keys():
+            self.bloom_filter.add(key)
+        self.removed_since_rebuild = 0
+
+    def get_false_positive_rate(self):
+        """returns the observed share of lookups for absent keys that the filter did not rule out."""
+        misses = self.filtered_count + self.false_positive_count
+        if misses == 0:
+            return 0.0
+        return self.false_positive_count / misses
+
+    def get_estimated_false_positive_rate(self):
+        """returns the theoretical false-positive rate of the filter for the current number of keys."""
+        return self.bloom_filter.estimated_false_positive_rate(self.table_size + self.removed_since_rebuild)
+
+    def set_hash_table(self, table):
+        super().set_hash_table(table)
+        self.rebuild_filter()
+
+    def insert(self, key):
+        if not super().insert(key):
+            return False
+        if self.table_size > self.filter_keys:
+            self.rebuild_filter()
+        else:
+            self.bloom_filter.add(key)
+        return True
+
+    def contains(self, key):
+        if key is None:
+            raise ValueError()
+        if not self.bloom_filter.might_contain(key):
+            self.filtered_count += 1
+            return self.record_lookup(key, False, 0)
+        if super().contains(key):
+            return True
+        self.false_positive_count += 1
+        return False
+
+    def remove(self, key):
+        if not super().remove(key):
+            return False
+        if self.counting:
+            self.bloom_filter.remove(key)
+        else:
+            self.removed_since_rebuild += 1
+            if self.removed_since_rebuild > self.rebuild_ratio * max(1, self.table_size):
+                self.rebuild_filter()
+        return True
+
+    def clear(self):
+        super().clear()
+        self.bloom_filter = BloomFilter.for_keys(self.filter_keys, self.bits_per_key, self.counting)
+        self.removed_since_rebuild = 0
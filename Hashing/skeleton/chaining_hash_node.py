@@ -1,4 +1,5 @@
 class ChainingHashNode():
-    def __init__(self, key=None):
+    def __init__(self, key=None, hash_value=None):
         self.key = key
         self.next = None
+        self.hash_value = hash_value  # cached prehash of the key (see hash_functions.GenericHash)
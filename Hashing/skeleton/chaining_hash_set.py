@@ -1,21 +1,56 @@
 from chaining_hash_node import ChainingHashNode
+from frozen_hash_set import FrozenHashSet
+from hash_set_stats import HashSetStats, chain_length_histogram
 class ChainingHashSet():
-    def __init__(self, capacity=0):
+    DUMP_HEADER = "#ChainingHashSet"
+
+    def __init__(self, capacity=0, max_load_factor=None, hash_function=None):
         self.hash_table = [None] * capacity
         self.table_size = 0
         self.capacity = capacity
+        self.max_load_factor = max_load_factor  # None disables automatic resizing
+        self.resize_count = 0
+        self.hash_function = hash_function      # see hash_functions.py, None means key % capacity
+        self.stats = None                       # HashSetStats while enable_stats() is active
 
     def get_hash_code(self, key):
-        """Hash function that calculates a hash code for a given key using the modulo division.
+        """Hash function that calculates a hash code for a given key using the modulo division
+        (or the configured hash function).
         :param key:
         		Key for which a hash code shall be calculated according to the length of the hash table.
         :return:
         		The calculated hash code for the given key.
 
         """
-        hash_code = key % self.capacity
+        if self.hash_function is None:
+            hash_code = key % self.capacity
+        else:
+            hash_code = self.hash_function(key, self.capacity)
         return hash_code
 
+    def get_node_hash_code(self, node):
+        """Returns the hash code of a stored node, using its cached hash value if there is one."""
+        if node.hash_value is None:
+            return self.get_hash_code(node.key)
+        return self.hash_function.index(node.hash_value, self.capacity)
+
+    def bucket_index(self, key, grow=False):
+        """Returns the bucket index of a key (get_hash_code), or None if the table has no buckets yet.
+        :param grow: True for inserts: a table with capacity 0 is then first grown to one bucket, since resizing
+        		can only double an existing table.
+        """
+        if self.capacity == 0:
+            if not grow:
+                return None
+            self.rehash(1)
+        return self.get_hash_code(key)
+
+    def create_node(self, key):
+        """Creates the node for a new key, caching its hash value if the hash function asks for it."""
+        if self.hash_function is not None and self.hash_function.cache_hash:
+            return ChainingHashNode(key, self.hash_function.prehash(key))
+        return ChainingHashNode(key)
+
     def get_hash_table(self):
         """(Required for testing only)
         :return the hash table.
@@ -56,23 +91,23 @@ class ChainingHashSet():
          :raises:
          		a ValueError if any of the input parameters is None.
          """
-        hash = self.get_hash_code(key)
         if key is None:
             raise ValueError()
+        hash = self.bucket_index(key, True)
         if self.hash_table[hash] is None:
-            self.hash_table[hash] = ChainingHashNode(key)
-            self.table_size += 1
-            return True
+            self.hash_table[hash] = self.create_node(key)
         else:
             node_key = self.hash_table[hash]
-            while node_key is not None:
+            while True:
                 if node_key.key == key:
                     return False
                 if node_key.next is None:
-                    node_key.next = ChainingHashNode(key)
-                    self.table_size += 1
-                    return True
+                    node_key.next = self.create_node(key)
+                    break
                 node_key = node_key.next
+        self.table_size += 1
+        self.grow_if_needed()
+        return True
 
     def contains(self, key):
         """Searches for a given key in the hash table.
@@ -83,9 +118,13 @@ class ChainingHashSet():
          :raises:
          	    a ValueError if the key is None.
          """
-        hash = self.get_hash_code(key)
         if key is None:
             raise ValueError()
+        hash = self.bucket_index(key)
+        if hash is None:
+            return False
+        if self.stats is not None:
+            return self.stats.record_lookup(self.hash_table[hash], key)
         if self.hash_table[hash] is None:
             return False
         else:
@@ -105,9 +144,11 @@ class ChainingHashSet():
         :raises:
          	a ValueError if the key is None.
         """
-        hash = self.get_hash_code(key)
         if key is None:
             raise ValueError()
+        hash = self.bucket_index(key)
+        if hash is None:
+            return False
         if self.hash_table[hash] is None:
             return False
         else:
@@ -125,6 +166,208 @@ class ChainingHashSet():
                     node_key = node_key.next
                 return False
 
+    def get_load_factor(self):
+        """returns the number of stored keys divided by the number of buckets."""
+        if self.capacity == 0:
+            return 0.0
+        return self.table_size / self.capacity
+
+    def enable_stats(self):
+        """Starts counting probes of contains calls (see get_stats). Subclasses that override contains report
+        through record_lookup. The counters are not synchronized, so with concurrent threads they are approximate."""
+        if self.stats is None:
+            self.stats = HashSetStats()
+
+    def record_lookup(self, key, found, probes=None):
+        """Counts a contains call while enable_stats() is active; overrides of contains return their result through
+        this method.
+        :param probes: The number of compared keys, counted with count_probes if not given.
+        :return: found
+        """
+        if self.stats is not None:
+            self.stats.record(self.count_probes(key) if probes is None else probes, found)
+        return found
+
+    def count_probes(self, key):
+        """returns the number of keys a lookup of the key compares (only called while stats are enabled)."""
+        hash = self.bucket_index(key)
+        probes = 0
+        node = None if hash is None else self.hash_table[hash]
+        while node is not None:
+            probes += 1
+            if node.key == key:
+                break
+            node = node.next
+        return probes
+
+    def disable_stats(self):
+        self.stats = None
+
+    def get_stats(self):
+        """Returns a dict describing the health of the table: size, capacity, load factor, chain-length histogram,
+        longest chain, number of empty buckets, resize count and (if enable_stats() has been called) the average
+        number of compared nodes per successful and unsuccessful contains call."""
+        histogram = chain_length_histogram(self.get_hash_table())
+        stats = {
+            "size": self.get_table_size(),
+            "capacity": self.capacity,
+            "load_factor": self.get_load_factor(),
+            "max_chain": max(histogram) if histogram else 0,
+            "empty_buckets": histogram.get(0, 0),
+            "chain_histogram": dict(sorted(histogram.items())),
+            "resize_count": self.resize_count,
+        }
+        if self.stats is not None:
+            stats["hit_lookups"] = self.stats.hit_count
+            stats["miss_lookups"] = self.stats.miss_count
+            stats["avg_probes_hit"] = self.stats.get_average_hit_probes()
+            stats["avg_probes_miss"] = self.stats.get_average_miss_probes()
+        return stats
+
+    def grow_if_needed(self):
+        """Doubles the capacity once the load factor exceeds max_load_factor (if resizing is enabled).
+        :return:
+        		True if a resize has been started, False otherwise.
+        """
+        if self.max_load_factor is None or self.table_size <= self.max_load_factor * self.capacity:
+            return False
+        self.rehash(max(1, 2 * self.capacity))
+        return True
+
+    def rehash(self, new_capacity):
+        """Moves all stored nodes into a new hash table with the given capacity (stop-the-world).
+        The node objects are re-linked, not copied.
+        :param new_capacity:
+        		Number of buckets of the new hash table.
+        """
+        old_table = self.hash_table
+        self.hash_table = [None] * new_capacity
+        self.capacity = new_capacity
+        for node in old_table:
+            while node is not None:
+                next_node = node.next
+                hash = self.get_node_hash_code(node)
+                node.next = self.hash_table[hash]
+                self.hash_table[hash] = node
+                node = next_node
+        self.resize_count += 1
+
+    def iter_keys(self):
+        """Yields all stored keys bucket by bucket."""
+        for node in self.get_hash_table():
+            while node is not None:
+                yield node.key
+                node = node.next
+
+    def is_aligned_with(self, other):
+        """returns True if both sets have the same capacity, hash function and bucket mapping (get_hash_code), i.e.
+        every key lands in the same bucket index in both tables."""
+        return self.capacity > 0 and self.capacity == other.capacity and self.hash_function == other.hash_function \
+            and type(self).get_hash_code is type(other).get_hash_code
+
+    def empty_copy(self):
+        """returns an empty ChainingHashSet with the same capacity, load factor limit and hash function."""
+        return ChainingHashSet(self.capacity, self.max_load_factor, self.hash_function)
+
+    def merge_buckets(self, other, combine):
+        """Builds a new set bucket by bucket without rehashing (both sets must be aligned).
+        :param other: Set aligned with this one.
+        :param combine: Function (keys_of_self, keys_of_other) -> keys of the result bucket.
+        :return: The new ChainingHashSet.
+        """
+        result = self.empty_copy()
+        own_table = self.get_hash_table()
+        other_table = other.get_hash_table()
+        for i in range(self.capacity):
+            keys = combine(self.chain_keys(own_table[i]), self.chain_keys(other_table[i]))
+            head = None
+            for key in reversed(keys):
+                node = result.create_node(key)
+                node.next = head
+                head = node
+            result.hash_table[i] = head
+            result.table_size += len(keys)
+        while result.grow_if_needed():
+            pass
+        return result
+
+    @staticmethod
+    def chain_keys(node):
+        keys = []
+        while node is not None:
+            keys.append(node.key)
+            node = node.next
+        return keys
+
+    def copy(self):
+        """returns a copy of this set with the same bucket layout."""
+        if self.capacity == 0:
+            return self.empty_copy()
+        return self.merge_buckets(self, lambda own, _: own)
+
+    def union(self, other):
+        """returns a new set with the keys that are in this set or in the other set."""
+        if self.is_aligned_with(other):
+            return self.merge_buckets(other, lambda own, theirs: own + [key for key in theirs if key not in own])
+        larger, smaller = self, other
+        if type(other) is type(self) and other.get_table_size() > self.get_table_size():
+            larger, smaller = other, self  # copying the larger set is cheaper, the result keeps the class of self
+        result = larger.copy()
+        for key in smaller.iter_keys():
+            result.insert(key)
+        return result
+
+    def intersection(self, other):
+        """returns a new set with the keys that are in this set and in the other set."""
+        if self.is_aligned_with(other):
+            return self.merge_buckets(other, lambda own, theirs: [key for key in own if key in theirs])
+        smaller, larger = (self, other) if self.get_table_size() <= other.get_table_size() else (other, self)
+        result = self.empty_copy()
+        for key in smaller.iter_keys():
+            if larger.contains(key):
+                result.insert(key)
+        return result
+
+    def difference(self, other):
+        """returns a new set with the keys of this set that are not in the other set."""
+        if self.is_aligned_with(other):
+            return self.merge_buckets(other, lambda own, theirs: [key for key in own if key not in theirs])
+        if other.get_table_size() < self.get_table_size():
+            result = self.copy()
+            for key in other.iter_keys():
+                result.remove(key)
+            return result
+        result = self.empty_copy()
+        for key in self.iter_keys():
+            if not other.contains(key):
+                result.insert(key)
+        return result
+
+    def issubset(self, other):
+        """returns True if every key of this set is also stored in the other set."""
+        if self.get_table_size() > other.get_table_size():
+            return False
+        if self.is_aligned_with(other):
+            own_table = self.get_hash_table()
+            other_table = other.get_hash_table()
+            for i in range(self.capacity):
+                theirs = self.chain_keys(other_table[i])
+                node = own_table[i]
+                while node is not None:
+                    if node.key not in theirs:
+                        return False
+                    node = node.next
+            return True
+        for key in self.iter_keys():
+            if not other.contains(key):
+                return False
+        return True
+
+    def freeze(self, load_factor=0.99):
+        """returns an immutable FrozenHashSet of the stored keys, compiled into a perfect hash so that every contains
+        needs at most two array lookups. Later changes to this set are not reflected in the frozen copy."""
+        return FrozenHashSet(self.iter_keys(), load_factor)
+
     def clear(self):
         """Removes all stored elements from the hash table by setting all nodes to None.
         """
@@ -135,13 +378,97 @@ class ChainingHashSet():
         """Returns a string representation of the hash table (array indices and stored keys) in the format
             Idx_0 {Node, Node, ... }, Idx_1 {...}
             e.g.: 0 {13}, 1 {82, 92, 12}, 2 {2, 32}, """
-        string_repr = ""
-        for i in range(len(self.get_hash_table())):
-            string_repr += str(i) + " {"
-            node = self.hash_table[i]
-            while node is not None:
-                string_repr += str(node.key) + ", "
-                node = node.next
-            string_repr = string_repr[:-2] + "}, "    #remove last ", " and replace with "}, "
-        string_repr = string_repr[:-2]                #remove last ", "
-        return string_repr
+        return ", ".join(self.iter_bucket_strings())
+
+    def iter_bucket_strings(self):
+        """Yields the to_string representation of one bucket after the other."""
+        hash_table = self.get_hash_table()
+        for i in range(len(hash_table)):
+            keys = self.chain_keys(hash_table[i])
+            if keys:
+                yield str(i) + " {" + ", ".join(map(str, keys)) + "}"
+            else:
+                yield str(i) + "}"    # same output as the original concatenation for empty buckets
+
+    def write_string(self, file):
+        """Writes to_string() to a text file object bucket by bucket, without building the whole string."""
+        separator = ""
+        for part in self.iter_bucket_strings():
+            file.write(separator)
+            file.write(part)
+            separator = ", "
+
+    def __iter__(self):
+        return self.iter_keys()
+
+    def dump(self, file):
+        """Writes all keys to a text file object: a header line with size and capacity, then one key per line.
+        The keys are streamed bucket by bucket, see load() for reading the file back.
+        """
+        file.write(self.DUMP_HEADER + " size=" + str(self.get_table_size()) + " capacity=" + str(self.capacity) + "\n")
+        for key in self.iter_keys():
+            file.write(str(key))
+            file.write("\n")
+
+    @classmethod
+    def load(cls, file, key_type=int, unique=True, max_load_factor=None, hash_function=None):
+        """Reads a set written by dump(). The table is pre-sized from the header.
+        :param file: Text file object positioned at the header line.
+        :param key_type: Function that converts a line (without newline) into a key.
+        :param unique: True if the file is known to contain no duplicates (files written by dump() never do).
+        :return: The new set, an instance of the class load is called on.
+        """
+        size, capacity = cls.read_dump_header(file)
+        capacity = max(1, capacity)
+        if max_load_factor is not None:
+            capacity = max(capacity, int(size / max_load_factor) + 1)
+        hash_set = cls(capacity=capacity, max_load_factor=max_load_factor, hash_function=hash_function)
+        hash_set.bulk_insert((key_type(line.rstrip("\n")) for line in file), unique)
+        return hash_set
+
+    @classmethod
+    def read_dump_header(cls, file):
+        """Reads the header line written by dump().
+        :return: (size, capacity) of the dumped set.
+        :raises ValueError: If the line is not a dump header.
+        """
+        header = file.readline().split()
+        if not header or header[0] != cls.DUMP_HEADER:
+            raise ValueError("Not a hash set dump")
+        fields = dict(field.split("=") for field in header[1:])
+        return int(fields["size"]), int(fields["capacity"])
+
+    def bulk_insert(self, keys, unique=False):
+        """Inserts many keys at once. If the number of keys is known, the table is resized once up front.
+        :param keys: Iterable of keys.
+        :param unique: True if the keys are known to be distinct and not yet stored. New nodes are then
+                       prepended to their chain without scanning it for duplicates. Subclasses that override
+                       insert() always go through insert().
+        :return: The number of inserted keys.
+        """
+        if hasattr(keys, "__len__"):
+            needed = self.table_size + len(keys)
+            if self.max_load_factor is not None and needed > self.max_load_factor * self.capacity:
+                self.rehash(int(needed / self.max_load_factor) + 1)
+            elif self.capacity == 0 and needed > 0:
+                self.rehash(needed)
+        if not unique or type(self).insert is not ChainingHashSet.insert:
+            inserted = 0
+            for key in keys:
+                if self.insert(key):
+                    inserted += 1
+            return inserted
+        hash_table = self.hash_table
+        inserted = 0
+        for key in keys:
+            if key is None:
+                raise ValueError()
+            hash = self.get_hash_code(key)
+            node = self.create_node(key)
+            node.next = hash_table[hash]
+            hash_table[hash] = node
+            inserted += 1
+        self.table_size += inserted
+        while self.grow_if_needed():
+            pass
+        return inserted
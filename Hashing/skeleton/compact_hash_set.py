@@ -0,0 +1,141 @@
+from array import array
+
+from chaining_hash_node import ChainingHashNode
+from chaining_hash_set import ChainingHashSet
+
+
+class CompactHashSet(ChainingHashSet):
+    """Chaining hash set where every bucket is one contiguous container instead of a linked list of nodes.
+
+    bucket_type "list" stores each bucket as a small Python list (any key type), "array" as a typed
+    array('q') (64-bit integer keys only). Scanning a bucket then runs inside the container's C implementation
+    instead of following .next pointers in Python. get_hash_table/set_hash_table translate from and to
+    ChainingHashNode chains, so to_string and the testing hooks work as before.
+    """
+    LIST = "list"
+    ARRAY = "array"
+
+    def __init__(self, capacity=0, max_load_factor=None, hash_function=None, bucket_type=LIST):
+        if bucket_type not in (self.LIST, self.ARRAY):
+            raise ValueError("Unknown bucket type: " + str(bucket_type))
+        super().__init__(capacity, max_load_factor, hash_function)
+        self.bucket_type = bucket_type
+
+    def new_bucket(self, key):
+        if self.bucket_type == self.ARRAY:
+            return array('q', (key,))
+        return [key]
+
+    def get_hash_table(self):
+        """(Required for testing only)
+        :return the hash table with every bucket converted into a ChainingHashNode chain.
+        """
+        hash_table = []
+        for bucket in self.hash_table:
+            head = None
+            if bucket is not None:
+                for key in reversed(bucket):
+                    node = ChainingHashNode(key)
+                    node.next = head
+                    head = node
+            hash_table.append(head)
+        return hash_table
+
+    def set_hash_table(self, table):
+        """(Required for testing only) Set a given hash table of ChainingHashNode chains.
+        :param table: Given hash table which shall be used.
+        """
+        self.hash_table = [None] * len(table)
+        self.capacity = len(table)
+        self.table_size = 0
+        for i in range(len(table)):
+            node = table[i]
+            while node is not None:
+                if self.hash_table[i] is None:
+                    self.hash_table[i] = self.new_bucket(node.key)
+                else:
+                    self.hash_table[i].append(node.key)
+                self.table_size += 1
+                node = node.next
+
+    def insert(self, key):
+        if key is None:
+            raise ValueError()
+        hash = self.bucket_index(key, True)
+        bucket = self.hash_table[hash]
+        if bucket is None:
+            self.hash_table[hash] = self.new_bucket(key)
+        elif key in bucket:
+            return False
+        else:
+            bucket.append(key)
+        self.table_size += 1
+        self.grow_if_needed()
+        return True
+
+    def contains(self, key):
+        if key is None:
+            raise ValueError()
+        hash = self.bucket_index(key)
+        if hash is None:
+            return self.record_lookup(key, False)
+        bucket = self.hash_table[hash]
+        return self.record_lookup(key, bucket is not None and key in bucket)
+
+    def count_probes(self, key):
+        hash = self.bucket_index(key)
+        bucket = None if hash is None else self.hash_table[hash]
+        if bucket is None:
+            return 0
+        return bucket.index(key) + 1 if key in bucket else len(bucket)
+
+    def remove(self, key):
+        if key is None:
+            raise ValueError()
+        hash = self.bucket_index(key)
+        if hash is None:
+            return False
+        bucket = self.hash_table[hash]
+        if bucket is None or key not in bucket:
+            return False
+        if len(bucket) == 1:
+            self.hash_table[hash] = None
+        else:
+            bucket.remove(key)
+        self.table_size -= 1
+        return True
+
+    def rehash(self, new_capacity):
+        old_table = self.hash_table
+        self.hash_table = [None] * new_capacity
+        self.capacity = new_capacity
+        for bucket in old_table:
+            if bucket is None:
+                continue
+            for key in bucket:
+                hash = self.get_hash_code(key)
+                if self.hash_table[hash] is None:
+                    self.hash_table[hash] = self.new_bucket(key)
+                else:
+                    self.hash_table[hash].append(key)
+        self.resize_count += 1
+
+
+class SlottedHashNode():
+    """ChainingHashNode without a per-instance __dict__."""
+    __slots__ = ("key", "next", "hash_value")
+
+    def __init__(self, key=None, hash_value=None):
+        self.key = key
+        self.next = None
+        self.hash_value = hash_value
+
+
+class SlottedHashSet(ChainingHashSet):
+    """ChainingHashSet that keeps the linked-list layout but allocates __slots__ nodes, for keys that fit neither
+    layout of CompactHashSet."""
+
+    def create_node(self, key):
+        if self.hash_function is not None and self.hash_function.cache_hash:
+            return SlottedHashNode(key, self.hash_function.prehash(key))
+        return SlottedHashNode(key)
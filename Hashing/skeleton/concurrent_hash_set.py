@@ -0,0 +1,197 @@
+import threading
+
+from chaining_hash_set import ChainingHashSet
+
+
+class ConcurrentHashSet(ChainingHashSet):
+    """Thread-safe ChainingHashSet using lock striping: bucket i is guarded by lock i % stripes, so threads working
+    on different stripes do not block each other. Every stripe keeps its own key counter (the table_size of the base
+    class stays unused), and insert grows the table as soon as its own stripe exceeds max_load_factor, so no
+    operation has to sum the counters of all stripes.
+
+    Resize protocol: the resizing thread acquires all stripe locks in ascending order. An operation computes its
+    bucket, takes the stripe lock and then checks that the table has not been replaced in the meantime; if it
+    has, it releases the lock and retries with the new table.
+    """
+
+    def __init__(self, capacity=16, max_load_factor=0.75, hash_function=None, stripes=16):
+        super().__init__(max(capacity, 1), max_load_factor, hash_function)
+        self.locks = [threading.Lock() for _ in range(stripes)]
+        self.stripe_sizes = [0] * stripes
+
+    def acquire_all(self):
+        for lock in self.locks:
+            lock.acquire()
+
+    def release_all(self):
+        for lock in reversed(self.locks):
+            lock.release()
+
+    def lock_bucket(self, key):
+        """Acquires the stripe lock of the key's bucket in the current table.
+        :return: (table, hash, stripe), the stripe lock is held by the caller afterwards.
+        """
+        while True:
+            table = self.hash_table
+            hash = self.compute_hash_code(key, len(table))
+            stripe = hash % len(self.locks)
+            self.locks[stripe].acquire()
+            if table is self.hash_table:
+                return table, hash, stripe
+            self.locks[stripe].release()
+
+    def compute_hash_code(self, key, capacity):
+        """Hash code of the key for a table with the given capacity."""
+        if self.hash_function is None:
+            return key % capacity
+        return self.hash_function(key, capacity)
+
+    def get_table_size(self):
+        """returns the number of stored keys (keys must be unique!)."""
+        return sum(self.stripe_sizes)
+
+    def stripe_overloaded(self, stripe, capacity):
+        """returns True if the stripe holds more keys than max_load_factor allows for its buckets of a table with the
+        given capacity (caller holds the stripe lock)."""
+        if self.max_load_factor is None:
+            return False
+        buckets = (capacity - stripe + len(self.locks) - 1) // len(self.locks)
+        return self.stripe_sizes[stripe] > self.max_load_factor * buckets
+
+    def get_load_factor(self):
+        return self.get_table_size() / self.capacity
+
+    def get_hash_table(self):
+        """(Required for testing only)
+        :return the hash table.
+        """
+        self.acquire_all()
+        try:
+            return self.hash_table
+        finally:
+            self.release_all()
+
+    def set_hash_table(self, table):
+        """(Required for testing only) Set a given hash table..
+        :param table: Given hash table which shall be used.
+        """
+        self.acquire_all()
+        try:
+            super().set_hash_table(table)
+            self.count_stripes()
+        finally:
+            self.release_all()
+
+    def count_stripes(self):
+        """Recounts the keys per stripe (caller holds all locks)."""
+        self.stripe_sizes = [0] * len(self.locks)
+        for i in range(self.capacity):
+            node = self.hash_table[i]
+            while node is not None:
+                self.stripe_sizes[i % len(self.locks)] += 1
+                node = node.next
+
+    def insert(self, key):
+        if key is None:
+            raise ValueError()
+        table, hash, stripe = self.lock_bucket(key)
+        try:
+            node = table[hash]
+            if node is None:
+                table[hash] = self.create_node(key)
+            else:
+                while True:
+                    if node.key == key:
+                        return False
+                    if node.next is None:
+                        node.next = self.create_node(key)
+                        break
+                    node = node.next
+            self.stripe_sizes[stripe] += 1
+            overloaded = self.stripe_overloaded(stripe, len(table))
+        finally:
+            self.locks[stripe].release()
+        if overloaded:
+            self.grow(len(table))
+        return True
+
+    def contains(self, key):
+        if key is None:
+            raise ValueError()
+        table, hash, stripe = self.lock_bucket(key)
+        try:
+            node = table[hash]
+            while node is not None:
+                if node.key == key:
+                    return self.record_lookup(key, True)
+                node = node.next
+            return self.record_lookup(key, False)
+        finally:
+            self.locks[stripe].release()
+
+    def remove(self, key):
+        if key is None:
+            raise ValueError()
+        table, hash, stripe = self.lock_bucket(key)
+        try:
+            previous = None
+            node = table[hash]
+            while node is not None:
+                if node.key == key:
+                    if previous is None:
+                        table[hash] = node.next
+                    else:
+                        previous.next = node.next
+                    self.stripe_sizes[stripe] -= 1
+                    return True
+                previous = node
+                node = node.next
+            return False
+        finally:
+            self.locks[stripe].release()
+
+    def grow_if_needed(self):
+        if self.max_load_factor is None or self.get_table_size() <= self.max_load_factor * self.capacity:
+            return False
+        return self.grow(self.capacity)
+
+    def grow(self, capacity):
+        """Doubles a table that had the given capacity.
+        :return: True if resized, False if another thread has resized it already.
+        """
+        self.acquire_all()
+        try:
+            # another thread may have resized while we were waiting for the locks
+            if self.capacity != capacity:
+                return False
+            self.rehash(2 * capacity)
+            self.count_stripes()
+            return True
+        finally:
+            self.release_all()
+
+    def bulk_insert(self, keys, unique=False):
+        """Like ChainingHashSet.bulk_insert, but presizes the table under all stripe locks and inserts every key
+        through insert(), so other threads can keep using the set."""
+        if hasattr(keys, "__len__") and self.max_load_factor is not None:
+            self.acquire_all()
+            try:
+                needed = sum(self.stripe_sizes) + len(keys)
+                if needed > self.max_load_factor * self.capacity:
+                    self.rehash(int(needed / self.max_load_factor) + 1)
+                    self.count_stripes()
+            finally:
+                self.release_all()
+        inserted = 0
+        for key in keys:
+            if self.insert(key):
+                inserted += 1
+        return inserted
+
+    def clear(self):
+        self.acquire_all()
+        try:
+            self.hash_table = [None] * self.capacity
+            self.stripe_sizes = [0] * len(self.locks)
+        finally:
+            self.release_all()
@@ -0,0 +1,153 @@
+import random
+
+from hash_functions import UniversalHash
+
+
+class CuckooHashSet():
+    """Bucketized cuckoo hash set: every key has one candidate bucket in each of `tables` tables, and every bucket
+    holds up to `slots` keys. A key is always stored in one of its candidate buckets or in a small stash, so
+    contains inspects at most tables * slots + stash_size slots.
+
+    Inserting into full candidate buckets evicts a random resident key to one of its other buckets, up to
+    max_kicks times. If that fails, the key goes to the stash; if the stash is full as well (a cycle), all keys
+    are rehashed with freshly seeded hash functions (and a larger table if the load is high).
+    """
+
+    def __init__(self, capacity=16, tables=2, slots=4, stash_size=4, max_load_factor=0.9, max_kicks=500,
+                 seed=None):
+        self.tables = tables
+        self.slots = slots
+        self.stash_size = stash_size
+        self.max_load_factor = max_load_factor
+        self.max_kicks = max_kicks
+        self.rng = random.Random(seed)
+        self.table_size = 0
+        self.rehash_count = 0
+        self.allocate(max(1, -(-capacity // (tables * slots))))
+
+    def allocate(self, buckets):
+        """Creates empty tables with the given number of buckets each and draws new hash functions."""
+        self.buckets = buckets
+        self.capacity = buckets * self.tables * self.slots
+        self.hash_table = [[None] * (buckets * self.slots) for _ in range(self.tables)]
+        self.hash_functions = [UniversalHash(self.rng.getrandbits(64)) for _ in range(self.tables)]
+        self.stash = []
+
+    def get_hash_code(self, key, table=0):
+        """returns the candidate bucket of the key in the given table."""
+        return self.hash_functions[table](key, self.buckets)
+
+    def get_hash_table(self):
+        """(Required for testing only)
+        :return the list of tables, every table a flat list of slots (None for empty slots).
+        """
+        return self.hash_table
+
+    def get_table_size(self):
+        """returns the number of stored keys (keys must be unique!)."""
+        return self.table_size
+
+    def get_max_probes(self):
+        """returns the maximum number of slots a contains call inspects."""
+        return self.tables * self.slots + self.stash_size
+
+    def contains(self, key):
+        """Searches for a given key in its candidate buckets and the stash.
+         :raises:
+         	    a ValueError if the key is None.
+         """
+        if key is None:
+            raise ValueError()
+        prime = UniversalHash.PRIME
+        for slots, hash_function in zip(self.hash_table, self.hash_functions):
+            start = ((hash_function.a * key + hash_function.b) % prime) % self.buckets * self.slots
+            if key in slots[start:start + self.slots]:
+                return True
+        return key in self.stash
+
+    def insert(self, key):
+        """Inserts a key and returns True if it was not stored yet.
+         :raises:
+         		a ValueError if the key is None.
+         """
+        if key is None:
+            raise ValueError()
+        if self.contains(key):
+            return False
+        if self.table_size + 1 > self.max_load_factor * self.capacity:
+            self.rehash(2 * self.buckets)
+        self.table_size += 1
+        left_over = self.place(key)
+        if left_over is not None:
+            self.stash.append(left_over)
+            if len(self.stash) > self.stash_size:
+                # cycle and full stash: new hash functions, more space if the table is reasonably full
+                self.rehash(2 * self.buckets if self.table_size > self.capacity // 2 else self.buckets)
+        return True
+
+    def place_free(self, key):
+        """Stores a key in a free slot of one of its candidate buckets, returns False if all are full."""
+        for table in range(self.tables):
+            slots = self.hash_table[table]
+            start = self.get_hash_code(key, table) * self.slots
+            for i in range(start, start + self.slots):
+                if slots[i] is None:
+                    slots[i] = key
+                    return True
+        return False
+
+    def place(self, key):
+        """Stores a key by evicting residents (cuckoo kicks).
+        :return: None if everything has been placed, otherwise the key left over after max_kicks evictions.
+        """
+        for _ in range(self.max_kicks):
+            if self.place_free(key):
+                return None
+            table = self.rng.randrange(self.tables)
+            start = self.get_hash_code(key, table) * self.slots
+            victim = start + self.rng.randrange(self.slots)
+            key, self.hash_table[table][victim] = self.hash_table[table][victim], key
+        return key
+
+    def rehash(self, buckets):
+        """Re-inserts all keys into new tables with the given number of buckets and new hash functions."""
+        keys = [key for table in self.hash_table for key in table if key is not None] + self.stash
+        while True:
+            self.allocate(buckets)
+            self.rehash_count += 1
+            left_over = []
+            for key in keys:
+                rest = self.place(key)  # the key evicted last, not necessarily the one passed in
+                if rest is not None:
+                    left_over.append(rest)
+            if len(left_over) <= self.stash_size:
+                self.stash = left_over
+                return
+            buckets *= 2
+
+    def remove(self, key):
+        """Removes the key and returns True on success, False otherwise.
+         :raises:
+         	a ValueError if the key is None.
+         """
+        if key is None:
+            raise ValueError()
+        for table in range(self.tables):
+            slots = self.hash_table[table]
+            start = self.get_hash_code(key, table) * self.slots
+            for i in range(start, start + self.slots):
+                if slots[i] == key:
+                    slots[i] = None
+                    self.table_size -= 1
+                    self.stash = [stashed for stashed in self.stash if not self.place_free(stashed)]
+                    return True
+        if key in self.stash:
+            self.stash.remove(key)
+            self.table_size -= 1
+            return True
+        return False
+
+    def clear(self):
+        """Removes all stored elements, keeping the current capacity."""
+        self.allocate(self.buckets)
+        self.table_size = 0
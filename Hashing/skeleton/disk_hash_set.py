@@ -0,0 +1,199 @@
+import mmap
+import os
+import struct
+from array import array
+
+from hash_functions import MASK_64, mix
+
+
+class DiskHashSet():
+    """Disk-resident hash set for 64-bit integer keys using extendible hashing over fixed-size pages of a
+    memory-mapped file.
+
+    File layout: page 0 is the header, every further page is one bucket holding its local depth, its key count and
+    up to (page_size - 8) / 8 keys. The directory (2^global_depth page numbers) is kept in memory and stored in a
+    sidecar file "<path>.dir" by flush()/close(). A lookup reads the directory entry of the key and then touches
+    exactly one page; a full bucket is split locally into two pages (doubling only the in-memory directory if
+    needed), the rest of the file is never rewritten.
+
+    Durability: bucket pages are written in place, but header and directory only reach the disk on flush()/close().
+    If the process dies in between, the file holds pages that the stored directory does not describe, so all
+    changes since the last flush() are lost; call flush() after every batch that must survive a crash.
+    """
+    MAGIC = b"EXTHASH2"
+    HEADER = struct.Struct("<8sIIQQ")   # magic, page_size, global_depth, table_size, page_count
+    PAGE_HEADER = struct.Struct("<II")  # local_depth, key count
+
+    def __init__(self, path, page_size=4096):
+        self.path = path
+        self.directory_path = path + ".dir"
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if not exists and (page_size < 16 or page_size % 8 != 0):
+            raise ValueError("page_size must be a multiple of 8 and at least 16")
+        self.file = open(path, "r+b" if exists else "w+b")
+        self.mm = None
+        try:
+            if exists:
+                self.mm = mmap.mmap(self.file.fileno(), 0)
+                if self.mm[:len(self.MAGIC)] != self.MAGIC or len(self.mm) < self.HEADER.size:
+                    raise ValueError("Not a DiskHashSet file: " + path)
+                _, self.page_size, self.global_depth, self.table_size, self.page_count = \
+                    self.HEADER.unpack_from(self.mm, 0)
+                self.directory = array('Q')
+                with open(self.directory_path, "rb") as directory_file:
+                    self.directory.fromfile(directory_file, 1 << self.global_depth)
+            else:
+                self.page_size = page_size
+                self.file.truncate(4 * page_size)
+                self.mm = mmap.mmap(self.file.fileno(), 0)
+                self.reset()
+        except BaseException:
+            if self.mm is not None:
+                self.mm.close()
+                self.mm = None
+            self.file.close()
+            raise
+        self.page_capacity = (self.page_size - self.PAGE_HEADER.size) // 8
+
+    def reset(self):
+        """Initializes an empty set: one bucket page with local depth 0."""
+        self.global_depth = 0
+        self.table_size = 0
+        self.page_count = 0
+        self.directory = array('Q', [self.new_page(0)])
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def flush(self):
+        """Writes header and directory and flushes the mapped pages to disk."""
+        self.HEADER.pack_into(self.mm, 0, self.MAGIC, self.page_size, self.global_depth, self.table_size,
+                              self.page_count)
+        with open(self.directory_path, "wb") as directory_file:
+            self.directory.tofile(directory_file)
+        self.mm.flush()
+
+    def close(self):
+        if self.mm is None:
+            return
+        self.flush()
+        self.mm.close()
+        self.file.close()
+        self.mm = None
+
+    def get_hash_code(self, key):
+        """Returns the directory index of a key: the lowest global_depth bits of its hash."""
+        return self.hash(key) & ((1 << self.global_depth) - 1)
+
+    def hash(self, key):
+        # fully mixed, so that keys sharing their low bits (e.g. multiples of 2^20) still differ in the low bits
+        # of the hash that select the directory entry
+        return mix(key & MASK_64)
+
+    def get_table_size(self):
+        """returns the number of stored keys (keys must be unique!)."""
+        return self.table_size
+
+    def get_page_count(self):
+        """returns the number of bucket pages."""
+        return self.page_count
+
+    def new_page(self, local_depth):
+        """Appends an empty bucket page (growing the file if needed) and returns its page number."""
+        self.page_count += 1
+        offset = self.page_count * self.page_size
+        if offset + self.page_size > len(self.mm):
+            self.mm.resize(2 * len(self.mm))
+        self.PAGE_HEADER.pack_into(self.mm, offset, local_depth, 0)
+        return self.page_count
+
+    def read_page(self, page):
+        """returns (local_depth, keys) of a bucket page."""
+        offset = page * self.page_size
+        local_depth, count = self.PAGE_HEADER.unpack_from(self.mm, offset)
+        keys = struct.unpack_from("<" + str(count) + "q", self.mm, offset + self.PAGE_HEADER.size)
+        return local_depth, keys
+
+    def write_page(self, page, local_depth, keys):
+        offset = page * self.page_size
+        self.PAGE_HEADER.pack_into(self.mm, offset, local_depth, len(keys))
+        struct.pack_into("<" + str(len(keys)) + "q", self.mm, offset + self.PAGE_HEADER.size, *keys)
+
+    def contains(self, key):
+        """Searches for a given key, touching a single page.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        return key in self.read_page(self.directory[self.get_hash_code(key)])[1]
+
+    def insert(self, key):
+        """Inserts a key and returns True if it was not stored yet. A full bucket is split first.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        while True:
+            page = self.directory[self.get_hash_code(key)]
+            local_depth, keys = self.read_page(page)
+            if key in keys:
+                return False
+            if len(keys) < self.page_capacity:
+                offset = page * self.page_size
+                self.PAGE_HEADER.pack_into(self.mm, offset, local_depth, len(keys) + 1)
+                struct.pack_into("<q", self.mm, offset + self.PAGE_HEADER.size + 8 * len(keys), key)
+                self.table_size += 1
+                return True
+            self.split(page, local_depth, keys)
+
+    def split(self, page, local_depth, keys):
+        """Splits a full bucket page on bit local_depth of the key hashes."""
+        if local_depth == self.global_depth:
+            self.directory.extend(self.directory)
+            self.global_depth += 1
+        sibling = self.new_page(local_depth + 1)
+        bit = 1 << local_depth
+        self.write_page(page, local_depth + 1, [key for key in keys if not self.hash(key) & bit])
+        self.write_page(sibling, local_depth + 1, [key for key in keys if self.hash(key) & bit])
+        # the directory entries of the page share its lowest local_depth bits, those with the new bit set move
+        low_bits = self.hash(keys[0]) & (bit - 1)
+        for i in range(low_bits + bit, len(self.directory), 2 * bit):
+            self.directory[i] = sibling
+
+    def remove(self, key):
+        """Removes the key and returns True on success, False otherwise (buckets are not merged).
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        page = self.directory[self.get_hash_code(key)]
+        local_depth, keys = self.read_page(page)
+        if key not in keys:
+            return False
+        keys = list(keys)
+        index = keys.index(key)
+        keys[index] = keys[-1]
+        keys.pop()
+        self.write_page(page, local_depth, keys)
+        self.table_size -= 1
+        return True
+
+    def clear(self):
+        """Removes all keys and shrinks the file back to a single bucket page."""
+        self.mm.resize(4 * self.page_size)
+        self.reset()
+
+    def iter_keys(self):
+        """Yields all stored keys page by page."""
+        for page in range(1, self.page_count + 1):
+            yield from self.read_page(page)[1]
+
+    def __iter__(self):
+        return self.iter_keys()
@@ -0,0 +1,107 @@
+from array import array
+
+from hash_functions import MASK_64, mix
+
+GOLDEN = 0x9E3779B97F4A7C15
+
+
+class FrozenHashSet():
+    """Immutable set built with CHD-style hash-and-displace perfect hashing.
+
+    The keys are grouped into about n / bucket_size first-level buckets. Largest buckets first, every bucket gets
+    the smallest displacement d for which all of its keys land in distinct free slots of the slot array. contains
+    then reads one displacement and one slot: the result never depends on collisions or chain lengths.
+    With load_factor=1.0 the slot array has exactly n entries (a minimal perfect hash); slightly lower values
+    make the build much faster because the last buckets still find free slots quickly.
+
+    Storage is two flat arrays: displacements (array('I')) and slots, an array('q') if every key is a 64-bit
+    integer and a list otherwise. Empty slots hold a copy of some stored key, so no occupancy array is needed.
+    """
+    MAX_DISPLACEMENT = 1 << 24
+
+    def __init__(self, keys, load_factor=0.99, bucket_size=3):
+        keys = list(dict.fromkeys(keys))
+        if any(key is None for key in keys):
+            raise ValueError()
+        self.table_size = len(keys)
+        self.capacity = max(1, int(len(keys) / load_factor))
+        self.bucket_count = max(1, -(-len(keys) // bucket_size))
+        self.displacements = array('I', [0]) * self.bucket_count
+        buckets = [[] for _ in range(self.bucket_count)]
+        for key in keys:
+            buckets[self.prehash(key) % self.bucket_count].append(key)
+        slots = [None] * self.capacity
+        order = sorted(range(self.bucket_count), key=lambda b: len(buckets[b]), reverse=True)
+        for bucket in order:
+            members = buckets[bucket]
+            if not members:
+                break
+            hashes = [self.prehash(key) for key in members]
+            for displacement in range(self.MAX_DISPLACEMENT):
+                positions = self.place(hashes, displacement, slots)
+                if positions is not None:
+                    break
+            else:
+                raise ValueError("No displacement found, use a lower load_factor")
+            self.displacements[bucket] = displacement
+            for key, position in zip(members, positions):
+                slots[position] = key
+        filler = keys[0] if keys else 0  # an empty set keeps one unused 0 slot, see contains
+        slots = [filler if key is None else key for key in slots]
+        try:
+            self.slots = array('q', slots)
+        except (OverflowError, TypeError):
+            self.slots = slots
+
+    def place(self, hashes, displacement, slots):
+        """returns the slots of the hashes for a displacement, or None on the first clash with a used slot."""
+        positions = []
+        for hash_value in hashes:
+            position = self.slot_of(hash_value, displacement)
+            if slots[position] is not None or position in positions:
+                return None
+            positions.append(position)
+        return positions
+
+    @staticmethod
+    def prehash(key):
+        return mix(hash(key) & MASK_64)
+
+    def slot_of(self, hash_value, displacement):
+        return ((hash_value ^ displacement * GOLDEN) * GOLDEN & MASK_64) * self.capacity >> 64
+
+    def get_hash_code(self, key):
+        """returns the slot index of a key (the perfect hash value for stored keys)."""
+        hash_value = self.prehash(key)
+        return self.slot_of(hash_value, self.displacements[hash_value % self.bucket_count])
+
+    def get_table_size(self):
+        """returns the number of stored keys."""
+        return self.table_size
+
+    def contains(self, key):
+        """Searches for a given key with one displacement lookup and one slot lookup.
+         :raises:
+         	    a ValueError if the key is None.
+         """
+        if key is None:
+            raise ValueError()
+        if self.table_size == 0:
+            return False
+        hash_value = mix(hash(key) & MASK_64)
+        displacement = self.displacements[hash_value % self.bucket_count]
+        return self.slots[((hash_value ^ displacement * GOLDEN) * GOLDEN & MASK_64) * self.capacity >> 64] == key
+
+    def iter_keys(self):
+        """Yields all stored keys."""
+        if self.table_size == 0:
+            return
+        filler = self.slots[0]
+        yield filler
+        for i, key in enumerate(self.slots):
+            # skip the copies in empty slots
+            if key != filler and self.get_hash_code(key) == i:
+                yield key
+
+    def __iter__(self):
+        return self.iter_keys()
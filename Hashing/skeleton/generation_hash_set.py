@@ -0,0 +1,75 @@
+from chaining_hash_set import ChainingHashSet
+
+
+class GenerationHashSet(ChainingHashSet):
+    """ChainingHashSet with O(1) clear: every bucket remembers the generation it was last written in, and clear()
+    only increments the current generation. Buckets from an older generation are treated as empty and are
+    overwritten lazily on the next insert into them (until then their old chains stay referenced)."""
+
+    def __init__(self, capacity=0, max_load_factor=None, hash_function=None):
+        super().__init__(capacity, max_load_factor, hash_function)
+        self.generation = 0
+        self.bucket_generations = [0] * capacity
+
+    def get_hash_table(self):
+        """(Required for testing only)
+        :return the hash table, buckets of older generations are returned as None.
+        """
+        generation = self.generation
+        return [node if bucket_generation == generation else None
+                for node, bucket_generation in zip(self.hash_table, self.bucket_generations)]
+
+    def set_hash_table(self, table):
+        super().set_hash_table(table)
+        self.bucket_generations = [self.generation] * self.capacity
+
+    def insert(self, key):
+        if key is None:
+            raise ValueError()
+        hash = self.bucket_index(key, True)
+        if self.bucket_generations[hash] != self.generation or self.hash_table[hash] is None:
+            self.hash_table[hash] = self.create_node(key)
+            self.bucket_generations[hash] = self.generation
+        else:
+            node = self.hash_table[hash]
+            while True:
+                if node.key == key:
+                    return False
+                if node.next is None:
+                    node.next = self.create_node(key)
+                    break
+                node = node.next
+        self.table_size += 1
+        self.grow_if_needed()
+        return True
+
+    def contains(self, key):
+        if key is None:
+            raise ValueError()
+        hash = self.bucket_index(key)
+        if hash is None or self.bucket_generations[hash] != self.generation:
+            return self.record_lookup(key, False, 0)
+        node = self.hash_table[hash]
+        while node is not None:
+            if node.key == key:
+                return self.record_lookup(key, True)
+            node = node.next
+        return self.record_lookup(key, False)
+
+    def remove(self, key):
+        if key is None:
+            raise ValueError()
+        hash = self.bucket_index(key)
+        if hash is None or self.bucket_generations[hash] != self.generation:
+            return False
+        return super().remove(key)
+
+    def rehash(self, new_capacity):
+        self.hash_table = self.get_hash_table()
+        super().rehash(new_capacity)
+        self.bucket_generations = [self.generation] * new_capacity
+
+    def clear(self):
+        """Removes all stored elements in O(1) by starting a new generation."""
+        self.generation += 1
+        self.table_size = 0
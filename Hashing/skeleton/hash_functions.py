@@ -0,0 +1,74 @@
+import random
+
+MASK_64 = (1 << 64) - 1
+
+
+def mix(z):
+    """64-bit finalizer of splitmix64: a bijection on 64-bit values in which every input bit affects every output
+    bit."""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return z ^ (z >> 31)
+
+
+class ModuloHash():
+    """key % capacity, the default hash function of ChainingHashSet (integer keys only)."""
+    cache_hash = False  # True if nodes should remember prehash(key) so that resizing does not hash again
+
+    def prehash(self, key):
+        """Maps a key to an integer hash value that is independent of the capacity."""
+        return key
+
+    def index(self, hash_value, capacity):
+        """Maps a hash value to a bucket index in range(capacity)."""
+        return hash_value % capacity
+
+    def __call__(self, key, capacity):
+        return self.index(self.prehash(key), capacity)
+
+    def __eq__(self, other):
+        # equal hash functions place every key into the same bucket
+        return type(self) is type(other) and vars(self) == vars(other)
+
+    def __hash__(self):
+        return hash((type(self), tuple(sorted(vars(self).items()))))
+
+
+class FibonacciHash(ModuloHash):
+    """Multiplicative (Fibonacci) hashing: the key is multiplied by 2^64 / golden ratio and the high bits of the
+    64-bit product select the bucket, so keys sharing low-order structure (e.g. multiples of 10) still spread
+    evenly. Works for any capacity, not only powers of two."""
+    MULTIPLIER = 0x9E3779B97F4A7C15
+
+    def index(self, hash_value, capacity):
+        return (((hash_value & MASK_64) * self.MULTIPLIER & MASK_64) * capacity) >> 64
+
+
+class UniversalHash(ModuloHash):
+    """Carter-Wegman universal hashing ((a * key + b) mod p) mod capacity with p = 2^61 - 1.
+    a and b are drawn from a random generator seeded with the given seed."""
+    PRIME = (1 << 61) - 1
+
+    def __init__(self, seed=None):
+        rng = random.Random(seed)
+        self.a = rng.randrange(1, self.PRIME)
+        self.b = rng.randrange(0, self.PRIME)
+
+    def index(self, hash_value, capacity):
+        return ((self.a * hash_value + self.b) % self.PRIME) % capacity
+
+
+class GenericHash(ModuloHash):
+    """Hash function for arbitrary hashable keys: prehash is Python's hash(key), which is then distributed by an
+    inner integer hash function (FibonacciHash by default). Nodes cache the prehash value, so a resize does not
+    call hash() on the keys again."""
+    cache_hash = True
+
+    def __init__(self, inner=None):
+        self.inner = inner if inner is not None else FibonacciHash()
+
+    def prehash(self, key):
+        return hash(key) & MASK_64
+
+    def index(self, hash_value, capacity):
+        return self.inner.index(hash_value, capacity)
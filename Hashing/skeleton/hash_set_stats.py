@@ -0,0 +1,54 @@
+class HashSetStats():
+    """Lookup counters of a ChainingHashSet (see ChainingHashSet.enable_stats). Table-shape figures (load factor,
+    chain lengths) are computed on demand by ChainingHashSet.get_stats, so they cost nothing per operation."""
+
+    def __init__(self):
+        self.hit_count = 0      # successful contains calls
+        self.hit_probes = 0     # nodes compared by successful contains calls
+        self.miss_count = 0     # unsuccessful contains calls
+        self.miss_probes = 0    # nodes compared by unsuccessful contains calls
+
+    def record_lookup(self, node, key):
+        """Searches the chain starting at node for the key and records the number of compared nodes.
+        :return: True if the key has been found.
+        """
+        probes = 0
+        while node is not None:
+            probes += 1
+            if node.key == key:
+                return self.record(probes, True)
+            node = node.next
+        return self.record(probes, False)
+
+    def record(self, probes, found):
+        """Counts one contains call that compared the given number of keys.
+        :return: found
+        """
+        if found:
+            self.hit_count += 1
+            self.hit_probes += probes
+        else:
+            self.miss_count += 1
+            self.miss_probes += probes
+        return found
+
+    def get_average_hit_probes(self):
+        return self.hit_probes / self.hit_count if self.hit_count else 0.0
+
+    def get_average_miss_probes(self):
+        return self.miss_probes / self.miss_count if self.miss_count else 0.0
+
+    def reset(self):
+        self.__init__()
+
+
+def chain_length_histogram(hash_table):
+    """returns {chain length: number of buckets} for a table of ChainingHashNode chains."""
+    histogram = {}
+    for node in hash_table:
+        length = 0
+        while node is not None:
+            length += 1
+            node = node.next
+        histogram[length] = histogram.get(length, 0) + 1
+    return histogram
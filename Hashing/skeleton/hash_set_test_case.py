@@ -0,0 +1,43 @@
+import random
+import unittest
+
+
+class HashSetTestCase(unittest.TestCase):
+    def assert_matches_builtin(self, factory, keyspace, steps, seed, after_step=None):
+        """Runs random insert/contains/remove operations on a new set and on a built-in set and checks that every
+        answer and the size after each step agree, and that all expected keys are stored at the end.
+        :param factory: function returning the (empty) set to test.
+        :param keyspace: keys are drawn from range(keyspace), or with keyspace(rng) if it is a function.
+        :param after_step: optional function(step, stud_set, expected) for feature-specific checks after each step.
+        :return the tested set and the built-in set with the expected keys.
+        """
+        stud_set = factory()
+        expected = set()
+        rng = random.Random(seed)
+        for step in range(steps):
+            key = keyspace(rng) if callable(keyspace) else rng.randrange(keyspace)
+            operation = rng.randrange(3)
+            if operation == 0:
+                self.assertEqual(key not in expected, stud_set.insert(key))
+                expected.add(key)
+            elif operation == 1:
+                self.assertEqual(key in expected, stud_set.contains(key))
+            else:
+                self.assertEqual(key in expected, stud_set.remove(key))
+                expected.discard(key)
+            self.assertEqual(len(expected), stud_set.get_table_size())
+            if after_step is not None:
+                after_step(step, stud_set, expected)
+        self.assertTrue(all(stud_set.contains(key) for key in expected))
+        return stud_set, expected
+
+    def assert_starts_empty(self, stud_set):
+        """Checks that a set constructed with capacity 0 answers lookups and grows on its first insert."""
+        self.assertFalse(stud_set.contains(1))
+        self.assertFalse(stud_set.remove(1))
+        for key in range(50):
+            self.assertTrue(stud_set.insert(key))
+        self.assertEqual(50, stud_set.get_table_size())
+        self.assertTrue(all(stud_set.contains(key) for key in range(50)))
+        self.assertTrue(stud_set.remove(7))
+        self.assertFalse(stud_set.contains(7))
@@ -0,0 +1,127 @@
+from chaining_hash_set import ChainingHashSet
+
+
+class IncrementalHashSet(ChainingHashSet):
+    """ChainingHashSet that resizes incrementally: on a resize the old and the new hash table are kept side by side
+    and every insert/contains/remove migrates a bounded number of old buckets, so no single operation has to move
+    the whole table."""
+
+    def __init__(self, capacity=0, max_load_factor=0.75, hash_function=None, migrate_buckets=4):
+        super().__init__(capacity, max_load_factor, hash_function)
+        self.migrate_buckets = migrate_buckets  # number of old buckets moved per operation
+        self.old_table = None                   # table that is being migrated, None if no resize is in progress
+        self.old_capacity = 0
+        self.migrate_index = 0                  # all old buckets below this index have already been migrated
+
+    def is_rehashing(self):
+        """returns True while an incremental resize is in progress."""
+        return self.old_table is not None
+
+    def get_old_hash_code(self, key):
+        """Hash function for the table that is being migrated.
+        :param key:
+        		Key for which a hash code shall be calculated according to the length of the old hash table.
+        :return:
+        		The calculated hash code for the given key.
+        """
+        if self.hash_function is None:
+            return key % self.old_capacity
+        return self.hash_function(key, self.old_capacity)
+
+    def rehash(self, new_capacity):
+        """Starts an incremental resize to the given capacity. If a previous resize is still in progress, it is
+        finished first.
+        :param new_capacity:
+        		Number of buckets of the new hash table.
+        """
+        self.finish_rehash()
+        if self.table_size == 0:
+            # nothing to migrate (this also covers growing an empty table of capacity 0)
+            self.hash_table = [None] * new_capacity
+            self.capacity = new_capacity
+            self.resize_count += 1
+            return
+        self.old_table = self.hash_table
+        self.old_capacity = self.capacity
+        self.migrate_index = 0
+        self.hash_table = [None] * new_capacity
+        self.capacity = new_capacity
+        self.resize_count += 1
+
+    def migrate_bucket(self, index):
+        """Moves all nodes of the old bucket at the given index into the new hash table."""
+        node = self.old_table[index]
+        self.old_table[index] = None
+        while node is not None:
+            next_node = node.next
+            hash = self.get_node_hash_code(node)
+            node.next = self.hash_table[hash]
+            self.hash_table[hash] = node
+            node = next_node
+
+    def rehash_step(self, key=None):
+        """Performs one bounded migration step. The old bucket of the given key is migrated first, so the operation
+        on the key only has to look at the new hash table.
+        :param key:
+        		Key of the current operation, or None.
+        """
+        if self.old_table is None:
+            return
+        if key is not None:
+            self.migrate_bucket(self.get_old_hash_code(key))
+        end = min(self.migrate_index + self.migrate_buckets, self.old_capacity)
+        for i in range(self.migrate_index, end):
+            if self.old_table[i] is not None:
+                self.migrate_bucket(i)
+        self.migrate_index = end
+        if self.migrate_index == self.old_capacity:
+            self.old_table = None
+            self.old_capacity = 0
+
+    def finish_rehash(self):
+        """Migrates all remaining old buckets at once."""
+        if self.old_table is None:
+            return
+        for i in range(self.migrate_index, self.old_capacity):
+            if self.old_table[i] is not None:
+                self.migrate_bucket(i)
+        self.old_table = None
+        self.old_capacity = 0
+
+    def get_hash_table(self):
+        """(Required for testing only)
+        :return the hash table (a running resize is finished first).
+        """
+        self.finish_rehash()
+        return self.hash_table
+
+    def set_hash_table(self, table):
+        """(Required for testing only) Set a given hash table and cancel a running resize.
+        :param table: Given hash table which shall be used.
+        """
+        self.old_table = None
+        self.old_capacity = 0
+        super().set_hash_table(table)
+
+    def insert(self, key):
+        if key is None:
+            raise ValueError()
+        self.rehash_step(key)
+        return super().insert(key)
+
+    def contains(self, key):
+        if key is None:
+            raise ValueError()
+        self.rehash_step(key)
+        return super().contains(key)
+
+    def remove(self, key):
+        if key is None:
+            raise ValueError()
+        self.rehash_step(key)
+        return super().remove(key)
+
+    def clear(self):
+        self.old_table = None
+        self.old_capacity = 0
+        super().clear()
@@ -0,0 +1,111 @@
+from chaining_hash_set import ChainingHashSet
+
+
+class LinearHashSet(ChainingHashSet):
+    """ChainingHashSet that grows by linear hashing: whenever the load factor exceeds max_load_factor, the single
+    bucket at the split pointer is split into itself and one new bucket appended to the table, so the table
+    grows one bucket at a time instead of doubling at once.
+
+    With initial_capacity N0, level L and split pointer p the table has N0 * 2^L + p buckets. A key goes to
+    h = x mod (N0 * 2^L); buckets below the split pointer have already been split, for them
+    h = x mod (N0 * 2^(L + 1)) is used. x is the key itself, or hash_function.prehash(key) if a hash function is
+    configured (the modulo reduction is required for the split property).
+    """
+
+    def __init__(self, capacity=1, max_load_factor=0.75, hash_function=None):
+        super().__init__(max(1, capacity), max_load_factor, hash_function)
+        self.initial_capacity = self.capacity
+        self.level = 0
+        self.split_pointer = 0
+        self.split_count = 0
+
+    def get_hash_code(self, key):
+        """Hash function that calculates a hash code for a given key, taking the split pointer into account.
+        :param key:
+        		Key for which a hash code shall be calculated according to the length of the hash table.
+        :return:
+        		The calculated hash code for the given key.
+        """
+        x = key if self.hash_function is None else self.hash_function.prehash(key)
+        modulus = self.initial_capacity << self.level
+        hash_code = x % modulus
+        if hash_code < self.split_pointer:
+            hash_code = x % (modulus << 1)
+        return hash_code
+
+    def get_node_hash_code(self, node):
+        if node.hash_value is None:
+            return self.get_hash_code(node.key)
+        modulus = self.initial_capacity << self.level
+        hash_code = node.hash_value % modulus
+        if hash_code < self.split_pointer:
+            hash_code = node.hash_value % (modulus << 1)
+        return hash_code
+
+    def is_aligned_with(self, other):
+        """returns True if the other set is a LinearHashSet in the same split state, only then every key lands in
+        the same bucket index in both tables."""
+        return super().is_aligned_with(other) and self.initial_capacity == other.initial_capacity \
+            and self.level == other.level and self.split_pointer == other.split_pointer
+
+    def empty_copy(self):
+        """returns an empty LinearHashSet in the same split state (capacity, level, split pointer)."""
+        result = LinearHashSet(self.initial_capacity, self.max_load_factor, self.hash_function)
+        result.level = self.level
+        result.split_pointer = self.split_pointer
+        result.capacity = self.capacity
+        result.hash_table = [None] * self.capacity
+        return result
+
+    def set_hash_table(self, table):
+        """(Required for testing only) Set a given hash table, its length becomes the initial capacity.
+        :param table: Given hash table which shall be used.
+        """
+        super().set_hash_table(table)
+        self.initial_capacity = max(1, self.capacity)
+        self.level = 0
+        self.split_pointer = 0
+
+    def grow_if_needed(self):
+        """Splits buckets one at a time until the load factor is at most max_load_factor.
+        :return:
+        		True if at least one bucket has been split.
+        """
+        if self.max_load_factor is None:
+            return False
+        split = False
+        while self.table_size > self.max_load_factor * self.capacity:
+            self.split_bucket()
+            split = True
+        return split
+
+    def split_bucket(self):
+        """Splits the bucket at the split pointer and advances the pointer."""
+        index = self.split_pointer
+        node = self.hash_table[index]
+        self.hash_table[index] = None
+        self.hash_table.append(None)
+        self.capacity += 1
+        self.split_pointer += 1
+        if self.split_pointer == self.initial_capacity << self.level:
+            self.level += 1
+            self.split_pointer = 0
+        # all keys of the split bucket move either to index or to the new last bucket
+        while node is not None:
+            next_node = node.next
+            hash = self.get_node_hash_code(node)
+            node.next = self.hash_table[hash]
+            self.hash_table[hash] = node
+            node = next_node
+        self.split_count += 1
+
+    def rehash(self, new_capacity):
+        """Splits buckets until the table has at least new_capacity buckets."""
+        while self.capacity < new_capacity:
+            self.split_bucket()
+
+    def clear(self):
+        self.capacity = self.initial_capacity
+        self.level = 0
+        self.split_pointer = 0
+        super().clear()
@@ -0,0 +1,191 @@
+from chaining_hash_node import ChainingHashNode
+from chaining_hash_set import ChainingHashSet
+
+
+class LRUHashNode(ChainingHashNode):
+    """Chain node that is also part of the recency list of an LRUHashSet."""
+
+    def __init__(self, key=None, hash_value=None):
+        super().__init__(key, hash_value)
+        self.newer = None
+        self.older = None
+
+
+class LRUHashSet(ChainingHashSet):
+    """ChainingHashSet with a maximum size: once it is full, every new key evicts the least recently used one.
+
+    All nodes are linked into a doubly-linked recency list (newest ... oldest) in addition to their chain, so
+    refreshing a key and finding the eviction victim are O(1); unlinking the victim from its chain only walks that
+    one chain. Inserting a stored key (a "seen again" in a dedupe filter) and, with touch_on_contains, a successful
+    contains make the key the newest one. The table is sized for max_size up front, so memory stays flat at steady
+    state.
+    """
+
+    def __init__(self, max_size, max_load_factor=0.75, hash_function=None, touch_on_contains=True):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        capacity = int(max_size / max_load_factor) + 1 if max_load_factor else max_size
+        super().__init__(capacity, max_load_factor, hash_function)
+        self.max_size = max_size
+        self.touch_on_contains = touch_on_contains
+        self.newest = None
+        self.oldest = None
+        self.hit_count = 0       # insert or contains calls that found their key
+        self.miss_count = 0      # insert or contains calls that did not
+        self.eviction_count = 0
+
+    def create_node(self, key):
+        if self.hash_function is not None and self.hash_function.cache_hash:
+            return LRUHashNode(key, self.hash_function.prehash(key))
+        return LRUHashNode(key)
+
+    @classmethod
+    def load(cls, file, key_type=int, unique=True, max_load_factor=0.75, hash_function=None, max_size=None):
+        """Reads a set written by dump(), the keys become the newest keys in file order.
+        :param max_size: Maximum size of the new set, by default the number of dumped keys, so none is evicted.
+        :return: The new LRUHashSet.
+        """
+        size, _ = cls.read_dump_header(file)
+        hash_set = cls(max_size=max(1, size) if max_size is None else max_size, max_load_factor=max_load_factor,
+                       hash_function=hash_function)
+        hash_set.bulk_insert((key_type(line.rstrip("\n")) for line in file), unique)
+        return hash_set
+
+    def get_hit_rate(self):
+        """returns the share of insert/contains calls that found their key."""
+        calls = self.hit_count + self.miss_count
+        if calls == 0:
+            return 0.0
+        return self.hit_count / calls
+
+    def set_hash_table(self, table):
+        """(Required for testing only) Sets a given hash table, its keys are used in table order."""
+        super().set_hash_table(table)
+        self.newest = None
+        self.oldest = None
+        for node in table:
+            while node is not None:
+                node.newer = None
+                node.older = None
+                self.link_newest(node)
+                node = node.next
+        while self.table_size > self.max_size:
+            self.evict()
+
+    def link_newest(self, node):
+        node.older = self.newest
+        node.newer = None
+        if self.newest is not None:
+            self.newest.newer = node
+        else:
+            self.oldest = node
+        self.newest = node
+
+    def unlink(self, node):
+        if node.newer is not None:
+            node.newer.older = node.older
+        else:
+            self.newest = node.older
+        if node.older is not None:
+            node.older.newer = node.newer
+        else:
+            self.oldest = node.newer
+
+    def touch(self, node):
+        """Makes a node the most recently used one."""
+        if node is not self.newest:
+            self.unlink(node)
+            self.link_newest(node)
+
+    def evict(self):
+        """Removes the least recently used key."""
+        node = self.oldest
+        self.unlink(node)
+        hash = self.get_node_hash_code(node)
+        if self.hash_table[hash] is node:
+            self.hash_table[hash] = node.next
+        else:
+            previous = self.hash_table[hash]
+            while previous.next is not node:
+                previous = previous.next
+            previous.next = node.next
+        self.table_size -= 1
+        self.eviction_count += 1
+
+    def find_node(self, key):
+        node = self.hash_table[self.get_hash_code(key)]
+        while node is not None and node.key != key:
+            node = node.next
+        return node
+
+    def insert(self, key):
+        """Inserts a key and returns True if it was not stored yet. A stored key becomes the most recently used
+        one instead. If the set is full, the least recently used key is evicted.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        node = self.find_node(key)
+        if node is not None:
+            self.hit_count += 1
+            self.touch(node)
+            return False
+        self.miss_count += 1
+        if self.table_size == self.max_size:
+            self.evict()
+        hash = self.get_hash_code(key)
+        node = self.create_node(key)
+        node.next = self.hash_table[hash]
+        self.hash_table[hash] = node
+        self.link_newest(node)
+        self.table_size += 1
+        self.grow_if_needed()
+        return True
+
+    def contains(self, key):
+        """Searches for a given key, which becomes the most recently used one if touch_on_contains is set.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        node = self.find_node(key)
+        if node is None:
+            self.miss_count += 1
+            return self.record_lookup(key, False)
+        self.hit_count += 1
+        if self.touch_on_contains:
+            self.touch(node)
+        return self.record_lookup(key, True)
+
+    def remove(self, key):
+        if key is None:
+            raise ValueError()
+        hash = self.get_hash_code(key)
+        previous = None
+        node = self.hash_table[hash]
+        while node is not None and node.key != key:
+            previous = node
+            node = node.next
+        if node is None:
+            return False
+        if previous is None:
+            self.hash_table[hash] = node.next
+        else:
+            previous.next = node.next
+        self.unlink(node)
+        self.table_size -= 1
+        return True
+
+    def clear(self):
+        super().clear()
+        self.newest = None
+        self.oldest = None
+
+    def iter_keys_by_recency(self):
+        """Yields all stored keys from the least to the most recently used one."""
+        node = self.oldest
+        while node is not None:
+            yield node.key
+            node = node.newer
@@ -0,0 +1,174 @@
+import numpy as np
+
+
+class NumpyIntHashSet():
+    """Hash set for 64-bit integer keys stored in NumPy arrays (open addressing with linear probing).
+
+    The capacity is always a power of two and keys are spread with Fibonacci (multiplicative) hashing.
+    insert_many and contains_many hash and probe a whole batch of keys with array operations, so the Python
+    interpreter only runs one loop iteration per probe round instead of one per key.
+    """
+    MULTIPLIER = 0x9E3779B97F4A7C15  # 2^64 / golden ratio
+    MASK_64 = (1 << 64) - 1
+
+    def __init__(self, capacity=16, max_load_factor=0.5):
+        bits = max(1, (max(1, capacity) - 1).bit_length())
+        self.max_load_factor = max_load_factor
+        self.table_size = 0
+        self.allocate(bits)
+
+    def allocate(self, bits):
+        """Creates empty slot arrays with 2^bits slots."""
+        self.bits = bits
+        self.capacity = 1 << bits
+        self.keys = np.zeros(self.capacity, dtype=np.int64)
+        self.used = np.zeros(self.capacity, dtype=bool)
+
+    def get_hash_code(self, key):
+        """Fibonacci hash of a single key.
+        :param key:
+        		Key for which a hash code shall be calculated according to the length of the hash table.
+        :return:
+        		The calculated hash code for the given key.
+        """
+        return ((int(key) & self.MASK_64) * self.MULTIPLIER & self.MASK_64) >> (64 - self.bits)
+
+    def get_hash_codes(self, keys):
+        """Vectorized Fibonacci hash of an int64 array, returns an int64 array of slot indices."""
+        hashed = keys.view(np.uint64) * np.uint64(self.MULTIPLIER)
+        return (hashed >> np.uint64(64 - self.bits)).astype(np.int64)
+
+    def get_hash_table(self):
+        """(Required for testing only)
+        :return the slot array with None for empty slots.
+        """
+        return [int(key) if used else None for key, used in zip(self.keys, self.used)]
+
+    def get_table_size(self):
+        """returns the number of stored keys (keys must be unique!)."""
+        return self.table_size
+
+    def reserve(self, size):
+        """Grows the table so that size keys fit without exceeding the maximum load factor."""
+        bits = self.bits
+        while size > self.max_load_factor * (1 << bits):
+            bits += 1
+        if bits == self.bits:
+            return
+        old_keys = self.keys[self.used]
+        self.allocate(bits)
+        self.place_many(old_keys)
+
+    def place_many(self, keys):
+        """Stores keys which are known to be unique and absent from the table."""
+        mask = self.capacity - 1
+        positions = self.get_hash_codes(keys)
+        pending = np.arange(len(keys))
+        while len(pending) > 0:
+            slots = positions[pending]
+            free = ~self.used[slots]
+            # among the pending keys that reached a free slot, the first one per slot claims it
+            free_slots, first = np.unique(slots[free], return_index=True)
+            claimed = np.flatnonzero(free)[first]
+            self.keys[free_slots] = keys[pending[claimed]]
+            self.used[free_slots] = True
+            placed = np.zeros(len(pending), dtype=bool)
+            placed[claimed] = True
+            pending = pending[~placed]
+            positions[pending] = (positions[pending] + 1) & mask
+
+    def insert_many(self, keys):
+        """Inserts all given keys.
+        :param keys:
+        		Array-like of integer keys, duplicates are allowed.
+        :return:
+        		The number of keys that have actually been added.
+        """
+        keys = np.unique(np.asarray(keys, dtype=np.int64))
+        keys = keys[~self.contains_many(keys)]
+        if len(keys) == 0:
+            return 0
+        self.reserve(self.table_size + len(keys))
+        self.place_many(keys)
+        self.table_size += len(keys)
+        return len(keys)
+
+    def contains_many(self, keys):
+        """Searches for all given keys.
+        :param keys:
+        		Array-like of integer keys.
+        :return:
+        		A bool array, True where the respective key is stored.
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        found = np.zeros(len(keys), dtype=bool)
+        mask = self.capacity - 1
+        positions = self.get_hash_codes(keys)
+        active = np.arange(len(keys))
+        while len(active) > 0:
+            slots = positions[active]
+            used = self.used[slots]
+            hit = used & (self.keys[slots] == keys[active])
+            found[active[hit]] = True
+            active = active[used & ~hit]
+            positions[active] = (positions[active] + 1) & mask
+        return found
+
+    def find_slot(self, key):
+        """Returns the slot index of the given key, or -1 if the key is not stored."""
+        index = self.get_hash_code(key)
+        mask = self.capacity - 1
+        while self.used[index]:
+            if self.keys[index] == key:
+                return index
+            index = (index + 1) & mask
+        return -1
+
+    def insert(self, key):
+        """Inserts a single key and returns True if it was not stored yet.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        return self.insert_many([key]) == 1
+
+    def contains(self, key):
+        """Searches for a single key, returns True if it is stored.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        return self.find_slot(key) != -1
+
+    def remove(self, key):
+        """Removes the key from the hash table and returns True on success, False otherwise.
+        Later keys of the same cluster are moved back so that no tombstones are needed.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        hole = self.find_slot(key)
+        if hole == -1:
+            return False
+        mask = self.capacity - 1
+        index = hole
+        while True:
+            index = (index + 1) & mask
+            if not self.used[index]:
+                break
+            home = self.get_hash_code(self.keys[index])
+            # the key may move into the hole if its home slot does not lie cyclically in (hole, index]
+            if (index - home) & mask >= (index - hole) & mask:
+                self.keys[hole] = self.keys[index]
+                hole = index
+        self.used[hole] = False
+        self.table_size -= 1
+        return True
+
+    def clear(self):
+        """Removes all stored elements from the hash table, keeping the current capacity."""
+        self.used[:] = False
+        self.table_size = 0
@@ -0,0 +1,173 @@
+"""Parallel bulk build of a ChainingHashSet from many 64-bit integer keys.
+
+The expensive parts of a build (hashing, grouping by bucket, removing duplicates) run in a process pool on
+shared memory, in three phases:
+
+    1. every worker hashes one chunk of the input and counts its keys per partition (a range of buckets),
+    2. every worker scatters its chunk into the partition regions of an output buffer (offsets from phase 1),
+    3. every worker sorts one partition by bucket and drops duplicate keys.
+
+The parent process then stitches the partitions into one table, creating the nodes bucket by bucket without any
+hashing or duplicate checks. Node objects cannot be shared between processes, so this last step stays
+sequential.
+"""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from chaining_hash_set import ChainingHashSet
+
+KEY_SIZE = 8  # bytes per int64
+
+
+class SharedBuffers():
+    """Attaches the shared int64 buffers of a build (keys, buckets, sorted keys, sorted buckets) by name."""
+
+    def __init__(self, names, n):
+        self.blocks = [shared_memory.SharedMemory(name=name) for name in names]
+        self.views = [block.buf.cast('q')[:n] for block in self.blocks]
+
+    def close(self):
+        for view in self.views:
+            view.release()
+        self.views = []
+        for block in self.blocks:
+            block.close()
+
+
+def bucket_of(key, capacity, hash_function):
+    return key % capacity if hash_function is None else hash_function(key, capacity)
+
+
+def partition_of(bucket, capacity, partitions):
+    return bucket * partitions // capacity
+
+
+def hash_chunk(names, n, start, end, capacity, partitions, hash_function):
+    """Phase 1: computes the bucket of every key in [start, end) and returns the key count per partition."""
+    buffers = SharedBuffers(names, n)
+    try:
+        keys, buckets = buffers.views[0], buffers.views[1]
+        counts = [0] * partitions
+        for i in range(start, end):
+            bucket = bucket_of(keys[i], capacity, hash_function)
+            buckets[i] = bucket
+            counts[bucket * partitions // capacity] += 1
+        return counts
+    finally:
+        buffers.close()
+
+
+def scatter_chunk(names, n, start, end, capacity, partitions, positions):
+    """Phase 2: copies the keys of [start, end) into their partition regions, starting at the given positions."""
+    buffers = SharedBuffers(names, n)
+    try:
+        keys, buckets, out_keys, out_buckets = buffers.views
+        positions = list(positions)
+        for i in range(start, end):
+            bucket = buckets[i]
+            partition = bucket * partitions // capacity
+            position = positions[partition]
+            out_keys[position] = keys[i]
+            out_buckets[position] = bucket
+            positions[partition] = position + 1
+    finally:
+        buffers.close()
+
+
+def sort_partition(names, n, start, end):
+    """Phase 3: sorts the region [start, end) by bucket, removes duplicate keys and returns the unique count.
+    The unique entries are written back to the beginning of the region."""
+    buffers = SharedBuffers(names, n)
+    try:
+        out_keys, out_buckets = buffers.views[2], buffers.views[3]
+        pairs = sorted(set(zip(out_buckets[start:end], out_keys[start:end])))
+        for offset, (bucket, key) in enumerate(pairs):
+            out_buckets[start + offset] = bucket
+            out_keys[start + offset] = key
+        return len(pairs)
+    finally:
+        buffers.close()
+
+
+def split_range(n, parts):
+    return [(n * i // parts, n * (i + 1) // parts) for i in range(parts)]
+
+
+def parallel_build(keys, workers=None, max_load_factor=0.75, hash_function=None, capacity=None):
+    """Builds a ChainingHashSet from int64 keys using a process pool.
+    :param keys: Iterable of integer keys in the int64 range, duplicates are allowed.
+    :param workers: Number of worker processes (default: os.cpu_count()). With 1 everything runs in-process.
+    :param max_load_factor: Load factor limit of the resulting set, also used to size the table.
+    :param hash_function: Hash function of the resulting set (must be picklable), None for key % capacity.
+    :param capacity: Capacity of the table, by default the smallest one that keeps max_load_factor.
+    :return: The new ChainingHashSet.
+    """
+    keys = array('q', keys)
+    n = len(keys)
+    workers = workers or os.cpu_count() or 1
+    if capacity is None:
+        capacity = max(1, int(n / max_load_factor) + 1) if max_load_factor else max(1, n)
+    hash_set = ChainingHashSet(capacity, max_load_factor, hash_function)
+    if n == 0:
+        return hash_set
+    partitions = workers
+    blocks = [shared_memory.SharedMemory(create=True, size=n * KEY_SIZE) for _ in range(4)]
+    names = [block.name for block in blocks]
+    try:
+        view = blocks[0].buf.cast('q')
+        view[:n] = keys
+        view.release()
+        chunks = split_range(n, workers)
+        executor = ProcessPoolExecutor(workers) if workers > 1 else None
+        try:
+            def run_all(function, argument_lists):
+                if executor is None:
+                    return [function(*arguments) for arguments in argument_lists]
+                return list(executor.map(function, *zip(*argument_lists)))
+
+            counts = run_all(hash_chunk, [(names, n, start, end, capacity, partitions, hash_function)
+                                          for start, end in chunks])
+            partition_starts = []
+            total = 0
+            for partition in range(partitions):
+                partition_starts.append(total)
+                total += sum(chunk_counts[partition] for chunk_counts in counts)
+            partition_bounds = list(zip(partition_starts, partition_starts[1:] + [n]))
+            chunk_positions = []
+            positions = list(partition_starts)
+            for chunk_counts in counts:
+                chunk_positions.append(list(positions))
+                positions = [position + count for position, count in zip(positions, chunk_counts)]
+            run_all(scatter_chunk, [(names, n, start, end, capacity, partitions, chunk_positions[i])
+                                    for i, (start, end) in enumerate(chunks)])
+            unique_counts = run_all(sort_partition, [(names, n, start, end) for start, end in partition_bounds])
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        out_keys = blocks[2].buf.cast('q')
+        out_buckets = blocks[3].buf.cast('q')
+        try:
+            stitch(hash_set, out_keys, out_buckets, partition_bounds, unique_counts)
+        finally:
+            out_keys.release()
+            out_buckets.release()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return hash_set
+
+
+def stitch(hash_set, out_keys, out_buckets, partition_bounds, unique_counts):
+    """Creates the nodes of every partition and links them into their buckets."""
+    hash_table = hash_set.hash_table
+    create_node = hash_set.create_node
+    for (start, _), count in zip(partition_bounds, unique_counts):
+        for i in range(start + count - 1, start - 1, -1):
+            bucket = out_buckets[i]
+            node = create_node(out_keys[i])
+            node.next = hash_table[bucket]
+            hash_table[bucket] = node
+        hash_set.table_size += count
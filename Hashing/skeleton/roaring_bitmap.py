@@ -0,0 +1,414 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+CHUNK_BITS = 16
+LOW_MASK = (1 << CHUNK_BITS) - 1
+ARRAY_MAX = 4096     # an array container with more values would be larger than a bitmap
+BITMAP_BYTES = 8192  # 65536 bits
+CONTAINER_OVERHEAD = 120  # approximate bytes of a container object and its dict entry
+
+BYTE_BITS = [[bit for bit in range(8) if value >> bit & 1] for value in range(256)]
+
+
+def lows_of_bytes(data):
+    """returns the positions of the set bits of a little-endian bitmap in ascending order."""
+    lows = []
+    for i, byte in enumerate(data):
+        if byte:
+            base = i << 3
+            lows.extend([base + bit for bit in BYTE_BITS[byte]])
+    return lows
+
+
+def lows_to_bits(lows):
+    data = bytearray(BITMAP_BYTES)
+    for low in lows:
+        data[low >> 3] |= 1 << (low & 7)
+    return int.from_bytes(data, 'little')
+
+
+def count_runs(lows):
+    """returns the number of runs of consecutive values in a sorted sequence."""
+    runs = 0
+    previous = -2
+    for low in lows:
+        if low != previous + 1:
+            runs += 1
+        previous = low
+    return runs
+
+
+def container_from_lows(lows):
+    """Builds the smallest container for a sorted list of distinct 16-bit values (None if the list is empty)."""
+    if not lows:
+        return None
+    runs = count_runs(lows)
+    if 4 * runs < min(2 * len(lows), BITMAP_BYTES):
+        return RunContainer.from_lows(lows)
+    if len(lows) <= ARRAY_MAX:
+        return ArrayContainer(array('H', lows))
+    return BitmapContainer.from_lows(lows)
+
+
+def container_from_bits(bits):
+    """Builds the smallest container for a 65536-bit int (None if no bit is set)."""
+    count = bits.bit_count()
+    if count == 0:
+        return None
+    runs = (bits & ~(bits << 1)).bit_count()  # bits that start a run
+    if 4 * runs < min(2 * count, BITMAP_BYTES) or count <= ARRAY_MAX:
+        return container_from_lows(lows_of_bytes(bits.to_bytes(BITMAP_BYTES, 'little')))
+    return BitmapContainer(bytearray(bits.to_bytes(BITMAP_BYTES, 'little')), count)
+
+
+class ArrayContainer():
+    """Sorted array of the 16-bit low parts, for sparse chunks (at most ARRAY_MAX values)."""
+
+    def __init__(self, values=None):
+        self.values = values if values is not None else array('H')
+
+    def contains(self, low):
+        i = bisect_left(self.values, low)
+        return i < len(self.values) and self.values[i] == low
+
+    def insert(self, low):
+        i = bisect_left(self.values, low)
+        if i < len(self.values) and self.values[i] == low:
+            return False
+        self.values.insert(i, low)
+        return True
+
+    def remove(self, low):
+        i = bisect_left(self.values, low)
+        if i == len(self.values) or self.values[i] != low:
+            return False
+        del self.values[i]
+        return True
+
+    def normalized(self):
+        """returns the container that should hold these values after a change (self or a converted one)."""
+        if len(self.values) > ARRAY_MAX:
+            return BitmapContainer.from_lows(self.values)
+        return self
+
+    def get_cardinality(self):
+        return len(self.values)
+
+    def get_size_in_bytes(self):
+        return 2 * len(self.values)
+
+    def to_bits(self):
+        return lows_to_bits(self.values)
+
+    def copy(self):
+        return ArrayContainer(array('H', self.values))
+
+    def __iter__(self):
+        return iter(self.values)
+
+
+class BitmapContainer():
+    """65536-bit bitmap, for dense chunks."""
+
+    def __init__(self, bits=None, count=0):
+        self.bits = bits if bits is not None else bytearray(BITMAP_BYTES)
+        self.count = count
+
+    @staticmethod
+    def from_lows(lows):
+        container = BitmapContainer()
+        for low in lows:
+            container.bits[low >> 3] |= 1 << (low & 7)
+        container.count = len(lows)
+        return container
+
+    def contains(self, low):
+        return self.bits[low >> 3] >> (low & 7) & 1 == 1
+
+    def insert(self, low):
+        mask = 1 << (low & 7)
+        if self.bits[low >> 3] & mask:
+            return False
+        self.bits[low >> 3] |= mask
+        self.count += 1
+        return True
+
+    def remove(self, low):
+        mask = 1 << (low & 7)
+        if not self.bits[low >> 3] & mask:
+            return False
+        self.bits[low >> 3] ^= mask
+        self.count -= 1
+        return True
+
+    def normalized(self):
+        if self.count <= ARRAY_MAX:
+            return ArrayContainer(array('H', lows_of_bytes(self.bits)))
+        return self
+
+    def get_cardinality(self):
+        return self.count
+
+    def get_size_in_bytes(self):
+        return BITMAP_BYTES
+
+    def to_bits(self):
+        return int.from_bytes(self.bits, 'little')
+
+    def copy(self):
+        return BitmapContainer(bytearray(self.bits), self.count)
+
+    def __iter__(self):
+        return iter(lows_of_bytes(self.bits))
+
+
+class RunContainer():
+    """Sorted runs [starts[i], starts[i] + lengths[i]], for chunks made of few long ranges."""
+
+    def __init__(self, starts=None, lengths=None):
+        self.starts = starts if starts is not None else array('H')
+        self.lengths = lengths if lengths is not None else array('H')
+        self.count = sum(self.lengths) + len(self.starts)
+
+    @staticmethod
+    def from_lows(lows):
+        starts = array('H')
+        lengths = array('H')
+        for low in lows:
+            if starts and starts[-1] + lengths[-1] + 1 == low:
+                lengths[-1] += 1
+            else:
+                starts.append(low)
+                lengths.append(0)
+        return RunContainer(starts, lengths)
+
+    def find_run(self, low):
+        """returns the index of the last run starting at or before low (-1 if there is none)."""
+        return bisect_right(self.starts, low) - 1
+
+    def contains(self, low):
+        i = self.find_run(low)
+        return i >= 0 and low <= self.starts[i] + self.lengths[i]
+
+    def insert(self, low):
+        starts, lengths = self.starts, self.lengths
+        i = self.find_run(low)
+        if i >= 0 and low <= starts[i] + lengths[i]:
+            return False
+        extends_left = i >= 0 and starts[i] + lengths[i] + 1 == low
+        extends_right = i + 1 < len(starts) and starts[i + 1] == low + 1
+        if extends_left and extends_right:
+            lengths[i] += lengths[i + 1] + 2
+            del starts[i + 1]
+            del lengths[i + 1]
+        elif extends_left:
+            lengths[i] += 1
+        elif extends_right:
+            starts[i + 1] = low
+            lengths[i + 1] += 1
+        else:
+            starts.insert(i + 1, low)
+            lengths.insert(i + 1, 0)
+        self.count += 1
+        return True
+
+    def remove(self, low):
+        starts, lengths = self.starts, self.lengths
+        i = self.find_run(low)
+        if i < 0 or low > starts[i] + lengths[i]:
+            return False
+        end = starts[i] + lengths[i]
+        if lengths[i] == 0:
+            del starts[i]
+            del lengths[i]
+        elif low == starts[i]:
+            starts[i] += 1
+            lengths[i] -= 1
+        elif low == end:
+            lengths[i] -= 1
+        else:
+            lengths[i] = low - starts[i] - 1
+            starts.insert(i + 1, low + 1)
+            lengths.insert(i + 1, end - low - 1)
+        self.count -= 1
+        return True
+
+    def normalized(self):
+        if 4 * len(self.starts) >= min(2 * self.count, BITMAP_BYTES):
+            return container_from_lows(list(self))
+        return self
+
+    def get_cardinality(self):
+        return self.count
+
+    def get_size_in_bytes(self):
+        return 4 * len(self.starts)
+
+    def to_bits(self):
+        bits = 0
+        for start, length in zip(self.starts, self.lengths):
+            bits |= ((1 << (length + 1)) - 1) << start
+        return bits
+
+    def copy(self):
+        return RunContainer(array('H', self.starts), array('H', self.lengths))
+
+    def __iter__(self):
+        for start, length in zip(self.starts, self.lengths):
+            yield from range(start, start + length + 1)
+
+
+class RoaringBitmap():
+    """Compressed set of integer keys in the style of Roaring bitmaps.
+
+    A key is split into its high part (key >> 16, the chunk) and its 16-bit low part. Every non-empty chunk has one
+    container for its low parts: a sorted array while the chunk is sparse, a 65536-bit bitmap once it holds more
+    than ARRAY_MAX values, or a list of runs for chunks made of long consecutive ranges (chosen by run_optimize and
+    by the set operations). A dense range of n keys takes about n / 8 bytes instead of one node per key.
+    Set operations work chunk by chunk on the containers as big ints, without touching single keys.
+    """
+
+    def __init__(self):
+        self.containers = {}
+        self.table_size = 0
+
+    @classmethod
+    def from_keys(cls, keys):
+        """Builds a bitmap from an iterable of integer keys (duplicates are allowed), choosing the smallest
+        container for every chunk."""
+        chunks = {}
+        for key in keys:
+            chunks.setdefault(key >> CHUNK_BITS, set()).add(key & LOW_MASK)
+        bitmap = cls()
+        for high, lows in chunks.items():
+            bitmap.containers[high] = container_from_lows(sorted(lows))
+            bitmap.table_size += len(lows)
+        return bitmap
+
+    def get_table_size(self):
+        """returns the number of stored keys."""
+        return self.table_size
+
+    def insert(self, key):
+        """Inserts an integer key and returns True if it was not stored yet.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        high = key >> CHUNK_BITS
+        container = self.containers.get(high)
+        if container is None:
+            container = self.containers[high] = ArrayContainer()
+        if not container.insert(key & LOW_MASK):
+            return False
+        self.containers[high] = container.normalized()
+        self.table_size += 1
+        return True
+
+    def contains(self, key):
+        """Searches for a given integer key.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        container = self.containers.get(key >> CHUNK_BITS)
+        return container is not None and container.contains(key & LOW_MASK)
+
+    def remove(self, key):
+        """Removes the key and returns True on success, False otherwise.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        high = key >> CHUNK_BITS
+        container = self.containers.get(high)
+        if container is None or not container.remove(key & LOW_MASK):
+            return False
+        if container.get_cardinality() == 0:
+            del self.containers[high]
+        else:
+            self.containers[high] = container.normalized()
+        self.table_size -= 1
+        return True
+
+    def clear(self):
+        self.containers = {}
+        self.table_size = 0
+
+    def run_optimize(self):
+        """Converts every container into its smallest form (e.g. long ranges into runs)."""
+        for high, container in self.containers.items():
+            self.containers[high] = container_from_bits(container.to_bits())
+
+    def get_size_in_bytes(self):
+        """returns the approximate memory use of the containers."""
+        return sum(container.get_size_in_bytes() + CONTAINER_OVERHEAD for container in self.containers.values())
+
+    def get_container_counts(self):
+        """returns the number of containers per container type name."""
+        counts = {}
+        for container in self.containers.values():
+            name = type(container).__name__
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def iter_keys(self):
+        """Yields all stored keys in ascending order."""
+        for high in sorted(self.containers):
+            base = high << CHUNK_BITS
+            for low in self.containers[high]:
+                yield base + low
+
+    def __iter__(self):
+        return self.iter_keys()
+
+    def copy(self):
+        result = RoaringBitmap()
+        result.containers = {high: container.copy() for high, container in self.containers.items()}
+        result.table_size = self.table_size
+        return result
+
+    def combine(self, other, operation, keep_own, keep_other):
+        """Applies a bitwise operation to the containers of the chunks present in both bitmaps. Chunks present in
+        only one of them are copied if keep_own / keep_other is set."""
+        result = RoaringBitmap()
+        for high, container in self.containers.items():
+            other_container = other.containers.get(high)
+            if other_container is None:
+                combined = container.copy() if keep_own else None
+            else:
+                combined = container_from_bits(operation(container.to_bits(), other_container.to_bits()))
+            if combined is not None:
+                result.containers[high] = combined
+                result.table_size += combined.get_cardinality()
+        if keep_other:
+            for high, container in other.containers.items():
+                if high not in self.containers:
+                    result.containers[high] = container.copy()
+                    result.table_size += container.get_cardinality()
+        return result
+
+    def union(self, other):
+        """returns a new bitmap with the keys of both bitmaps."""
+        return self.combine(other, lambda a, b: a | b, True, True)
+
+    def intersection(self, other):
+        """returns a new bitmap with the keys stored in both bitmaps."""
+        return self.combine(other, lambda a, b: a & b, False, False)
+
+    def difference(self, other):
+        """returns a new bitmap with the keys of this bitmap that are not stored in the other one."""
+        return self.combine(other, lambda a, b: a & ~b, True, False)
+
+    def issubset(self, other):
+        """returns True if every key of this bitmap is also stored in the other one."""
+        if self.table_size > other.table_size:
+            return False
+        for high, container in self.containers.items():
+            other_container = other.containers.get(high)
+            if other_container is None or container.to_bits() & ~other_container.to_bits():
+                return False
+        return True
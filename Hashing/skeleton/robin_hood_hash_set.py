@@ -0,0 +1,165 @@
+from array import array
+
+
+class RobinHoodHashSet():
+    """Hash set using open addressing with linear probing and Robin Hood displacement.
+
+    Keys are stored in one flat list, the probe distance of every slot (distance to its home bucket) in a parallel
+    int array, where -1 marks an empty slot. Deletion uses backward shifting, so no tombstones are needed.
+    """
+    EMPTY = -1
+
+    def __init__(self, capacity=8, max_load_factor=0.85):
+        capacity = max(1, capacity)
+        self.keys = [None] * capacity
+        self.distances = array('i', [self.EMPTY]) * capacity
+        self.table_size = 0
+        self.capacity = capacity
+        self.max_load_factor = max_load_factor
+        self.resize_count = 0
+
+    def get_hash_code(self, key):
+        """Hash function that calculates the home slot for a given key using the modulo division.
+        :param key:
+        		Key for which a hash code shall be calculated according to the length of the hash table.
+        :return:
+        		The calculated hash code for the given key.
+        """
+        return key % self.capacity
+
+    def get_hash_table(self):
+        """(Required for testing only)
+        :return the slot array (None for empty slots).
+        """
+        return self.keys
+
+    def get_table_size(self):
+        """returns the number of stored keys (keys must be unique!)."""
+        return self.table_size
+
+    def get_load_factor(self):
+        """returns the number of stored keys divided by the number of slots."""
+        return self.table_size / self.capacity
+
+    def find_slot(self, key):
+        """Returns the slot index of the given key, or -1 if the key is not stored."""
+        keys = self.keys
+        distances = self.distances
+        capacity = self.capacity
+        index = self.get_hash_code(key)
+        distance = 0
+        while distances[index] >= distance:
+            if keys[index] == key:
+                return index
+            index += 1
+            if index == capacity:
+                index = 0
+            distance += 1
+        return -1
+
+    def insert(self, key):
+        """Inserts a key and returns True if it was successful. If there is already an entry with the
+          same key, the new key will not be inserted and False is returned.
+         :param key:
+         		The key which shall be stored in the hash table.
+         :return:
+         		True if key could be inserted, or False if the key is already in the hash table.
+         :raises:
+         		a ValueError if the key is None.
+         """
+        if key is None:
+            raise ValueError()
+        if self.find_slot(key) != -1:
+            return False
+        if self.table_size + 1 > self.max_load_factor * self.capacity:
+            self.rehash(2 * self.capacity)
+        self.place(key)
+        self.table_size += 1
+        return True
+
+    def place(self, key):
+        """Stores a key that is known to be absent, displacing richer keys (shorter probe distance) on the way."""
+        keys = self.keys
+        distances = self.distances
+        capacity = self.capacity
+        index = self.get_hash_code(key)
+        distance = 0
+        while True:
+            slot_distance = distances[index]
+            if slot_distance == self.EMPTY:
+                keys[index] = key
+                distances[index] = distance
+                return
+            if slot_distance < distance:
+                keys[index], key = key, keys[index]
+                distances[index], distance = distance, slot_distance
+            index += 1
+            if index == capacity:
+                index = 0
+            distance += 1
+
+    def contains(self, key):
+        """Searches for a given key in the hash table.
+         :param key:
+         	    The key to be searched in the hash table.
+         :return:
+         	    True if the key is already stored, otherwise False.
+         :raises:
+         	    a ValueError if the key is None.
+         """
+        if key is None:
+            raise ValueError()
+        return self.find_slot(key) != -1
+
+    def remove(self, key):
+        """Removes the key from the hash table and returns True on success, False otherwise.
+        Following keys of the same cluster are shifted back by one slot.
+        :param key:
+        		The key to be removed from the hash table.
+        :return:
+        		True if the key was found and removed, False otherwise.
+        :raises:
+         	a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        index = self.find_slot(key)
+        if index == -1:
+            return False
+        keys = self.keys
+        distances = self.distances
+        next_index = (index + 1) % self.capacity
+        while distances[next_index] > 0:
+            keys[index] = keys[next_index]
+            distances[index] = distances[next_index] - 1
+            index = next_index
+            next_index = (index + 1) % self.capacity
+        keys[index] = None
+        distances[index] = self.EMPTY
+        self.table_size -= 1
+        return True
+
+    def rehash(self, new_capacity):
+        """Re-inserts all keys into new slot arrays with the given capacity."""
+        old_keys = self.keys
+        old_distances = self.distances
+        self.keys = [None] * new_capacity
+        self.distances = array('i', [self.EMPTY]) * new_capacity
+        self.capacity = new_capacity
+        for i in range(len(old_keys)):
+            if old_distances[i] != self.EMPTY:
+                self.place(old_keys[i])
+        self.resize_count += 1
+
+    def clear(self):
+        """Removes all stored elements from the hash table, keeping the current capacity."""
+        self.keys = [None] * self.capacity
+        self.distances = array('i', [self.EMPTY]) * self.capacity
+        self.table_size = 0
+
+    def to_string(self):
+        """Returns a string representation of the slot array in the format
+            Idx_0 {Key}, Idx_1 {}, ...
+            e.g.: 0 {13}, 1 {}, 2 {2}"""
+        return ", ".join(str(i) + " {" + ("" if self.distances[i] == self.EMPTY else str(self.keys[i])) + "}"
+                         for i in range(self.capacity))
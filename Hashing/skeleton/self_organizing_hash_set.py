@@ -0,0 +1,64 @@
+from chaining_hash_set import ChainingHashSet
+
+
+class SelfOrganizingHashSet(ChainingHashSet):
+    """ChainingHashSet whose chains reorganize themselves on successful lookups, so frequently searched keys end
+    up near the head of their chain.
+
+    Policies:
+        "move_to_front": the found node is moved to the head of its chain.
+        "transpose": the found key is swapped with its predecessor (adapts slower, but is more stable).
+        None: chains keep insertion order (same as ChainingHashSet).
+    """
+    MOVE_TO_FRONT = "move_to_front"
+    TRANSPOSE = "transpose"
+
+    def __init__(self, capacity=0, max_load_factor=None, hash_function=None, policy=MOVE_TO_FRONT):
+        if policy not in (self.MOVE_TO_FRONT, self.TRANSPOSE, None):
+            raise ValueError("Unknown chain policy: " + str(policy))
+        super().__init__(capacity, max_load_factor, hash_function)
+        self.policy = policy
+        self.lookup_count = 0  # number of contains calls
+        self.probe_count = 0   # number of nodes compared by contains calls
+
+    def get_average_probe_length(self):
+        """returns the average number of compared nodes per contains call."""
+        if self.lookup_count == 0:
+            return 0.0
+        return self.probe_count / self.lookup_count
+
+    def contains(self, key):
+        """Searches for a given key in the hash table and reorganizes its chain according to the policy.
+         :param key:
+         	    The key to be searched in the hash table.
+         :return:
+         	    True if the key is already stored, otherwise False.
+         :raises:
+         	    a ValueError if the key is None.
+         """
+        if key is None:
+            raise ValueError()
+        self.lookup_count += 1
+        hash = self.bucket_index(key)
+        if hash is None:
+            return self.record_lookup(key, False, 0)
+        probes = 0
+        previous = None
+        node = self.hash_table[hash]
+        while node is not None:
+            probes += 1
+            if node.key == key:
+                self.probe_count += probes
+                if previous is not None:
+                    if self.policy == self.MOVE_TO_FRONT:
+                        previous.next = node.next
+                        node.next = self.hash_table[hash]
+                        self.hash_table[hash] = node
+                    elif self.policy == self.TRANSPOSE:
+                        previous.key, node.key = node.key, previous.key
+                        previous.hash_value, node.hash_value = node.hash_value, previous.hash_value
+                return self.record_lookup(key, True, probes)
+            previous = node
+            node = node.next
+        self.probe_count += probes
+        return self.record_lookup(key, False, probes)
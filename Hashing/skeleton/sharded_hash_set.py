@@ -0,0 +1,220 @@
+"""Hash set spread over several worker processes.
+
+Every shard is a ChainingHashSet living in its own process, driven over a pipe. Keys are assigned to shards by a
+consistent hash ring with virtual nodes, so adding a shard only moves the keys that now belong to it (about 1/n of
+them) instead of rehashing everything. Operations are sent in batches: a batch is split by shard, all shards get
+their part first and are then read back, so the shards process a batch in parallel.
+"""
+import hashlib
+from bisect import bisect_right
+from multiprocessing import Pipe, Process
+
+from chaining_hash_set import ChainingHashSet
+from hash_functions import MASK_64
+
+MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+def key_point(key):
+    """Position of a key on the ring. It must not depend on the process (the workers also use the ring), so
+    strings are not hashed with the randomized hash()."""
+    if isinstance(key, int):
+        return (key & MASK_64) * MULTIPLIER & MASK_64
+    data = key.encode() if isinstance(key, str) else repr(key).encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+class ConsistentHashRing():
+    """Ring of 64-bit points, every shard owns virtual_nodes points; a key belongs to the shard of the first point
+    at or after its own position (wrapping around)."""
+
+    def __init__(self, virtual_nodes=64):
+        self.virtual_nodes = virtual_nodes
+        self.points = []
+        self.owners = []
+
+    def shard_point(self, shard, replica):
+        digest = hashlib.blake2b(("shard-%d-%d" % (shard, replica)).encode(), digest_size=8).digest()
+        return int.from_bytes(digest, 'little')
+
+    def add_shard(self, shard):
+        pairs = list(zip(self.points, self.owners))
+        pairs.extend((self.shard_point(shard, replica), shard) for replica in range(self.virtual_nodes))
+        pairs.sort()
+        self.points = [point for point, _ in pairs]
+        self.owners = [owner for _, owner in pairs]
+
+    def shard_for(self, key):
+        i = bisect_right(self.points, key_point(key))
+        return self.owners[i % len(self.points)]
+
+
+def handle(hash_set, command, argument):
+    if command == "insert":
+        return [hash_set.insert(key) for key in argument]
+    if command == "contains":
+        return [hash_set.contains(key) for key in argument]
+    if command == "remove":
+        return [hash_set.remove(key) for key in argument]
+    if command == "size":
+        return hash_set.get_table_size()
+    if command == "keys":
+        return list(hash_set.iter_keys())
+    if command == "extract":
+        # argument: (ring, own shard id), removes and returns the keys the ring assigns to other shards
+        ring, shard = argument
+        moved = [key for key in hash_set.iter_keys() if ring.shard_for(key) != shard]
+        for key in moved:
+            hash_set.remove(key)
+        return moved
+    raise ValueError("Unknown command: " + str(command))
+
+
+def shard_worker(connection, max_load_factor, hash_function):
+    """Serves one shard: receives (command, argument) messages and answers each of them. An exception is sent
+    back as the answer, the parent raises it."""
+    hash_set = ChainingHashSet(8, max_load_factor, hash_function)
+    while True:
+        command, argument = connection.recv()
+        if command == "close":
+            connection.close()
+            return
+        try:
+            answer = handle(hash_set, command, argument)
+        except Exception as error:
+            answer = error
+        connection.send(answer)
+
+
+def receive_all(connections):
+    """Reads one answer from each connection and raises the first exception among them (after reading all)."""
+    answers = [connection.recv() for connection in connections]
+    for answer in answers:
+        if isinstance(answer, Exception):
+            raise answer
+    return answers
+
+
+class ShardedHashSet():
+    """Set of keys spread over worker processes by consistent hashing (see module docstring).
+    Use insert_many/contains_many/remove_many for throughput, the single-key methods need one round trip each.
+    Call close() (or use it as a context manager) to stop the workers."""
+
+    def __init__(self, shards=4, virtual_nodes=64, max_load_factor=0.75, hash_function=None):
+        self.max_load_factor = max_load_factor
+        self.hash_function = hash_function
+        self.ring = ConsistentHashRing(virtual_nodes)
+        self.connections = {}
+        self.processes = {}
+        for _ in range(shards):
+            self.start_shard()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start_shard(self):
+        shard = len(self.processes)
+        parent_end, child_end = Pipe()
+        process = Process(target=shard_worker, args=(child_end, self.max_load_factor, self.hash_function),
+                          daemon=True)
+        process.start()
+        child_end.close()
+        self.connections[shard] = parent_end
+        self.processes[shard] = process
+        self.ring.add_shard(shard)
+        return shard
+
+    def get_shard_count(self):
+        return len(self.processes)
+
+    def add_shard(self):
+        """Starts a new shard and moves the keys that the ring now assigns to it.
+        :return: The number of moved keys.
+        """
+        shard = self.start_shard()
+        for other, connection in self.connections.items():
+            if other != shard:
+                connection.send(("extract", (self.ring, other)))
+        moved = []
+        for keys in receive_all([connection for other, connection in self.connections.items() if other != shard]):
+            moved.extend(keys)
+        self.connections[shard].send(("insert", moved))
+        receive_all([self.connections[shard]])
+        return len(moved)
+
+    def broadcast(self, command):
+        for connection in self.connections.values():
+            connection.send((command, None))
+        return dict(zip(self.connections, receive_all(self.connections.values())))
+
+    def batch(self, command, keys):
+        """Sends the keys of a batch to their shards and returns the per-key answers in input order."""
+        keys = list(keys)
+        if any(key is None for key in keys):
+            raise ValueError()
+        positions = {}
+        parts = {}
+        for i, key in enumerate(keys):
+            shard = self.ring.shard_for(key)
+            parts.setdefault(shard, []).append(key)
+            positions.setdefault(shard, []).append(i)
+        for shard, part in parts.items():
+            self.connections[shard].send((command, part))
+        answers = receive_all([self.connections[shard] for shard in parts])
+        results = [None] * len(keys)
+        for shard, answer in zip(parts, answers):
+            for i, result in zip(positions[shard], answer):
+                results[i] = result
+        return results
+
+    def insert_many(self, keys):
+        """Inserts a batch of keys, returns a list with True for every newly inserted key."""
+        return self.batch("insert", keys)
+
+    def contains_many(self, keys):
+        """returns a list with True for every stored key of the batch."""
+        return self.batch("contains", keys)
+
+    def remove_many(self, keys):
+        """Removes a batch of keys, returns a list with True for every removed key."""
+        return self.batch("remove", keys)
+
+    def insert(self, key):
+        return self.insert_many([key])[0]
+
+    def contains(self, key):
+        return self.contains_many([key])[0]
+
+    def remove(self, key):
+        return self.remove_many([key])[0]
+
+    def get_table_size(self):
+        """returns the number of stored keys over all shards."""
+        return sum(self.broadcast("size").values())
+
+    def get_shard_sizes(self):
+        """returns the number of stored keys per shard."""
+        return self.broadcast("size")
+
+    def iter_keys(self):
+        """Yields all stored keys shard by shard."""
+        for keys in self.broadcast("keys").values():
+            yield from keys
+
+    def __iter__(self):
+        return self.iter_keys()
+
+    def close(self):
+        """Stops all worker processes."""
+        for shard, connection in self.connections.items():
+            try:
+                connection.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+            self.processes[shard].join(timeout=5)
+        self.connections = {}
+        self.processes = {}
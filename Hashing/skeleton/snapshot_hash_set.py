@@ -0,0 +1,150 @@
+from chaining_hash_node import ChainingHashNode
+from chaining_hash_set import ChainingHashSet
+
+
+class SnapshotHashNode(ChainingHashNode):
+    def __init__(self, key=None, hash_value=None, epoch=0):
+        super().__init__(key, hash_value)
+        self.epoch = epoch  # snapshot epoch the node was created in
+
+
+class HashSetSnapshot(ChainingHashSet):
+    """Read-only view of a SnapshotHashSet at the time snapshot() was called. All reading methods of
+    ChainingHashSet work on it, the mutating ones raise a TypeError."""
+
+    def __init__(self, hash_table, table_size, hash_function):
+        super().__init__(0, None, hash_function)
+        self.hash_table = hash_table
+        self.capacity = len(hash_table)
+        self.table_size = table_size
+
+    def read_only(self, *args):
+        raise TypeError("A snapshot is read-only")
+
+    insert = remove = clear = rehash = set_hash_table = bulk_insert = read_only
+
+
+class SnapshotHashSet(ChainingHashSet):
+    """ChainingHashSet with cheap copy-on-write snapshots.
+
+    snapshot() is O(1): the snapshot shares the table list and all chains. Nodes created before the latest snapshot
+    are never modified again, so the writer works around them:
+        - the first write after a snapshot copies the table list (O(capacity), a single memory copy),
+        - insert prepends the new node, which leaves the existing chain untouched,
+        - remove copies only the shared nodes in front of the removed one (path copying), the rest of the chain
+          stays shared,
+        - a resize re-links nodes created since the latest snapshot and copies the older ones.
+    Nodes created after the latest snapshot (the epoch of a node) form a prefix of every chain and are modified in
+    place as usual. Reads on a snapshot never take a lock: nothing they can reach is written again. snapshot()
+    itself must not run concurrently with a write.
+    """
+
+    def __init__(self, capacity=0, max_load_factor=None, hash_function=None):
+        super().__init__(capacity, max_load_factor, hash_function)
+        self.epoch = 0
+        self.table_shared = False
+        self.table_copy_count = 0  # table lists copied because of a snapshot
+        self.node_copy_count = 0   # nodes copied because of a snapshot
+
+    def create_node(self, key):
+        hash_value = None
+        if self.hash_function is not None and self.hash_function.cache_hash:
+            hash_value = self.hash_function.prehash(key)
+        return SnapshotHashNode(key, hash_value, self.epoch)
+
+    def copy_node(self, node):
+        self.node_copy_count += 1
+        return SnapshotHashNode(node.key, node.hash_value, self.epoch)
+
+    def snapshot(self):
+        """returns a read-only HashSetSnapshot of the current keys, later changes of this set do not affect it."""
+        self.epoch += 1
+        self.table_shared = True
+        return HashSetSnapshot(self.hash_table, self.table_size, self.hash_function)
+
+    def own_table(self):
+        """Copies the table list before its first change after a snapshot."""
+        if self.table_shared:
+            self.hash_table = list(self.hash_table)
+            self.table_shared = False
+            self.table_copy_count += 1
+
+    def set_hash_table(self, table):
+        super().set_hash_table(table)
+        self.table_shared = False
+        for node in table:
+            while node is not None:
+                node.epoch = self.epoch
+                node = node.next
+
+    def insert(self, key):
+        if key is None:
+            raise ValueError()
+        hash = self.bucket_index(key, True)
+        node = self.hash_table[hash]
+        while node is not None:
+            if node.key == key:
+                return False
+            node = node.next
+        self.own_table()
+        node = self.create_node(key)
+        node.next = self.hash_table[hash]
+        self.hash_table[hash] = node
+        self.table_size += 1
+        self.grow_if_needed()
+        return True
+
+    def remove(self, key):
+        if key is None:
+            raise ValueError()
+        hash = self.bucket_index(key)
+        if hash is None:
+            return False
+        previous = None
+        node = self.hash_table[hash]
+        while node is not None and node.key != key:
+            previous = node
+            node = node.next
+        if node is None:
+            return False
+        self.own_table()
+        if previous is None:
+            self.hash_table[hash] = node.next
+        elif previous.epoch == self.epoch:
+            previous.next = node.next
+        else:
+            # copy the shared part of the chain up to the removed node, the part behind it stays shared
+            head = None
+            tail = None
+            current = self.hash_table[hash]
+            while current is not node:
+                link = current if current.epoch == self.epoch else self.copy_node(current)
+                if tail is None:
+                    head = link
+                else:
+                    tail.next = link
+                tail = link
+                current = current.next
+            tail.next = node.next
+            self.hash_table[hash] = head
+        self.table_size -= 1
+        return True
+
+    def rehash(self, new_capacity):
+        old_table = self.hash_table
+        self.hash_table = [None] * new_capacity
+        self.capacity = new_capacity
+        self.table_shared = False
+        for node in old_table:
+            while node is not None:
+                next_node = node.next
+                moved = node if node.epoch == self.epoch else self.copy_node(node)
+                hash = self.get_node_hash_code(moved)
+                moved.next = self.hash_table[hash]
+                self.hash_table[hash] = moved
+                node = next_node
+        self.resize_count += 1
+
+    def clear(self):
+        super().clear()
+        self.table_shared = False
@@ -0,0 +1,47 @@
+import random
+import unittest
+
+from adaptive_hash_set import AdaptiveHashSet
+from hash_functions import GenericHash
+
+
+class TestAdaptiveHashSet(unittest.TestCase):
+    def test_dense_keys_switch_to_bitmap(self):
+        stud_set = AdaptiveHashSet(hash_function=GenericHash())
+        for key in range(5000):
+            stud_set.insert(key)
+        self.assertEqual(AdaptiveHashSet.BITMAP, stud_set.get_mode())
+        self.assertTrue(stud_set.contains(4999))
+        self.assertFalse(stud_set.contains(5000))
+        self.assertTrue(stud_set.insert("key"), "a non-integer key switches back to hashing")
+        self.assertEqual(AdaptiveHashSet.CHAINING, stud_set.get_mode())
+        self.assertEqual(set(range(5000)) | {"key"}, set(stud_set))
+
+    def test_sparse_keys_stay_in_hash_table(self):
+        stud_set = AdaptiveHashSet()
+        keys = random.Random(4).sample(range(10 ** 12), 3000)
+        for key in keys:
+            stud_set.insert(key)
+        self.assertEqual(AdaptiveHashSet.CHAINING, stud_set.get_mode())
+        self.assertEqual(set(keys), set(stud_set))
+
+    def test_non_integer_keys_with_default_hash_function(self):
+        stud_set = AdaptiveHashSet()
+        self.assertTrue(stud_set.insert("key"))
+        self.assertTrue(stud_set.insert(3))
+        self.assertTrue(stud_set.contains("key"))
+        self.assertTrue(stud_set.remove("key"))
+        self.assertFalse(stud_set.contains("key"))
+
+    def test_clear_allows_bitmap_again(self):
+        stud_set = AdaptiveHashSet()
+        stud_set.insert("key")
+        stud_set.clear()
+        for key in range(5000):
+            stud_set.insert(key)
+        self.assertEqual(AdaptiveHashSet.BITMAP, stud_set.get_mode())
+        self.assertEqual(set(range(5000)), set(stud_set))
+
+
+if __name__ == '__main__':
+    unittest.main()
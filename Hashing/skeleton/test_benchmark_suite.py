@@ -0,0 +1,46 @@
+import contextlib
+import io
+import json
+import random
+import unittest
+
+import benchmark_suite
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_all_backends_agree_with_builtin_set(self):
+        keys = benchmark_suite.key_streams(200)["patterned modulo"]
+        operations = benchmark_suite.make_operations(keys, 1000, benchmark_suite.WORKLOADS["balanced"],
+                                                     random.Random(1))
+        for name, factory in benchmark_suite.BACKENDS.items():
+            reference = benchmark_suite.BuiltinSet()
+            stud_set = factory()
+            for operation, key in operations:
+                self.assertEqual(getattr(reference, operation)(key), getattr(stud_set, operation)(key),
+                                 name + "." + operation + "(" + str(key) + ") differs from the built-in set")
+            self.assertEqual(reference.get_table_size(), stud_set.get_table_size(), name)
+            benchmark_suite.close(stud_set)
+
+    def test_static_backends_agree_with_builtin_set(self):
+        keys = benchmark_suite.key_streams(200)["uniform"]
+        operations = benchmark_suite.make_operations(keys, 1000, benchmark_suite.WORKLOADS["read heavy"],
+                                                     random.Random(1))
+        for name, factory in benchmark_suite.STATIC_BACKENDS.items():
+            stud_set = factory(keys[:100])
+            for _, key in operations:
+                self.assertEqual(key in keys[:100], stud_set.contains(key), name + ".contains(" + str(key) + ")")
+
+    def test_json_report(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            benchmark_suite.main(["--keys", "30", "--operations", "50",
+                                  "--backends", "builtin set,chaining,frozen chd"])
+        report = json.loads(output.getvalue())
+        self.assertEqual(30, report["meta"]["keys"])
+        self.assertEqual(3 * 4 * 3, len(report["results"]))
+        for field in ("backend", "stream", "workload", "ops_per_s", "bytes_per_key", "p99_us"):
+            self.assertIn(field, report["results"][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
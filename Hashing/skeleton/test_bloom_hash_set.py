@@ -0,0 +1,50 @@
+import unittest
+
+from bloom_filter import BloomFilter, CountingBloomFilter
+from bloom_hash_set import BloomHashSet
+from hash_set_test_case import HashSetTestCase
+
+
+class TestBloomHashSet(HashSetTestCase):
+    def test_filters_have_no_false_negatives(self):
+        for bloom_filter in (BloomFilter(1000, 7), CountingBloomFilter(1000, 7)):
+            for key in range(0, 1000, 7):
+                bloom_filter.add(key)
+            self.assertTrue(all(bloom_filter.might_contain(key) for key in range(0, 1000, 7)))
+
+    def test_counting_filter_remove(self):
+        bloom_filter = CountingBloomFilter(1000, 5)
+        bloom_filter.add(42)
+        bloom_filter.add(43)
+        bloom_filter.remove(42)
+        self.assertFalse(bloom_filter.might_contain(42))
+        self.assertTrue(bloom_filter.might_contain(43))
+
+    def test_random_operations(self):
+        for counting in (True, False):
+            stud_set, expected = self.assert_matches_builtin(
+                lambda: BloomHashSet(capacity=64, expected_keys=16, counting=counting), 600, 4000, seed=2)
+            self.assertTrue(stud_set.filter_keys >= len(expected))
+
+    def test_false_positive_rate_is_reported(self):
+        stud_set = BloomHashSet(capacity=1000, expected_keys=1000, bits_per_key=10)
+        for key in range(1000):
+            stud_set.insert(key)
+        for key in range(1000, 21000):
+            self.assertFalse(stud_set.contains(key))
+        self.assertEqual(20000, stud_set.filtered_count + stud_set.false_positive_count)
+        self.assertTrue(stud_set.get_false_positive_rate() < 0.05)
+        self.assertTrue(0 < stud_set.get_estimated_false_positive_rate() < 0.05)
+
+    def test_rebuild_after_removals(self):
+        stud_set = BloomHashSet(capacity=100, expected_keys=100, counting=False, rebuild_ratio=0.5)
+        for key in range(100):
+            stud_set.insert(key)
+        for key in range(34):
+            stud_set.remove(key)
+        self.assertEqual(0, stud_set.removed_since_rebuild, "filter must have been rebuilt")
+        self.assertTrue(sum(1 for key in range(20) if stud_set.bloom_filter.might_contain(key)) < 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import io
+import unittest
+
+from chaining_hash_set import ChainingHashSet
+from hash_functions import GenericHash, UniversalHash
+from hash_set_test_case import HashSetTestCase
+from incremental_hash_set import IncrementalHashSet
+from linear_hash_set import LinearHashSet
+from snapshot_hash_set import SnapshotHashSet
+from treeifying_hash_set import TreeifyingHashSet
+
+
+class TestResizing(HashSetTestCase):
+    def test_no_resize_by_default(self):
+        stud_set = ChainingHashSet(capacity=1)
+        for key in range(20):
+            self.assertTrue(stud_set.insert(key))
+        self.assertEqual(1, stud_set.capacity, "capacity must not change without max_load_factor")
+        self.assertEqual(0, stud_set.resize_count)
+
+    def test_resize_keeps_keys(self):
+        stud_set = ChainingHashSet(capacity=2, max_load_factor=0.75)
+        for key in range(100):
+            self.assertTrue(stud_set.insert(key))
+        self.assertEqual(100, stud_set.get_table_size())
+        self.assertTrue(stud_set.get_load_factor() <= 0.75)
+        for key in range(100):
+            self.assertTrue(stud_set.contains(key), ".contains(" + str(key) + ") returned False after resize")
+
+    def test_default_capacity_grows(self):
+        for stud_set in (ChainingHashSet(), ChainingHashSet(max_load_factor=0.75), IncrementalHashSet()):
+            self.assert_starts_empty(stud_set)
+
+    def test_insert_none_raises(self):
+        self.assertRaises(ValueError, ChainingHashSet(11).insert, None)
+        self.assertRaises(ValueError, ChainingHashSet(11).contains, None)
+        self.assertRaises(ValueError, ChainingHashSet(11).remove, None)
+
+
+class TestSetAlgebra(unittest.TestCase):
+    def build(self, keys, capacity, hash_function=None):
+        stud_set = ChainingHashSet(capacity, max_load_factor=2.0, hash_function=hash_function)
+        for key in keys:
+            stud_set.insert(key)
+        return stud_set
+
+    def check(self, first, second):
+        a = set(range(0, 300, 3))
+        b = set(range(0, 300, 5))
+        set_a = self.build(a, *first)
+        set_b = self.build(b, *second)
+        self.assertEqual(a | b, set(set_a.union(set_b).iter_keys()))
+        self.assertEqual(a & b, set(set_a.intersection(set_b).iter_keys()))
+        self.assertEqual(a - b, set(set_a.difference(set_b).iter_keys()))
+        self.assertEqual(b - a, set(set_b.difference(set_a).iter_keys()))
+        self.assertEqual(len(a | b), set_a.union(set_b).get_table_size())
+        self.assertFalse(set_a.issubset(set_b))
+        self.assertTrue(set_a.intersection(set_b).issubset(set_b))
+        self.assertTrue(set_b.issubset(set_a.union(set_b)))
+
+    def test_aligned_sets(self):
+        self.check((64,), (64,))
+        self.check((64, UniversalHash(seed=1)), (64, UniversalHash(seed=1)))
+
+    def test_unaligned_sets(self):
+        self.check((64,), (17,))
+        self.check((64, UniversalHash(seed=1)), (64, UniversalHash(seed=2)))
+
+    def test_aligned_merge_keeps_bucket_layout(self):
+        set_a = self.build([1, 12, 23], 11)
+        set_b = self.build([12, 34], 11)
+        self.assertTrue(set_a.is_aligned_with(set_b))
+        union = set_a.union(set_b)
+        self.assertEqual(11, union.capacity)
+        self.assertEqual([1, 12, 23, 34], union.chain_keys(union.get_hash_table()[1]))
+        self.assertEqual([12], set_a.intersection(set_b).chain_keys(set_a.intersection(set_b).get_hash_table()[1]))
+
+
+class TestStreamingExportImport(unittest.TestCase):
+    def test_to_string_format(self):
+        stud_set = ChainingHashSet(capacity=4)
+        for key in (4, 1, 8, 5):
+            stud_set.insert(key)
+        self.assertEqual("0 {4, 8}, 1 {1, 5}, 2}, 3}", stud_set.to_string())
+        buffer = io.StringIO()
+        stud_set.write_string(buffer)
+        self.assertEqual(stud_set.to_string(), buffer.getvalue())
+        self.assertEqual("", ChainingHashSet().to_string())
+
+    def test_iteration(self):
+        stud_set = ChainingHashSet(capacity=4)
+        for key in (4, 1, 8, 5):
+            stud_set.insert(key)
+        self.assertEqual([4, 8, 1, 5], list(stud_set))
+
+    def test_dump_and_load(self):
+        stud_set = ChainingHashSet(capacity=7, max_load_factor=1.0)
+        for key in range(0, 100, 3):
+            stud_set.insert(key)
+        buffer = io.StringIO()
+        stud_set.dump(buffer)
+        buffer.seek(0)
+        loaded = ChainingHashSet.load(buffer, max_load_factor=1.0)
+        self.assertEqual(stud_set.get_table_size(), loaded.get_table_size())
+        self.assertEqual(set(stud_set), set(loaded))
+        self.assertRaises(ValueError, ChainingHashSet.load, io.StringIO("1\n2\n"))
+        for set_class in (TreeifyingHashSet, SnapshotHashSet, LinearHashSet):
+            buffer.seek(0)
+            loaded = set_class.load(buffer, max_load_factor=1.0, hash_function=GenericHash())
+            self.assertIsInstance(loaded, set_class)
+            self.assertEqual(set(stud_set), set(loaded))
+            self.assertTrue(all(loaded.contains(key) for key in range(0, 100, 3)))
+
+    def test_bulk_insert(self):
+        stud_set = ChainingHashSet(capacity=2, max_load_factor=0.75)
+        self.assertEqual(100, stud_set.bulk_insert(list(range(100)), unique=True))
+        self.assertEqual(1, stud_set.resize_count, "table must be pre-sized once")
+        self.assertEqual(100, stud_set.get_table_size())
+        self.assertEqual(5, stud_set.bulk_insert([1, 2, 100, 101, 102, 103, 104, 100]))
+        self.assertTrue(all(stud_set.contains(key) for key in range(105)))
+        self.assertTrue(stud_set.get_load_factor() <= 0.75)
+        empty = ChainingHashSet()
+        self.assertEqual(3, empty.bulk_insert([7, 8, 9], unique=True))
+        self.assertTrue(empty.contains(8))
+
+
+if __name__ == '__main__':
+    unittest.main()
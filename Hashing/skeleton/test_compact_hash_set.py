@@ -0,0 +1,48 @@
+import unittest
+
+from chaining_hash_node import ChainingHashNode
+from chaining_hash_set import ChainingHashSet
+from compact_hash_set import CompactHashSet, SlottedHashSet
+from hash_set_test_case import HashSetTestCase
+
+
+class TestCompactHashSet(HashSetTestCase):
+    def test_same_behaviour_as_linked_layout(self):
+        for stud_set in (CompactHashSet(11), CompactHashSet(11, bucket_type=CompactHashSet.ARRAY),
+                         SlottedHashSet(11)):
+            reference = ChainingHashSet(11)
+            for key in (5, 6, 11, 12, 13, 17, 28, 6):
+                self.assertEqual(reference.insert(key), stud_set.insert(key))
+            self.assertEqual(reference.to_string(), stud_set.to_string())
+            for key in (17, 6, 40):
+                self.assertEqual(reference.remove(key), stud_set.remove(key))
+            self.assertEqual(reference.to_string(), stud_set.to_string())
+            self.assertEqual(reference.get_table_size(), stud_set.get_table_size())
+            self.assertTrue(stud_set.contains(28))
+            self.assertFalse(stud_set.contains(17))
+
+    def test_set_hash_table_adapter(self):
+        table = [ChainingHashNode(11), None, ChainingHashNode(2)]
+        table[2].next = ChainingHashNode(5)
+        stud_set = CompactHashSet()
+        stud_set.set_hash_table(table)
+        self.assertEqual(3, stud_set.get_table_size())
+        self.assertEqual([2, 5], stud_set.hash_table[2])
+        self.assertTrue(stud_set.contains(5))
+        self.assertEqual(5, stud_set.get_hash_table()[2].next.key)
+
+    def test_resize(self):
+        stud_set = CompactHashSet(2, max_load_factor=2.0, bucket_type=CompactHashSet.ARRAY)
+        for key in range(100):
+            stud_set.insert(key)
+        self.assertTrue(stud_set.capacity >= 50)
+        self.assertTrue(all(stud_set.contains(key) for key in range(100)))
+
+    def test_default_constructor(self):
+        for bucket_type in (CompactHashSet.LIST, CompactHashSet.ARRAY):
+            self.assert_starts_empty(CompactHashSet(bucket_type=bucket_type))
+        self.assert_starts_empty(SlottedHashSet())
+
+
+if __name__ == '__main__':
+    unittest.main()
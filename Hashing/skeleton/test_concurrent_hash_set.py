@@ -0,0 +1,59 @@
+import threading
+import unittest
+
+from chaining_hash_node import ChainingHashNode
+from concurrent_hash_set import ConcurrentHashSet
+
+
+class TestConcurrentHashSet(unittest.TestCase):
+    def test_parallel_inserts_and_removes(self):
+        stud_set = ConcurrentHashSet(capacity=4, stripes=8)
+
+        def work(offset):
+            for key in range(offset, 20000, 4):
+                self.assertTrue(stud_set.insert(key))
+            for key in range(offset, 20000, 8):
+                self.assertTrue(stud_set.remove(key))
+
+        threads = [threading.Thread(target=work, args=(offset,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(10000, stud_set.get_table_size())
+        self.assertTrue(stud_set.resize_count > 0)
+        for key in range(0, 20000, 997):
+            self.assertEqual(key % 8 >= 4, stud_set.contains(key), "wrong result for " + str(key))
+
+    def test_testing_hooks(self):
+        stud_set = ConcurrentHashSet(capacity=11, stripes=4)
+        table = [None] * 11
+        table[3] = ChainingHashNode(14)
+        table[3].next = ChainingHashNode(25)
+        stud_set.set_hash_table(table)
+        self.assertEqual(2, stud_set.get_table_size())
+        self.assertTrue(stud_set.remove(25))
+        self.assertEqual(1, stud_set.get_table_size())
+        stud_set.clear()
+        self.assertEqual(0, stud_set.get_table_size())
+
+    def test_grows_when_one_stripe_is_full(self):
+        stud_set = ConcurrentHashSet(capacity=16, max_load_factor=0.75, stripes=4)
+        for key in (0, 4, 8):
+            stud_set.insert(key)
+        self.assertEqual(0, stud_set.resize_count, "stripe 0 holds 3 keys in 4 buckets")
+        stud_set.insert(12)
+        self.assertEqual(1, stud_set.resize_count, "stripe 0 exceeds the load factor")
+        self.assertEqual(4, stud_set.get_table_size())
+
+    def test_bulk_insert_presizes_with_stored_keys(self):
+        stud_set = ConcurrentHashSet(capacity=8, max_load_factor=1.0, stripes=1)
+        stud_set.bulk_insert(list(range(6)))
+        self.assertEqual(24, stud_set.bulk_insert(list(range(6, 30))))
+        self.assertEqual(1, stud_set.resize_count)
+        self.assertEqual(31, stud_set.capacity)
+        self.assertEqual(30, stud_set.get_table_size())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import random
+import unittest
+
+from cuckoo_hash_set import CuckooHashSet
+from hash_set_test_case import HashSetTestCase
+
+
+class TestCuckooHashSet(HashSetTestCase):
+    def test_random_operations(self):
+        def check_stash(step, stud_set, expected):
+            self.assertTrue(len(stud_set.stash) <= stud_set.stash_size)
+
+        self.assert_matches_builtin(lambda: CuckooHashSet(capacity=8, seed=4), 2000, 5000, seed=4,
+                                    after_step=check_stash)
+
+    def test_keys_stay_in_candidate_buckets(self):
+        stud_set = CuckooHashSet(capacity=64, tables=2, slots=2, seed=1)
+        for key in range(0, 6400, 100):
+            stud_set.insert(key)
+        for key in range(0, 6400, 100):
+            candidates = []
+            for table in range(stud_set.tables):
+                start = stud_set.get_hash_code(key, table) * stud_set.slots
+                candidates.extend(stud_set.get_hash_table()[table][start:start + stud_set.slots])
+            self.assertTrue(key in candidates or key in stud_set.stash)
+        self.assertEqual(8, stud_set.get_max_probes())
+
+    def test_rehash_keeps_evicted_keys(self):
+        # one slot per bucket and a tiny stash force many rehashes that leave keys over
+        for seed in range(5):
+            stud_set = CuckooHashSet(16, tables=2, slots=1, stash_size=1, max_load_factor=0.95, max_kicks=20,
+                                     seed=seed)
+            rng = random.Random(seed)
+            keys = set()
+            for _ in range(3000):
+                key = rng.randrange(10 ** 9)
+                stud_set.insert(key)
+                keys.add(key)
+            stored = [key for table in stud_set.get_hash_table() for key in table if key is not None]
+            stored += stud_set.stash
+            self.assertEqual(len(stored), len(set(stored)), "no key may be stored twice")
+            self.assertEqual(keys, set(stored))
+            self.assertEqual(len(keys), stud_set.get_table_size())
+            self.assertTrue(all(stud_set.contains(key) for key in keys))
+            self.assertTrue(stud_set.rehash_count > 0)
+
+    def test_clear(self):
+        stud_set = CuckooHashSet()
+        stud_set.insert(3)
+        stud_set.clear()
+        self.assertFalse(stud_set.contains(3))
+        self.assertEqual(0, stud_set.get_table_size())
+        self.assertRaises(ValueError, stud_set.contains, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
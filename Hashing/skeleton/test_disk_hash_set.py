@@ -0,0 +1,72 @@
+import gc
+import os
+import random
+import tempfile
+import unittest
+import warnings
+
+from disk_hash_set import DiskHashSet
+
+
+class TestDiskHashSet(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "keys.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_splits_and_reopen(self):
+        keys = random.Random(1).sample(range(-10 ** 6, 10 ** 6), 3000)
+        with DiskHashSet(self.path, page_size=64) as stud_set:
+            for key in keys:
+                self.assertTrue(stud_set.insert(key))
+            self.assertFalse(stud_set.insert(keys[0]))
+            self.assertTrue(stud_set.get_page_count() > 3000 // 7, "full pages must have been split")
+            for key in keys[:1000]:
+                self.assertTrue(stud_set.remove(key))
+            self.assertFalse(stud_set.remove(keys[0]))
+        with DiskHashSet(self.path) as stud_set:
+            self.assertEqual(2000, stud_set.get_table_size())
+            self.assertTrue(all(stud_set.contains(key) for key in keys[1000:]))
+            self.assertFalse(any(stud_set.contains(key) for key in keys[:1000]))
+            self.assertEqual(sorted(keys[1000:]), sorted(stud_set))
+
+    def test_strided_keys(self):
+        # keys sharing all of their low bits must still spread over the directory
+        for stride in (1 << 20, 1 << 40):
+            keys = [i * stride for i in range(2000)]
+            with DiskHashSet(self.path, page_size=64) as stud_set:
+                for key in keys:
+                    self.assertTrue(stud_set.insert(key))
+                self.assertTrue(all(stud_set.contains(key) for key in keys))
+                self.assertTrue(len(stud_set.directory) <= 4096, "the directory must stay proportional to the pages")
+                stud_set.clear()
+
+    def test_clear(self):
+        with DiskHashSet(self.path, page_size=64) as stud_set:
+            for key in range(100):
+                stud_set.insert(key)
+            stud_set.clear()
+            self.assertEqual(0, stud_set.get_table_size())
+            self.assertEqual(1, stud_set.get_page_count())
+            self.assertFalse(stud_set.contains(5))
+            self.assertTrue(stud_set.insert(5))
+            self.assertRaises(ValueError, stud_set.insert, None)
+
+    def test_invalid_file_is_closed(self):
+        with open(self.path, "wb") as file:
+            file.write(b"NOTAHASHSET" * 100)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            self.assertRaises(ValueError, DiskHashSet, self.path)
+            with DiskHashSet(self.path + "2", page_size=64) as stud_set:
+                stud_set.insert(1)
+            os.remove(self.path + "2.dir")
+            self.assertRaises(FileNotFoundError, DiskHashSet, self.path + "2")
+            gc.collect()
+        self.assertEqual([], [warning for warning in caught if issubclass(warning.category, ResourceWarning)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import random
+import unittest
+
+from chaining_hash_set import ChainingHashSet
+from frozen_hash_set import FrozenHashSet
+
+
+class TestFrozenHashSet(unittest.TestCase):
+    def test_freeze(self):
+        rng = random.Random(12)
+        keys = rng.sample(range(-10 ** 12, 10 ** 12), 2000) + [0]
+        stud_set = ChainingHashSet(capacity=64, max_load_factor=0.75)
+        for key in keys:
+            stud_set.insert(key)
+        frozen = stud_set.freeze()
+        self.assertEqual(len(keys), frozen.get_table_size())
+        self.assertTrue(all(frozen.contains(key) for key in keys))
+        absent = [key for key in range(1, 100000, 7) if not stud_set.contains(key)]
+        self.assertFalse(any(frozen.contains(key) for key in absent))
+        self.assertEqual(set(keys), set(frozen))
+        self.assertEqual(len(keys), len(set(frozen.get_hash_code(key) for key in keys)), "hash must be perfect")
+        stud_set.insert(1)
+        self.assertFalse(frozen.contains(1), "frozen copy must not follow later changes")
+        self.assertRaises(ValueError, frozen.contains, None)
+
+    def test_minimal_and_generic_keys(self):
+        keys = ["key" + str(i) for i in range(500)] + [("tuple", 1), 2.5]
+        frozen = FrozenHashSet(keys + keys[:10], load_factor=1.0)
+        self.assertEqual(len(keys), len(frozen.slots), "load_factor 1.0 gives a minimal perfect hash")
+        self.assertEqual(set(keys), set(frozen))
+        self.assertTrue(frozen.contains(("tuple", 1)))
+        self.assertFalse(frozen.contains("key500"))
+
+    def test_empty(self):
+        frozen = ChainingHashSet().freeze()
+        self.assertEqual(0, frozen.get_table_size())
+        self.assertFalse(frozen.contains(0))
+        self.assertEqual([], list(frozen))
+
+
+if __name__ == '__main__':
+    unittest.main()
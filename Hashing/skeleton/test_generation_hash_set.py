@@ -0,0 +1,41 @@
+import unittest
+
+from generation_hash_set import GenerationHashSet
+from hash_set_test_case import HashSetTestCase
+
+
+class TestGenerationHashSet(HashSetTestCase):
+    def test_clear_is_lazy(self):
+        stud_set = GenerationHashSet(capacity=11)
+        for key in (5, 16, 7):
+            stud_set.insert(key)
+        table = stud_set.hash_table
+        stud_set.clear()
+        self.assertIs(table, stud_set.hash_table, "clear must not allocate a new table")
+        self.assertEqual(0, stud_set.get_table_size())
+        self.assertFalse(stud_set.contains(16))
+        self.assertFalse(stud_set.remove(7))
+        self.assertTrue(all(node is None for node in stud_set.get_hash_table()))
+        self.assertTrue(stud_set.insert(16))
+        self.assertEqual(16, stud_set.get_hash_table()[5].key)
+        self.assertIsNone(stud_set.get_hash_table()[5].next, "stale key 5 must not survive in the chain")
+        self.assertEqual(1, stud_set.get_table_size())
+
+    def test_random_operations_with_clear_and_resize(self):
+        def clear_sometimes(step, stud_set, expected):
+            if step % 700 == 699:
+                stud_set.clear()
+                expected.clear()
+                self.assertEqual(0, stud_set.get_table_size())
+
+        stud_set, expected = self.assert_matches_builtin(lambda: GenerationHashSet(capacity=4, max_load_factor=1.0),
+                                                         300, 5000, seed=8, after_step=clear_sometimes)
+        self.assertEqual(expected, set(stud_set))
+
+    def test_default_constructor(self):
+        self.assert_starts_empty(GenerationHashSet())
+        self.assert_starts_empty(GenerationHashSet(max_load_factor=0.75))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from chaining_hash_set import ChainingHashSet
+from hash_functions import FibonacciHash, GenericHash, UniversalHash
+from incremental_hash_set import IncrementalHashSet
+
+
+class TestHashFunctions(unittest.TestCase):
+    def test_default_is_modulo(self):
+        stud_set = ChainingHashSet(capacity=11)
+        self.assertEqual(5, stud_set.get_hash_code(16))
+
+    def test_index_in_range(self):
+        for hash_function in (FibonacciHash(), UniversalHash(seed=3), GenericHash()):
+            for capacity in (1, 7, 16, 1000):
+                for key in (0, 1, -1, 10, 2 ** 70, 123456789):
+                    hash_code = hash_function(key, capacity)
+                    self.assertTrue(0 <= hash_code < capacity, type(hash_function).__name__ + " out of range")
+
+    def test_universal_seed_is_deterministic(self):
+        self.assertEqual(UniversalHash(seed=5)(12345, 101), UniversalHash(seed=5)(12345, 101))
+
+    def test_patterned_keys_spread(self):
+        stud_set = ChainingHashSet(capacity=100, hash_function=FibonacciHash())
+        for i in range(100):
+            stud_set.insert(i * 10)
+        used = sum(1 for node in stud_set.get_hash_table() if node is not None)
+        self.assertTrue(used > 50, "multiples of 10 only used " + str(used) + " of 100 buckets")
+
+    def test_generic_keys_with_resize(self):
+        stud_set = ChainingHashSet(capacity=2, max_load_factor=1.0, hash_function=GenericHash())
+        keys = ["key" + str(i) for i in range(50)] + [("tuple", i) for i in range(50)]
+        for key in keys:
+            self.assertTrue(stud_set.insert(key))
+        self.assertFalse(stud_set.insert("key7"))
+        for key in keys:
+            self.assertTrue(stud_set.contains(key))
+            self.assertIsNotNone(stud_set.get_hash_table()[stud_set.get_hash_code(key)].hash_value)
+        self.assertTrue(stud_set.remove(("tuple", 3)))
+        self.assertFalse(stud_set.contains(("tuple", 3)))
+
+    def test_incremental_with_hash_function(self):
+        stud_set = IncrementalHashSet(capacity=4, migrate_buckets=1, hash_function=GenericHash())
+        for i in range(200):
+            self.assertTrue(stud_set.insert("k" + str(i)))
+        for i in range(200):
+            self.assertTrue(stud_set.contains("k" + str(i)))
+
+
+if __name__ == '__main__':
+    unittest.main()
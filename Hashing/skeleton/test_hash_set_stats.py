@@ -0,0 +1,81 @@
+import unittest
+
+from bloom_hash_set import BloomHashSet
+from chaining_hash_set import ChainingHashSet
+from compact_hash_set import CompactHashSet
+from concurrent_hash_set import ConcurrentHashSet
+from generation_hash_set import GenerationHashSet
+from lru_hash_set import LRUHashSet
+from self_organizing_hash_set import SelfOrganizingHashSet
+from snapshot_hash_set import SnapshotHashSet
+from treeifying_hash_set import TreeifyingHashSet
+from ttl_hash_set import TTLHashSet
+
+
+class TestHashSetStats(unittest.TestCase):
+    def test_table_shape(self):
+        stud_set = ChainingHashSet(capacity=11)
+        for key in (5, 6, 17, 28, 1):
+            stud_set.insert(key)
+        stats = stud_set.get_stats()
+        self.assertEqual(5, stats["size"])
+        self.assertAlmostEqual(5 / 11, stats["load_factor"])
+        self.assertEqual(3, stats["max_chain"])
+        self.assertEqual({0: 8, 1: 2, 3: 1}, stats["chain_histogram"])
+        self.assertEqual(8, stats["empty_buckets"])
+        self.assertNotIn("avg_probes_hit", stats, "probe counters must be opt-in")
+
+    def test_probe_counters(self):
+        stud_set = ChainingHashSet(capacity=11, max_load_factor=5.0)
+        for key in (6, 17, 28):
+            stud_set.insert(key)
+        stud_set.enable_stats()
+        self.assertTrue(stud_set.contains(28))
+        self.assertTrue(stud_set.contains(6))
+        self.assertFalse(stud_set.contains(39))
+        self.assertFalse(stud_set.contains(1))
+        stats = stud_set.get_stats()
+        self.assertEqual(2, stats["hit_lookups"])
+        self.assertEqual(2.0, stats["avg_probes_hit"])
+        self.assertEqual(2, stats["miss_lookups"])
+        self.assertEqual(1.5, stats["avg_probes_miss"])
+        self.assertEqual(0, stats["resize_count"])
+        stud_set.disable_stats()
+        self.assertNotIn("hit_lookups", stud_set.get_stats())
+
+    def test_probe_counters_in_subclasses(self):
+        factories = [lambda: TreeifyingHashSet(11, 5.0), lambda: SelfOrganizingHashSet(11, 5.0),
+                     lambda: CompactHashSet(11, 5.0), lambda: CompactHashSet(11, 5.0, bucket_type=CompactHashSet.ARRAY),
+                     lambda: GenerationHashSet(11, 5.0), lambda: TTLHashSet(11, 5.0), lambda: LRUHashSet(8),
+                     lambda: ConcurrentHashSet(11, 5.0), lambda: BloomHashSet(11, 5.0), lambda: SnapshotHashSet(11, 5.0)]
+        for factory in factories:
+            stud_set = factory()
+            for key in (6, 17, 28):
+                stud_set.insert(key)
+            stud_set.enable_stats()
+            self.assertTrue(stud_set.contains(28))
+            self.assertTrue(stud_set.contains(6))
+            self.assertFalse(stud_set.contains(39))
+            self.assertFalse(stud_set.contains(1))
+            stats = stud_set.get_stats()
+            name = type(stud_set).__name__
+            self.assertEqual(2, stats["hit_lookups"], name)
+            self.assertEqual(2, stats["miss_lookups"], name)
+            self.assertTrue(1 <= stats["avg_probes_hit"] <= 3, name)
+            self.assertTrue(stats["avg_probes_miss"] <= 3, name)
+
+    def test_probe_counters_in_tree_buckets(self):
+        stud_set = TreeifyingHashSet(capacity=1, max_load_factor=1000.0)
+        for key in range(100):
+            stud_set.insert(key)
+        stud_set.enable_stats()
+        for key in range(200):
+            stud_set.contains(key)
+        stats = stud_set.get_stats()
+        self.assertEqual(100, stats["hit_lookups"])
+        self.assertEqual(100, stats["miss_lookups"])
+        self.assertTrue(stats["avg_probes_hit"] <= 8, "a tree bucket must not count a walk over all its keys")
+
+
+if __name__ == '__main__':
+    unittest.main()
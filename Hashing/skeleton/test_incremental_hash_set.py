@@ -0,0 +1,61 @@
+import io
+import unittest
+
+from chaining_hash_set import ChainingHashSet
+from hash_functions import GenericHash
+from hash_set_test_case import HashSetTestCase
+from incremental_hash_set import IncrementalHashSet
+
+
+class TestIncrementalHashSet(HashSetTestCase):
+    def test_operations_during_rehash(self):
+        stud_set, _ = self.assert_matches_builtin(lambda: IncrementalHashSet(capacity=4, migrate_buckets=1), 500,
+                                                  3000, seed=7)
+        self.assertTrue(stud_set.resize_count > 0)
+
+    def test_rehash_is_incremental(self):
+        stud_set = IncrementalHashSet(capacity=8, max_load_factor=0.75, migrate_buckets=2)
+        for key in range(7):
+            stud_set.insert(key)
+        self.assertTrue(stud_set.is_rehashing(), "resize must be in progress after crossing the load factor")
+        self.assertEqual(16, stud_set.capacity)
+        for key in range(7):
+            self.assertTrue(stud_set.contains(key))
+        self.assertFalse(stud_set.is_rehashing(), "migration must be finished after enough operations")
+
+    def test_get_hash_table_finishes_rehash(self):
+        stud_set = IncrementalHashSet(capacity=8, max_load_factor=0.75, migrate_buckets=1)
+        for key in range(7):
+            stud_set.insert(key)
+        hash_table = stud_set.get_hash_table()
+        self.assertFalse(stud_set.is_rehashing())
+        self.assertEqual(16, len(hash_table))
+        for key in range(7):
+            self.assertEqual(key, hash_table[key].key)
+
+    def test_constructor_arguments_match_base_class(self):
+        hash_function = GenericHash()
+        stud_set = IncrementalHashSet(4, 0.75, hash_function)
+        self.assertIs(hash_function, stud_set.hash_function)
+        self.assertEqual(4, stud_set.migrate_buckets)
+        self.assertTrue(stud_set.insert("key"))
+        self.assertTrue(stud_set.contains("key"))
+
+    def test_dump_and_load(self):
+        stud_set = ChainingHashSet(capacity=5, max_load_factor=0.75, hash_function=GenericHash())
+        keys = ["key" + str(i) for i in range(40)]
+        for key in keys:
+            stud_set.insert(key)
+        buffer = io.StringIO()
+        stud_set.dump(buffer)
+        buffer.seek(0)
+        hash_function = GenericHash()
+        loaded = IncrementalHashSet.load(buffer, key_type=str, max_load_factor=0.75, hash_function=hash_function)
+        self.assertIsInstance(loaded, IncrementalHashSet)
+        self.assertIs(hash_function, loaded.hash_function)
+        self.assertEqual(40, loaded.get_table_size())
+        self.assertTrue(all(loaded.contains(key) for key in keys))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from chaining_hash_set import ChainingHashSet
+from hash_functions import GenericHash
+from hash_set_test_case import HashSetTestCase
+from linear_hash_set import LinearHashSet
+
+
+class TestLinearHashSet(HashSetTestCase):
+    def test_grows_one_bucket_at_a_time(self):
+        stud_set = LinearHashSet(capacity=4, max_load_factor=1.0)
+        for key in range(4):
+            stud_set.insert(key)
+        self.assertEqual(4, stud_set.capacity)
+        stud_set.insert(4)
+        self.assertEqual(5, stud_set.capacity, "exactly one bucket must be added")
+        self.assertEqual(1, stud_set.split_pointer)
+        self.assertEqual(5, len(stud_set.get_hash_table()))
+        self.assertEqual(4, stud_set.get_hash_table()[4].key, "key 4 must move to the new bucket 4")
+        self.assertEqual(0, stud_set.get_hash_table()[0].key)
+
+    def test_hash_code_uses_split_pointer(self):
+        stud_set = LinearHashSet(capacity=4, max_load_factor=1.0)
+        for key in range(6):
+            stud_set.insert(key)
+        self.assertEqual(2, stud_set.split_pointer)
+        self.assertEqual(5, stud_set.get_hash_code(13), "bucket 1 is split, 13 % 8 must be used")
+        self.assertEqual(2, stud_set.get_hash_code(14), "bucket 2 is not split yet, 14 % 4 must be used")
+
+    def test_random_operations(self):
+        def check_load_factor(step, stud_set, expected):
+            self.assertTrue(stud_set.get_load_factor() <= 0.75)
+
+        for hash_function in (None, GenericHash()):
+            stud_set, expected = self.assert_matches_builtin(
+                lambda: LinearHashSet(capacity=3, max_load_factor=0.75, hash_function=hash_function), 1000, 3000,
+                seed=9, after_step=check_load_factor)
+            self.assertEqual(expected, set(stud_set))
+            stud_set.clear()
+            self.assertEqual(3, stud_set.capacity)
+            self.assertEqual(0, stud_set.get_table_size())
+
+    def test_set_algebra(self):
+        stud_set = LinearHashSet(8)
+        keys = set(range(0, 45, 5))
+        for key in keys:
+            stud_set.insert(key)
+        self.assertTrue(stud_set.split_pointer > 0, "the table must be in the middle of a round")
+        copy = stud_set.copy()
+        self.assertIsInstance(copy, LinearHashSet)
+        self.assertEqual(keys, set(copy))
+        self.assertTrue(all(copy.contains(key) for key in keys))
+        self.assertTrue(copy.insert(100))
+        self.assertFalse(stud_set.contains(100))
+        chaining = ChainingHashSet(stud_set.capacity)
+        for key in keys:
+            chaining.insert(key)
+        self.assertFalse(stud_set.is_aligned_with(chaining))
+        self.assertFalse(chaining.is_aligned_with(stud_set))
+        self.assertEqual(keys, set(stud_set.intersection(chaining)))
+        self.assertEqual(keys, set(chaining.intersection(stud_set)))
+        self.assertEqual(keys | {100}, set(stud_set.union(copy)))
+        self.assertEqual({100}, set(copy.difference(stud_set)))
+        self.assertTrue(stud_set.issubset(chaining))
+        self.assertTrue(chaining.issubset(stud_set))
+        self.assertTrue(stud_set.issubset(copy))
+        self.assertFalse(copy.issubset(stud_set))
+
+
+if __name__ == '__main__':
+    unittest.main()
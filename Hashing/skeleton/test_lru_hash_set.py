@@ -0,0 +1,69 @@
+import collections
+import io
+import random
+import unittest
+
+from chaining_hash_set import ChainingHashSet
+from hash_functions import GenericHash
+from lru_hash_set import LRUHashSet
+
+
+class TestLRUHashSet(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        stud_set = LRUHashSet(3)
+        for key in (1, 2, 3):
+            self.assertTrue(stud_set.insert(key))
+        self.assertFalse(stud_set.insert(1), "1 is refreshed, 2 is now the oldest key")
+        self.assertTrue(stud_set.contains(3))
+        self.assertTrue(stud_set.insert(4))
+        self.assertFalse(stud_set.contains(2))
+        self.assertEqual([1, 3, 4], list(stud_set.iter_keys_by_recency()))
+        self.assertEqual(3, stud_set.get_table_size())
+        self.assertEqual(1, stud_set.eviction_count)
+        self.assertEqual(2, stud_set.hit_count)
+        self.assertRaises(ValueError, stud_set.insert, None)
+
+    def test_against_ordered_dict(self):
+        stud_set = LRUHashSet(50, hash_function=GenericHash())
+        expected = collections.OrderedDict()
+        rng = random.Random(3)
+        for _ in range(5000):
+            key = rng.randrange(120)
+            operation = rng.randrange(3)
+            if operation == 0:
+                self.assertEqual(key not in expected, stud_set.insert(key))
+                expected[key] = True
+                expected.move_to_end(key)
+                if len(expected) > 50:
+                    expected.popitem(last=False)
+            elif operation == 1:
+                self.assertEqual(key in expected, stud_set.contains(key))
+                if key in expected:
+                    expected.move_to_end(key)
+            else:
+                self.assertEqual(key in expected, stud_set.remove(key))
+                expected.pop(key, None)
+            self.assertEqual(list(expected), list(stud_set.iter_keys_by_recency()))
+        self.assertEqual(set(expected), set(stud_set))
+        self.assertEqual(0, stud_set.resize_count, "the table is sized for max_size up front")
+
+    def test_dump_and_load(self):
+        stud_set = ChainingHashSet(capacity=7)
+        for key in range(30):
+            stud_set.insert(key)
+        buffer = io.StringIO()
+        stud_set.dump(buffer)
+        buffer.seek(0)
+        loaded = LRUHashSet.load(buffer)
+        self.assertIsInstance(loaded, LRUHashSet)
+        self.assertEqual(30, loaded.max_size)
+        self.assertEqual(set(range(30)), set(loaded.iter_keys_by_recency()))
+        self.assertEqual(0, loaded.eviction_count)
+        buffer.seek(0)
+        loaded = LRUHashSet.load(buffer, max_size=10, hash_function=GenericHash())
+        self.assertEqual(10, loaded.get_table_size())
+        self.assertEqual(20, loaded.eviction_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import random
+import unittest
+
+try:
+    import numpy as np
+    from numpy_int_hash_set import NumpyIntHashSet
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestNumpyIntHashSet(unittest.TestCase):
+    def test_insert_many_contains_many(self):
+        stud_set = NumpyIntHashSet(capacity=4)
+        keys = np.array([5, -3, 2 ** 62, 5, 17, 0, -2 ** 63], dtype=np.int64)
+        self.assertEqual(6, stud_set.insert_many(keys), "duplicates must only be inserted once")
+        self.assertEqual(0, stud_set.insert_many(keys[:3]))
+        self.assertEqual(6, stud_set.get_table_size())
+        found = stud_set.contains_many([5, 6, -3, 2 ** 62, 1, -2 ** 63])
+        self.assertEqual([True, False, True, True, False, True], found.tolist())
+
+    def test_against_builtin_set(self):
+        rng = np.random.default_rng(3)
+        stud_set = NumpyIntHashSet()
+        expected = set()
+        for _ in range(20):
+            batch = rng.integers(-500, 500, size=100)
+            stud_set.insert_many(batch)
+            expected.update(batch.tolist())
+            for key in rng.integers(-500, 500, size=10).tolist():
+                self.assertEqual(key in expected, stud_set.remove(key))
+                expected.discard(key)
+            self.assertEqual(len(expected), stud_set.get_table_size())
+            queries = np.arange(-600, 600)
+            self.assertEqual([key in expected for key in queries.tolist()], stud_set.contains_many(queries).tolist())
+
+    def test_single_key_api(self):
+        stud_set = NumpyIntHashSet()
+        self.assertTrue(stud_set.insert(42))
+        self.assertFalse(stud_set.insert(42))
+        self.assertTrue(stud_set.contains(42))
+        self.assertTrue(stud_set.remove(42))
+        self.assertFalse(stud_set.contains(42))
+        self.assertRaises(ValueError, stud_set.insert, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import random
+import unittest
+
+from hash_functions import FibonacciHash
+from parallel_build import parallel_build
+
+
+class TestParallelBuild(unittest.TestCase):
+    def test_matches_sequential_build(self):
+        rng = random.Random(6)
+        keys = [rng.randrange(-10 ** 9, 10 ** 9) for _ in range(3000)] + [7, 7, -7]
+        for workers, hash_function in ((1, None), (2, None), (3, FibonacciHash())):
+            stud_set = parallel_build(keys, workers=workers, hash_function=hash_function)
+            self.assertEqual(len(set(keys)), stud_set.get_table_size())
+            self.assertEqual(set(keys), set(stud_set))
+            self.assertTrue(stud_set.get_load_factor() <= 0.75)
+            for i, node in enumerate(stud_set.get_hash_table()):
+                while node is not None:
+                    self.assertEqual(i, stud_set.get_hash_code(node.key), "key stitched into the wrong bucket")
+                    node = node.next
+
+    def test_empty_input(self):
+        self.assertEqual(0, parallel_build([], workers=2).get_table_size())
+
+
+if __name__ == '__main__':
+    unittest.main()
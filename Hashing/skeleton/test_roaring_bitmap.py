@@ -0,0 +1,49 @@
+import unittest
+
+from hash_set_test_case import HashSetTestCase
+from roaring_bitmap import RoaringBitmap
+
+
+class TestRoaringBitmap(HashSetTestCase):
+    def test_random_operations(self):
+        def optimize_sometimes(step, stud_set, expected):
+            if step % 5000 == 4999:
+                stud_set.run_optimize()
+
+        def keyspace(rng):
+            return rng.choice((rng.randrange(70000), rng.randrange(-10 ** 6, 10 ** 6), 200000 + rng.randrange(9000)))
+
+        stud_set, expected = self.assert_matches_builtin(RoaringBitmap, keyspace, 20000, seed=15,
+                                                         after_step=optimize_sometimes)
+        self.assertEqual(sorted(expected), list(stud_set))
+        self.assertRaises(ValueError, stud_set.insert, None)
+
+    def test_containers(self):
+        stud_set = RoaringBitmap.from_keys(range(200000))
+        self.assertEqual({"RunContainer": 4}, stud_set.get_container_counts())
+        self.assertTrue(stud_set.get_size_in_bytes() < 1000)
+        self.assertTrue(stud_set.remove(70000))
+        self.assertEqual(200000 - 1, stud_set.get_table_size())
+        self.assertFalse(stud_set.contains(70000))
+        stud_set = RoaringBitmap()
+        for key in range(0, 2 * 5000, 2):
+            stud_set.insert(key)
+        self.assertEqual({"BitmapContainer": 1}, stud_set.get_container_counts())
+        for key in range(0, 2 * 1000, 2):
+            stud_set.remove(key)
+        self.assertEqual({"ArrayContainer": 1}, stud_set.get_container_counts())
+
+    def test_set_algebra(self):
+        first = RoaringBitmap.from_keys(list(range(0, 150000)) + [10 ** 9])
+        second = RoaringBitmap.from_keys(range(100000, 400000, 3))
+        keys_first, keys_second = set(first), set(second)
+        self.assertEqual(sorted(keys_first | keys_second), list(first.union(second)))
+        self.assertEqual(sorted(keys_first & keys_second), list(first.intersection(second)))
+        self.assertEqual(sorted(keys_first - keys_second), list(first.difference(second)))
+        self.assertEqual(len(keys_second - keys_first), second.difference(first).get_table_size())
+        self.assertTrue(first.intersection(second).issubset(second))
+        self.assertFalse(first.issubset(second))
+
+
+if __name__ == '__main__':
+    unittest.main()
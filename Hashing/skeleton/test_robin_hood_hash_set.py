@@ -0,0 +1,30 @@
+import unittest
+
+from hash_set_test_case import HashSetTestCase
+from robin_hood_hash_set import RobinHoodHashSet
+
+
+class TestRobinHoodHashSet(HashSetTestCase):
+    def test_random_operations(self):
+        self.assert_matches_builtin(lambda: RobinHoodHashSet(capacity=4), 300, 5000, seed=11)
+
+    def test_backward_shift_deletion(self):
+        stud_set = RobinHoodHashSet(capacity=11, max_load_factor=0.9)
+        for key in (1, 12, 23, 2):
+            stud_set.insert(key)
+        self.assertEqual([None, 1, 12, 23, 2], stud_set.get_hash_table()[:5])
+        self.assertTrue(stud_set.remove(12))
+        self.assertEqual([None, 1, 23, 2, None], stud_set.get_hash_table()[:5])
+        self.assertEqual("0 {}, 1 {1}, 2 {23}, 3 {2}, 4 {}", stud_set.to_string()[:32])
+
+    def test_clear(self):
+        stud_set = RobinHoodHashSet(capacity=11)
+        for key in range(5):
+            stud_set.insert(key)
+        stud_set.clear()
+        self.assertEqual(0, stud_set.get_table_size())
+        self.assertFalse(stud_set.contains(3))
+
+
+if __name__ == '__main__':
+    unittest.main()
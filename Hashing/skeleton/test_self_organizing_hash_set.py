@@ -0,0 +1,42 @@
+import random
+import unittest
+
+from hash_set_test_case import HashSetTestCase
+from self_organizing_hash_set import SelfOrganizingHashSet
+
+
+class TestSelfOrganizingHashSet(HashSetTestCase):
+    def fill(self, policy):
+        stud_set = SelfOrganizingHashSet(capacity=11, policy=policy)
+        for key in (3, 14, 25, 36):
+            stud_set.insert(key)
+        return stud_set
+
+    def test_move_to_front(self):
+        stud_set = self.fill(SelfOrganizingHashSet.MOVE_TO_FRONT)
+        self.assertTrue(stud_set.contains(25))
+        node = stud_set.get_hash_table()[3]
+        self.assertEqual([25, 3, 14, 36], [node.key, node.next.key, node.next.next.key, node.next.next.next.key])
+        self.assertEqual(3, stud_set.probe_count)
+
+    def test_transpose(self):
+        stud_set = self.fill(SelfOrganizingHashSet.TRANSPOSE)
+        self.assertTrue(stud_set.contains(25))
+        self.assertTrue(stud_set.contains(25))
+        node = stud_set.get_hash_table()[3]
+        self.assertEqual([25, 3, 14, 36], [node.key, node.next.key, node.next.next.key, node.next.next.next.key])
+
+    def test_no_policy_keeps_order_and_misses(self):
+        stud_set = self.fill(None)
+        self.assertTrue(stud_set.contains(36))
+        self.assertFalse(stud_set.contains(47))
+        self.assertEqual(14, stud_set.get_hash_table()[3].next.key)
+        self.assertEqual(4.0, stud_set.get_average_probe_length())
+        self.assertRaises(ValueError, SelfOrganizingHashSet, 11, None, None, "random")
+
+    def test_default_constructor(self):
+        self.assert_starts_empty(SelfOrganizingHashSet())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import random
+import unittest
+
+from sharded_hash_set import ShardedHashSet
+
+
+class TestShardedHashSet(unittest.TestCase):
+    def test_batches_and_rebalancing(self):
+        rng = random.Random(9)
+        keys = [rng.randrange(10 ** 9) for _ in range(3000)]
+        with ShardedHashSet(shards=2) as stud_set:
+            self.assertEqual([True] * len(keys), stud_set.insert_many(keys))
+            self.assertEqual([False, True], stud_set.insert_many([keys[0], -1]))
+            sizes = stud_set.get_shard_sizes()
+            moved = stud_set.add_shard()
+            self.assertEqual(3, stud_set.get_shard_count())
+            self.assertEqual(moved, stud_set.get_shard_sizes()[2])
+            self.assertTrue(0 < moved < len(keys) // 2, "only the keys of the new shard may move")
+            self.assertTrue(all(stud_set.get_shard_sizes()[shard] <= sizes[shard] for shard in sizes))
+            self.assertEqual(len(keys) + 1, stud_set.get_table_size())
+            self.assertTrue(all(stud_set.contains_many(keys)))
+            self.assertFalse(stud_set.contains(10 ** 9))
+            self.assertEqual([True, False], stud_set.remove_many([keys[1], keys[1]]))
+            self.assertEqual(set(keys[:1] + keys[2:] + [-1]), set(stud_set))
+            self.assertRaises(ValueError, stud_set.insert, None)
+
+    def test_worker_errors_are_raised(self):
+        with ShardedHashSet(shards=2) as stud_set:
+            self.assertRaises(TypeError, stud_set.insert_many, ["key", "other key"])
+            self.assertTrue(stud_set.insert(5), "the shards must still answer after an error")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import threading
+import unittest
+
+from hash_functions import GenericHash
+from hash_set_test_case import HashSetTestCase
+from snapshot_hash_set import SnapshotHashSet
+
+
+class TestSnapshotHashSet(HashSetTestCase):
+    def test_snapshots_are_isolated(self):
+        snapshots = []
+
+        def take_snapshot(step, stud_set, expected):
+            if step % 400 == 0:
+                snapshots.append((stud_set.snapshot(), set(expected)))
+
+        stud_set, expected = self.assert_matches_builtin(
+            lambda: SnapshotHashSet(capacity=4, max_load_factor=1.0, hash_function=GenericHash()), 300, 6000, seed=5,
+            after_step=take_snapshot)
+        self.assertEqual(expected, set(stud_set))
+        for snapshot, keys in snapshots:
+            self.assertEqual(keys, set(snapshot))
+            self.assertEqual(len(keys), snapshot.get_table_size())
+            self.assertTrue(all(snapshot.contains(key) for key in keys))
+        self.assertTrue(stud_set.resize_count > 0)
+
+    def test_copy_on_write(self):
+        stud_set = SnapshotHashSet(capacity=1)
+        for key in (1, 2, 3, 4):
+            stud_set.insert(key)
+        snapshot = stud_set.snapshot()
+        self.assertTrue(stud_set.insert(5))
+        self.assertEqual((1, 0), (stud_set.table_copy_count, stud_set.node_copy_count),
+                         "insert must only copy the table list, not the chain")
+        self.assertTrue(stud_set.remove(2))
+        self.assertEqual(2, stud_set.node_copy_count, "only the shared nodes in front of 2 are copied")
+        self.assertEqual({1, 3, 4, 5}, set(stud_set))
+        self.assertEqual({1, 2, 3, 4}, set(snapshot))
+        self.assertRaises(TypeError, snapshot.insert, 6)
+        self.assertRaises(TypeError, snapshot.remove, 1)
+
+    def test_reader_thread(self):
+        stud_set = SnapshotHashSet(capacity=8, max_load_factor=0.75)
+        for key in range(2000):
+            stud_set.insert(key)
+        snapshot = stud_set.snapshot()
+        results = []
+        reader = threading.Thread(target=lambda: results.extend(sorted(snapshot) for _ in range(20)))
+        reader.start()
+        for key in range(2000, 6000):
+            stud_set.insert(key)
+            stud_set.remove(key - 2000)
+        reader.join()
+        self.assertTrue(all(keys == list(range(2000)) for keys in results))
+        self.assertEqual(set(range(4000, 6000)), set(stud_set))
+
+    def test_default_constructor(self):
+        self.assert_starts_empty(SnapshotHashSet())
+        self.assert_starts_empty(SnapshotHashSet(max_load_factor=0.75))
+
+
+if __name__ == '__main__':
+    unittest.main()
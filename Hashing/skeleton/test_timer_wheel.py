@@ -0,0 +1,51 @@
+import random
+import unittest
+
+from timer_wheel import TimerWheel
+
+
+class TestTimerWheel(unittest.TestCase):
+    def test_overflow_and_cancel(self):
+        class Timer():
+            timer_slot = None
+
+        wheel = TimerWheel(tick=100, levels=2, slot_bits=2)
+        timers = {Timer(): tick for tick in (101, 103, 117, 150, 400)}
+        for timer, tick in timers.items():
+            wheel.schedule(timer, tick)
+        cancelled = next(timer for timer, tick in timers.items() if tick == 150)
+        wheel.cancel(cancelled)
+        fired = {}
+        for now in range(101, 500, 7):
+            for timer in wheel.advance(now):
+                fired[timer] = now
+        for timer, tick in timers.items():
+            if timer is cancelled:
+                self.assertNotIn(timer, fired)
+            else:
+                self.assertTrue(tick <= fired[timer] < tick + 7)
+        self.assertEqual(0, wheel.size)
+
+    def test_skips_idle_ticks(self):
+        class Timer():
+            timer_slot = None
+
+        # stepping tick by tick through these gaps would take minutes
+        wheel = TimerWheel()
+        rng = random.Random(4)
+        timers = {Timer(): rng.randrange(1, 10 ** 9) for _ in range(200)}
+        for timer, tick in timers.items():
+            wheel.schedule(timer, tick)
+        fired = {}
+        now = 0
+        while wheel.size:
+            now += rng.choice((1, 50, 5000, 10 ** 6, 10 ** 8))
+            for timer in wheel.advance(now):
+                fired[timer] = now
+            self.assertTrue(all(tick > now for timer, tick in timers.items() if timer not in fired))
+        for timer, tick in timers.items():
+            self.assertTrue(tick <= fired[timer], "a timer must not fire early")
+
+
+if __name__ == '__main__':
+    unittest.main()
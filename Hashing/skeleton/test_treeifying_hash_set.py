@@ -0,0 +1,109 @@
+import unittest
+
+from chaining_hash_set import ChainingHashSet
+from hash_functions import GenericHash
+from hash_set_test_case import HashSetTestCase
+from treeifying_hash_set import TreeifyingHashSet
+
+
+class TestTreeifyingHashSet(HashSetTestCase):
+    def test_long_chain_becomes_tree(self):
+        stud_set = TreeifyingHashSet(capacity=11, treeify_threshold=8, untreeify_threshold=6)
+        for i in range(8):
+            stud_set.insert(i * 11)
+        self.assertEqual(0, stud_set.get_tree_bucket_count())
+        stud_set.insert(8 * 11)
+        self.assertEqual(1, stud_set.get_tree_bucket_count(), "bucket with 9 keys must be a tree")
+        self.assertEqual(9, stud_set.get_table_size())
+        self.assertFalse(stud_set.insert(44))
+        self.assertTrue(stud_set.contains(44))
+        self.assertFalse(stud_set.contains(45))
+
+    def test_tree_shrinks_back_to_chain(self):
+        stud_set = TreeifyingHashSet(capacity=11, treeify_threshold=8, untreeify_threshold=6)
+        for i in range(9):
+            stud_set.insert(i * 11)
+        for i in range(3):
+            self.assertTrue(stud_set.remove(i * 11))
+        self.assertEqual(0, stud_set.get_tree_bucket_count())
+        self.assertEqual("0 {33, 44, 55, 66, 77, 88}", stud_set.to_string()[:26])
+
+    def test_tree_height_is_logarithmic(self):
+        stud_set = TreeifyingHashSet(capacity=1)
+        for key in range(1023):
+            stud_set.insert(key)
+        tree = stud_set.hash_table[0]
+        self.assertTrue(tree.root.height <= 14, "AVL height " + str(tree.root.height) + " for 1023 keys")
+        self.assertEqual(list(range(1023)), tree.keys())
+
+    def test_mixed_key_types(self):
+        stud_set = TreeifyingHashSet(1, hash_function=GenericHash())
+        keys = list(range(5)) + list("abcde") + [-1, -2, (1, "x")]
+        for key in keys:
+            self.assertTrue(stud_set.insert(key))
+        self.assertEqual(1, stud_set.get_tree_bucket_count())
+        self.assertFalse(stud_set.insert(1.0), "1.0 == 1 is already stored")
+        self.assertTrue(stud_set.contains("c"))
+        self.assertTrue(stud_set.contains(-2), "hash(-1) == hash(-2), both keys must be kept")
+        self.assertTrue(stud_set.remove(-1))
+        self.assertTrue(stud_set.contains(-2))
+        self.assertFalse(stud_set.contains(-1))
+        for key in keys[:8]:
+            self.assertTrue(stud_set.remove(key))
+        self.assertEqual(0, stud_set.get_tree_bucket_count())
+        self.assertEqual({"d", "e", -2, (1, "x")}, set(stud_set.iter_keys()))
+
+    def test_random_operations_with_resize(self):
+        def factory():
+            return TreeifyingHashSet(capacity=2, max_load_factor=4.0, treeify_threshold=4, untreeify_threshold=2)
+
+        self.assert_matches_builtin(factory, lambda rng: rng.randrange(400) * 16, 4000, seed=5)
+
+    def test_default_constructor(self):
+        self.assert_starts_empty(TreeifyingHashSet())
+        self.assert_starts_empty(TreeifyingHashSet(max_load_factor=0.75))
+
+    def test_colliding_hashes_stay_logarithmic(self):
+        stud_set = TreeifyingHashSet(capacity=1, hash_function=GenericHash())
+        keys = [i * (2 ** 61 - 1) for i in range(1023)]  # hash() of all of them is 0
+        for key in keys:
+            self.assertTrue(stud_set.insert(key))
+        tree = stud_set.hash_table[0]
+        self.assertTrue(tree.root.height <= 14, "AVL height " + str(tree.root.height) + " for 1023 colliding keys")
+        self.assertEqual([], tree.unordered)
+        for key in keys[::2]:
+            self.assertTrue(stud_set.remove(key))
+        self.assertTrue(all(stud_set.contains(key) for key in keys[1::2]))
+        self.assertFalse(any(stud_set.contains(key) for key in keys[::2]))
+
+    def test_incomparable_colliding_keys(self):
+        class Collider():
+            def __hash__(self):
+                return 7
+
+        keys = [Collider() for _ in range(8)] + [7 + i * (2 ** 61 - 1) for i in range(8)] + ["a", "b", (1, "x")]
+
+        def factory():
+            return TreeifyingHashSet(capacity=1, treeify_threshold=4, untreeify_threshold=2,
+                                     hash_function=GenericHash())
+
+        self.assert_matches_builtin(factory, lambda rng: rng.choice(keys), 3000, seed=3)
+
+    def test_set_algebra_keeps_class(self):
+        stud_set = TreeifyingHashSet(capacity=4, treeify_threshold=4, untreeify_threshold=2)
+        chaining = ChainingHashSet(capacity=4)
+        for key in range(0, 80, 4):
+            stud_set.insert(key)
+        for key in range(0, 200, 8):
+            chaining.insert(key)
+        for result, keys in ((stud_set.union(chaining), set(range(0, 80, 4)) | set(range(0, 200, 8))),
+                             (stud_set.intersection(chaining), set(range(0, 80, 8))),
+                             (stud_set.difference(chaining), set(range(4, 80, 8))),
+                             (stud_set.copy(), set(range(0, 80, 4)))):
+            self.assertIsInstance(result, TreeifyingHashSet)
+            self.assertEqual(keys, set(result))
+            self.assertTrue(result.get_tree_bucket_count() > 0, "long chains of the result must be trees")
+
+
+if __name__ == '__main__':
+    unittest.main()
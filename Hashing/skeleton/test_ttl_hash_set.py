@@ -0,0 +1,77 @@
+import random
+import unittest
+
+from hash_set_test_case import HashSetTestCase
+from ttl_hash_set import TTLHashSet
+
+
+class FakeClock():
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLHashSet(HashSetTestCase):
+    def test_keys_expire(self):
+        clock = FakeClock()
+        stud_set = TTLHashSet(8, 0.75, ttl=10.0, resolution=1.0, clock=clock)
+        self.assertTrue(stud_set.insert(1))
+        self.assertTrue(stud_set.insert(2, ttl=30.0))
+        clock.now += 9.5
+        self.assertFalse(stud_set.insert(1), "inserting a stored key must not refresh it")
+        self.assertTrue(stud_set.contains(1))
+        clock.now += 0.5
+        self.assertFalse(stud_set.contains(1), "an expired key must not be found, even within the current tick")
+        self.assertEqual([2], list(stud_set))
+        self.assertTrue(stud_set.refresh(2, ttl=30.0))
+        clock.now += 25.0
+        self.assertTrue(stud_set.contains(2))
+        self.assertEqual(1, stud_set.get_table_size())
+        self.assertEqual(1, stud_set.expired_count)
+        clock.now += 1000.0
+        self.assertEqual(0, stud_set.get_table_size())
+        self.assertTrue(stud_set.insert(1))
+        self.assertRaises(ValueError, stud_set.insert, None)
+
+    def test_against_expiry_dict(self):
+        clock = FakeClock()
+        stud_set = TTLHashSet(16, 0.75, ttl=5.0, resolution=0.25, clock=clock)
+        expiry = {}
+        rng = random.Random(2)
+        for step in range(5000):
+            clock.now += rng.random() * (30 if rng.random() < 0.01 else 0.05)
+            key = rng.randrange(300)
+            live = {stored for stored, expires_at in expiry.items() if expires_at > clock.now}
+            operation = rng.randrange(3)
+            if operation == 0:
+                self.assertEqual(key not in live, stud_set.insert(key))
+                if key not in live:
+                    expiry[key] = clock.now + 5.0
+            elif operation == 1:
+                self.assertEqual(key in live, stud_set.contains(key))
+            else:
+                self.assertEqual(key in live, stud_set.remove(key))
+                expiry.pop(key, None)
+        live = {stored for stored, expires_at in expiry.items() if expires_at > clock.now}
+        self.assertEqual(live, set(stud_set))
+        self.assertEqual(stud_set.table_size, stud_set.wheel.size, "every stored key has exactly one timer")
+
+    def test_long_idle_gap(self):
+        # 2 idle minutes are 120000 ticks, the wheel must not step through them one by one
+        clock = FakeClock()
+        stud_set = TTLHashSet(8, 0.75, ttl=3600.0, resolution=0.001, clock=clock)
+        stud_set.insert(1)
+        clock.now += 120.0
+        self.assertTrue(stud_set.contains(1))
+        clock.now += 3600.0
+        self.assertFalse(stud_set.contains(1))
+        self.assertEqual(1, stud_set.expired_count)
+
+    def test_default_constructor(self):
+        self.assert_starts_empty(TTLHashSet(clock=FakeClock()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+class TimerWheel():
+    """Hierarchical timer wheel over integer ticks.
+
+    Level k has 2^slot_bits slots, each covering 2^(slot_bits * k) ticks. A timer is placed on the lowest level whose
+    range still contains its expiry tick; when the ticks of a higher-level slot begin, its timers are cascaded down
+    one level. Scheduling and cancelling are O(1), and every timer is moved at most once per level before it fires,
+    so advancing is amortized O(1) per timer. Ticks without work are skipped: advance jumps straight to the next
+    occupied slot or cascade boundary, so a long idle gap costs O(levels * 2^slot_bits) instead of O(ticks). Timers
+    beyond the top level wait in an overflow set that is re-sorted once per full turn of the top level.
+
+    Items are arbitrary (hashable) objects; the wheel stores its bookkeeping in their expire_tick and timer_slot
+    attributes.
+    """
+
+    def __init__(self, tick=0, levels=4, slot_bits=6):
+        self.current_tick = tick
+        self.levels = levels
+        self.slot_bits = slot_bits
+        self.slot_mask = (1 << slot_bits) - 1
+        self.wheels = [[set() for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self.overflow = set()
+        self.size = 0
+
+    def schedule(self, item, expire_tick):
+        """Adds a timer for an item. A tick that has already passed fires on the next tick."""
+        item.expire_tick = max(expire_tick, self.current_tick + 1)
+        self.place(item)
+        self.size += 1
+
+    def cancel(self, item):
+        """Removes the timer of an item (if it has one)."""
+        if item.timer_slot is not None:
+            item.timer_slot.discard(item)
+            item.timer_slot = None
+            self.size -= 1
+
+    def place(self, item):
+        tick = item.expire_tick
+        slot = self.overflow
+        for level in range(self.levels):
+            shift = self.slot_bits * (level + 1)
+            if tick >> shift == self.current_tick >> shift:
+                slot = self.wheels[level][(tick >> (self.slot_bits * level)) & self.slot_mask]
+                break
+        slot.add(item)
+        item.timer_slot = slot
+
+    def cascade(self, slot):
+        items = list(slot)
+        slot.clear()
+        for item in items:
+            self.place(item)
+
+    def next_event_tick(self, limit):
+        """returns the next tick up to limit at which a timer fires or a slot is cascaded, or None if there is none.
+        Timers on level k lie in a later slot of the current level-k range, so the lowest level with an occupied
+        slot after the current one determines the tick. Slots beyond limit are not looked at, so a short advance
+        only checks a few slots."""
+        current = self.current_tick
+        for level in range(self.levels):
+            shift = self.slot_bits * level
+            base = current >> (shift + self.slot_bits) << (shift + self.slot_bits)
+            wheel = self.wheels[level]
+            for index in range(((current >> shift) & self.slot_mask) + 1, 1 << self.slot_bits):
+                next_tick = base | (index << shift)
+                if next_tick > limit:
+                    return None
+                if wheel[index]:
+                    return next_tick
+        top_shift = self.slot_bits * self.levels
+        next_tick = ((current >> top_shift) + 1) << top_shift
+        if self.overflow and next_tick <= limit:
+            return next_tick
+        return None
+
+    def advance(self, tick):
+        """Moves the wheel forward to the given tick and returns the items whose timers fired."""
+        due = []
+        while self.current_tick < tick:
+            next_tick = self.next_event_tick(tick) if self.size else None
+            if next_tick is None:
+                self.current_tick = tick
+                break
+            self.current_tick = current = next_tick
+            if current & ((1 << (self.slot_bits * self.levels)) - 1) == 0:
+                self.cascade(self.overflow)
+            for level in range(self.levels - 1, 0, -1):
+                shift = self.slot_bits * level
+                if current & ((1 << shift) - 1) == 0:
+                    self.cascade(self.wheels[level][(current >> shift) & self.slot_mask])
+            slot = self.wheels[0][current & self.slot_mask]
+            if slot:
+                for item in slot:
+                    item.timer_slot = None
+                due.extend(slot)
+                self.size -= len(slot)
+                slot.clear()
+        return due
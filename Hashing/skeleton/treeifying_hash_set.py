@@ -0,0 +1,125 @@
+from avl_bucket import AVLBucket
+from chaining_hash_set import ChainingHashSet
+
+
+class TreeifyingHashSet(ChainingHashSet):
+    """ChainingHashSet that converts a bucket chain into an AVL tree once it grows longer than treeify_threshold
+    and back into a chain once it shrinks to untreeify_threshold keys, so a single bucket costs at most O(log n)
+    even for adversarial keys. The trees are ordered by (hash(key), key), so keys of different types can share a
+    bucket; colliding keys that cannot be compared with each other are the one case that stays linear (see
+    AVLBucket)."""
+
+    def __init__(self, capacity=0, max_load_factor=None, hash_function=None, treeify_threshold=8,
+                 untreeify_threshold=6):
+        super().__init__(capacity, max_load_factor, hash_function)
+        self.treeify_threshold = treeify_threshold
+        self.untreeify_threshold = untreeify_threshold
+
+    def get_tree_bucket_count(self):
+        """returns the number of buckets that are currently stored as trees."""
+        return sum(1 for bucket in self.hash_table if isinstance(bucket, AVLBucket))
+
+    def treeify_long_chains(self):
+        """Converts every chain longer than treeify_threshold into a tree."""
+        for i in range(self.capacity):
+            node = self.hash_table[i]
+            if node is None or isinstance(node, AVLBucket):
+                continue
+            length = 0
+            while node is not None:
+                length += 1
+                node = node.next
+            if length > self.treeify_threshold:
+                self.hash_table[i] = AVLBucket.from_chain(self.hash_table[i])
+
+    def get_hash_table(self):
+        """(Required for testing only)
+        :return the hash table, with tree buckets presented as chains (in the order of AVLBucket.keys()).
+        """
+        return [bucket.to_chain() if isinstance(bucket, AVLBucket) else bucket for bucket in self.hash_table]
+
+    def set_hash_table(self, table):
+        """(Required for testing only) Set a given hash table, long chains are converted into trees.
+        :param table: Given hash table which shall be used.
+        """
+        super().set_hash_table(table)
+        self.treeify_long_chains()
+
+    def insert(self, key):
+        if key is None:
+            raise ValueError()
+        hash = self.bucket_index(key, True)
+        bucket = self.hash_table[hash]
+        if isinstance(bucket, AVLBucket):
+            if not bucket.insert(key):
+                return False
+        elif bucket is None:
+            self.hash_table[hash] = self.create_node(key)
+        else:
+            length = 1
+            while True:
+                if bucket.key == key:
+                    return False
+                if bucket.next is None:
+                    bucket.next = self.create_node(key)
+                    break
+                bucket = bucket.next
+                length += 1
+            if length + 1 > self.treeify_threshold:
+                self.hash_table[hash] = AVLBucket.from_chain(self.hash_table[hash])
+        self.table_size += 1
+        self.grow_if_needed()
+        return True
+
+    def contains(self, key):
+        if key is None:
+            raise ValueError()
+        hash = self.bucket_index(key)
+        if hash is None:
+            return self.record_lookup(key, False)
+        bucket = self.hash_table[hash]
+        if isinstance(bucket, AVLBucket):
+            return self.record_lookup(key, bucket.contains(key))
+        while bucket is not None:
+            if bucket.key == key:
+                return self.record_lookup(key, True)
+            bucket = bucket.next
+        return self.record_lookup(key, False)
+
+    def count_probes(self, key):
+        hash = self.bucket_index(key)
+        if hash is not None and isinstance(self.hash_table[hash], AVLBucket):
+            return self.hash_table[hash].count_probes(key)
+        return super().count_probes(key)
+
+    def remove(self, key):
+        if key is None:
+            raise ValueError()
+        hash = self.bucket_index(key)
+        if hash is None:
+            return False
+        bucket = self.hash_table[hash]
+        if not isinstance(bucket, AVLBucket):
+            return super().remove(key)
+        if not bucket.remove(key):
+            return False
+        if bucket.size <= self.untreeify_threshold:
+            self.hash_table[hash] = bucket.to_chain()
+        self.table_size -= 1
+        return True
+
+    def empty_copy(self):
+        """returns an empty TreeifyingHashSet with the same capacity, load factor limit, hash function and
+        thresholds."""
+        return TreeifyingHashSet(self.capacity, self.max_load_factor, self.hash_function, self.treeify_threshold,
+                                 self.untreeify_threshold)
+
+    def merge_buckets(self, other, combine):
+        result = super().merge_buckets(other, combine)
+        result.treeify_long_chains()
+        return result
+
+    def rehash(self, new_capacity):
+        self.hash_table = self.get_hash_table()
+        super().rehash(new_capacity)
+        self.treeify_long_chains()
@@ -0,0 +1,176 @@
+import math
+import time
+
+from chaining_hash_node import ChainingHashNode
+from chaining_hash_set import ChainingHashSet
+from timer_wheel import TimerWheel
+
+
+class TTLHashNode(ChainingHashNode):
+    def __init__(self, key=None, hash_value=None):
+        super().__init__(key, hash_value)
+        self.expires_at = math.inf
+        self.expire_tick = None
+        self.timer_slot = None
+
+
+class TTLHashSet(ChainingHashSet):
+    """ChainingHashSet whose keys expire ttl seconds after they were inserted.
+
+    Every key has a timer in a hierarchical TimerWheel with ticks of `resolution` seconds. Each operation first
+    advances the wheel to the current time and removes the keys whose timers fired, so expired keys are reclaimed
+    at amortized O(1) cost instead of by sweeping the whole table. contains, remove and iteration additionally
+    compare the exact expiry time, so they never see an expired key, even within the current tick.
+    """
+
+    def __init__(self, capacity=0, max_load_factor=None, hash_function=None, ttl=60.0, resolution=1.0,
+                 clock=time.monotonic):
+        if ttl <= 0 or resolution <= 0:
+            raise ValueError("ttl and resolution must be positive")
+        super().__init__(capacity, max_load_factor, hash_function)
+        self.ttl = ttl
+        self.resolution = resolution
+        self.clock = clock
+        self.wheel = TimerWheel(self.to_tick(clock()))
+        self.expired_count = 0
+
+    def to_tick(self, seconds):
+        return math.floor(seconds / self.resolution)
+
+    def create_node(self, key):
+        if self.hash_function is not None and self.hash_function.cache_hash:
+            return TTLHashNode(key, self.hash_function.prehash(key))
+        return TTLHashNode(key)
+
+    def set_hash_table(self, table):
+        """(Required for testing only) Sets a given hash table, all of its keys get the default ttl."""
+        super().set_hash_table(table)
+        self.wheel = TimerWheel(self.to_tick(self.clock()))
+        now = self.clock()
+        for node in table:
+            while node is not None:
+                node.timer_slot = None
+                self.start_timer(node, now + self.ttl)
+                node = node.next
+
+    def start_timer(self, node, expires_at):
+        node.expires_at = expires_at
+        self.wheel.schedule(node, math.ceil(expires_at / self.resolution))
+
+    def expire(self):
+        """Advances the timer wheel to the current time and removes the keys whose timers fired.
+        :return: The current time of the clock.
+        """
+        now = self.clock()
+        for node in self.wheel.advance(self.to_tick(now)):
+            if node.expires_at <= now:
+                self.unlink_node(node)
+                self.expired_count += 1
+            else:
+                self.start_timer(node, node.expires_at)
+        return now
+
+    def unlink_node(self, node):
+        """Removes a stored node from its chain."""
+        hash = self.get_node_hash_code(node)
+        if self.hash_table[hash] is node:
+            self.hash_table[hash] = node.next
+        else:
+            previous = self.hash_table[hash]
+            while previous.next is not node:
+                previous = previous.next
+            previous.next = node.next
+        self.table_size -= 1
+
+    def find_node(self, key):
+        hash = self.bucket_index(key)
+        if hash is None:
+            return None
+        node = self.hash_table[hash]
+        while node is not None and node.key != key:
+            node = node.next
+        return node
+
+    def get_table_size(self):
+        """returns the number of stored keys, keys that expired within the current tick may still be counted."""
+        self.expire()
+        return self.table_size
+
+    def insert(self, key, ttl=None):
+        """Inserts a key that expires after ttl seconds (default: the ttl of the set) and returns True if it was
+        not stored yet. The expiry of a stored key is not changed, see refresh.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        now = self.expire()
+        node = self.find_node(key)
+        if node is not None:
+            if node.expires_at > now:
+                return False
+            self.wheel.cancel(node)
+            self.unlink_node(node)
+            self.expired_count += 1
+        hash = self.bucket_index(key, True)
+        node = self.create_node(key)
+        node.next = self.hash_table[hash]
+        self.hash_table[hash] = node
+        self.start_timer(node, now + (self.ttl if ttl is None else ttl))
+        self.table_size += 1
+        self.grow_if_needed()
+        return True
+
+    def refresh(self, key, ttl=None):
+        """Restarts the expiry of a stored key and returns True, or False if the key is not stored."""
+        if key is None:
+            raise ValueError()
+        now = self.expire()
+        node = self.find_node(key)
+        if node is None or node.expires_at <= now:
+            return False
+        self.wheel.cancel(node)
+        self.start_timer(node, now + (self.ttl if ttl is None else ttl))
+        return True
+
+    def contains(self, key):
+        """Searches for a given key that has not expired yet.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        now = self.expire()
+        node = self.find_node(key)
+        return self.record_lookup(key, node is not None and node.expires_at > now)
+
+    def remove(self, key):
+        """Removes the key and returns True on success, False if it is not stored or has expired.
+        :raises:
+        		a ValueError if the key is None.
+        """
+        if key is None:
+            raise ValueError()
+        now = self.expire()
+        node = self.find_node(key)
+        if node is None:
+            return False
+        self.wheel.cancel(node)
+        self.unlink_node(node)
+        if node.expires_at <= now:
+            self.expired_count += 1
+            return False
+        return True
+
+    def clear(self):
+        super().clear()
+        self.wheel = TimerWheel(self.to_tick(self.clock()))
+
+    def iter_keys(self):
+        """Yields all stored keys that have not expired yet."""
+        now = self.expire()
+        for node in self.hash_table:
+            while node is not None:
+                if node.expires_at > now:
+                    yield node.key
+                node = node.next